@@ -0,0 +1,10 @@
+import pygame
+
+import config
+from core.assetManifest import asset_manifest
+from core.assetPack import AssetPack
+
+if __name__ == '__main__':
+    pygame.init()
+    count = AssetPack.bake(asset_manifest(), config.ASSET_PACK_PATH)
+    print(f"Zapisano {count} obrazów do {config.ASSET_PACK_PATH}")
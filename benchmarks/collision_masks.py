@@ -0,0 +1,116 @@
+"""Benchmark kolizji: same prostokąty kontra maski pikselowe po teście prostokątów.
+
+Scena to pełna klatka: sterowanie i ruch przeciwników, pociski, kolizje i rysowanie.
+Koszt trybu dokładnego to przyrost czasu kolizji względem klatki w trybie prostokątów,
+porównywany z budżetem PRECISE_BUDGET; każdy tryb mierzony jest REPEATS razy
+na przemian, liczy się najszybszy przebieg.
+Uruchom z katalogu głównego: python -m benchmarks.collision_masks [liczba_pocisków]
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+import config
+from core.assetCache import collide_masks
+from core.aiScheduler import AIScheduler
+from core.systems import EnemySystem
+from entities.enemy import EnemyGroup
+from entities.factory import MainFactory
+from entities.projectile import OWNER_ENEMY, OWNER_PLAYER, ProjectileEngine
+
+FRAMES = 120
+REPEATS = 3
+# dopuszczalny narzut trybu dokładnego, jako ułamek klatki w trybie prostokątów
+PRECISE_BUDGET = 0.05
+ENEMIES = 200
+ENEMY_TYPES = ['ghost', 'butcher', 'politician', 'bat', 'skeleton', 'black_magic', 'mage']
+
+
+class Target(pygame.sprite.Sprite):
+    def __init__(self, image: pygame.Surface) -> None:
+        super().__init__()
+        self.image = image
+        self.rect = image.get_rect(center=(0, 0))
+
+
+def build_scene(engine: ProjectileEngine):
+    rng = random.Random(1)
+    factory = MainFactory()
+    enemies = EnemyGroup()
+    player = Target(pygame.Surface((80, 80)))
+    for _ in range(ENEMIES):
+        pos = (rng.randint(-1000, 1000), rng.randint(-1000, 1000))
+        getattr(factory, f"create_{rng.choice(ENEMY_TYPES)}")(
+            pos, [enemies], player, engine, []
+        )
+    player.image = enemies.sprites()[0].image
+    return enemies, player
+
+
+def frame_time(precise: bool, count: int, screen: pygame.Surface) -> tuple:
+    """Średni czas klatki i samego etapu kolizji (ms) w danym trybie"""
+    config.PRECISE_COLLISION = precise
+    engine = ProjectileEngine()
+    enemies, player = build_scene(engine)
+    system = EnemySystem(enemies, player, None, None, AIScheduler())
+    rng = random.Random(2)
+    offset = pygame.math.Vector2(-config.SCREEN_WIDTH // 2, -config.SCREEN_HEIGHT // 2)
+    collision_time = 0.0
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        while len(engine) < count:
+            pos = (rng.uniform(-1000, 1000), rng.uniform(-1000, 1000))
+            direction = pygame.math.Vector2(1, 0).rotate(rng.uniform(0, 360))
+            engine.spawn(pos, direction, rng.choice(['player', 'enemy_0']))
+
+        system.update()
+        engine.update()
+
+        collision_start = time.perf_counter()
+        engine.collide(enemies.sprites(), OWNER_PLAYER)
+        engine.collide([player], OWNER_ENEMY, attr='rect', use_hitbox=False)
+        body_hits = enemies.query_rect(player.rect)
+        if precise:
+            body_hits = [enemy for enemy in body_hits if collide_masks(player, enemy)]
+        collision_time += time.perf_counter() - collision_start
+
+        screen.fill('black')
+        for enemy in enemies:
+            screen.blit(enemy.image, enemy.rect.topleft - offset)
+        engine.draw(screen, offset)
+
+    elapsed = time.perf_counter() - start
+    return elapsed * 1000 / FRAMES, collision_time * 1000 / FRAMES
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pygame.init()
+    screen = pygame.display.set_mode(config.SCREEN_SIZE)
+
+    runs = {False: [], True: []}
+    for _ in range(REPEATS):
+        for precise in runs:
+            runs[precise].append(frame_time(precise, count, screen))
+    rects, rect_collisions = min(runs[False])
+    masks, mask_collisions = min(runs[True])
+    overhead = (mask_collisions - rect_collisions) / rects
+    verdict = 'within' if overhead <= PRECISE_BUDGET else 'OVER'
+    print(f"{count} bullets, {ENEMIES} enemies, best of {REPEATS}")
+    print(f"rects only: {rects:8.2f} ms/frame ({rect_collisions:.2f} ms collisions)")
+    print(f"with masks: {masks:8.2f} ms/frame ({mask_collisions:.2f} ms collisions)")
+    print(
+        f"precise mode overhead: {overhead:+.1%} of the frame, "
+        f"{verdict} the {PRECISE_BUDGET:.0%} budget"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark hordy przeciwników: systemy hurtowe na magazynie komponentów.
+
+Gęstość hordy jest stała, więc przy liniowym skalowaniu liczba aktualizacji
+przeciwników na sekundę nie spada wraz z jej liczebnością.
+Uruchom z katalogu głównego: python -m benchmarks.enemy_horde [liczba_przeciwników ...]
+"""
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+
+import config
+from core.aiScheduler import AIScheduler
+from core.flowField import FlowField
+from core.mapManager import MapManager
+from core.systems import EnemySystem
+from entities.enemy import EnemyGroup
+from entities.factory import MainFactory
+from entities.projectile import ProjectileEngine
+
+FRAMES = 30
+COUNTS = [1000, 2500, 5000, 10000]
+# 1000 przeciwników na kwadracie 2400 x 2400 px
+DENSITY = 1000 / 2400 ** 2
+ENEMY_TYPES = ['ghost', 'butcher', 'politician', 'bat', 'skeleton', 'black_magic', 'mage']
+
+
+class FullRateScheduler(AIScheduler):
+    """Harmonogram bez poziomów szczegółowości: każdy przeciwnik co tick"""
+    def intervals(self, distance: np.ndarray) -> np.ndarray:
+        return np.ones(len(distance), dtype=np.int64)
+
+
+class Target(pygame.sprite.Sprite):
+    def __init__(self) -> None:
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, 80, 80)
+        self.hitbox = self.rect.inflate(-20, -26)
+
+
+def build_scene(count: int):
+    rng = random.Random(1)
+    player = Target()
+    all_sprites = pygame.sprite.Group()
+    projectiles = ProjectileEngine()
+    obstacles = pygame.sprite.Group()
+    map_manager = MapManager(all_sprites, obstacles, lambda pos: None)
+    map_manager.update(player.rect.center)
+
+    enemies = EnemyGroup()
+    half = math.sqrt(count / DENSITY) / 2
+    factory = MainFactory()
+    for _ in range(count):
+        pos = (rng.uniform(-half, half), rng.uniform(-half, half))
+        enemy_type = rng.choice(ENEMY_TYPES)
+        enemy = getattr(factory, f"create_{enemy_type}")(
+            pos, [all_sprites, enemies], player, projectiles, obstacles
+        )
+        enemy.wall_grid = map_manager
+    return player, enemies, projectiles, map_manager
+
+
+def frame_time(count: int, scheduler: AIScheduler) -> tuple:
+    """Średni czas klatki (ms) i liczba aktualizacji przeciwników na sekundę"""
+    player, enemies, projectiles, map_manager = build_scene(count)
+    flow_field = FlowField()
+    system = EnemySystem(enemies, player, map_manager, flow_field, scheduler)
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        flow_field.update(map_manager, player.rect.center)
+        system.update()
+        projectiles.clear()
+        map_manager.frame_counter += 1
+    elapsed = time.perf_counter() - start
+
+    updates = scheduler.near_updates + scheduler.far_updates
+    return elapsed * 1000 / FRAMES, updates / elapsed
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or COUNTS
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    # horda o stałej gęstości wychodzi poza zasięg usuwania odległych przeciwników
+    config.ENEMY_DESPAWN_DISTANCE = math.inf
+
+    for count in counts:
+        full_ms, full_rate = frame_time(count, FullRateScheduler(budget=count))
+        lod_ms, lod_rate = frame_time(count, AIScheduler())
+        print(
+            f"{count:6d} enemies, every tick: {full_ms:8.2f} ms/frame, "
+            f"{full_rate / 1000:7.0f}k updates/s; "
+            f"AI LOD: {lod_ms:8.2f} ms/frame"
+        )
+
+
+if __name__ == '__main__':
+    main()
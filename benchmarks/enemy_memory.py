@@ -0,0 +1,99 @@
+"""Benchmark pamięci przeciwników: bajty na żywego przeciwnika przy danych rodzaju
+kopiowanych do każdego egzemplarza (jak przed rejestrem EnemyType) i przy
+wspólnym EnemyType z egzemplarzem w slotach.
+
+Liczone przez tracemalloc razem z wpisami w grupach, siatce przestrzennej
+i magazynie komponentów.
+Uruchom z katalogu głównego: python -m benchmarks.enemy_memory [liczba_przeciwników ...]
+"""
+import gc
+import os
+import random
+import sys
+import tracemalloc
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from entities.enemy import Enemy, EnemyGroup, enemy_types
+
+COUNTS = [1000, 10000]
+
+
+class PerInstanceEnemy(Enemy):
+    """Przeciwnik w starym układzie: __dict__ z własną kopią danych rodzaju"""
+    def __init__(self, enemy_type, pos, groups, player, bullet_group) -> None:
+        super().__init__(enemy_type, pos, [], player, bullet_group)
+        self.enemy_name = enemy_type.name
+        self.max_health = enemy_type.hp
+        self.speed = enemy_type.speed
+        self.size = enemy_type.size
+        self.xp_reward = enemy_type.xp_reward
+        self.shoot_type = 'enemy' if enemy_type.shoots else None
+        self.stop_distance = enemy_type.stop_distance
+        self.cooldown = enemy_type.cooldown
+        self.animation_speed = enemy_type.animation_speed
+        self.hit_duration = enemy_type.hit_duration
+        self.bar_max_width = enemy_type.bar_max_width
+        self.bar_height = enemy_type.bar_height
+        self.sprite_groups = groups
+        self.obstacle_sprites = None
+        self.frames = list(enemy_type.frames)
+        self.variants = [
+            [list(variant) for variant in frame] for frame in enemy_type.variants
+        ]
+        self.add(groups)
+
+
+def bytes_per_enemy(count: int, enemy_class: type) -> float:
+    """Przyrost pamięci po utworzeniu count przeciwników, na jednego"""
+    rng = random.Random(1)
+    names = enemy_types.names()
+    all_sprites = pygame.sprite.Group()
+    enemies = EnemyGroup()
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    alive = [
+        enemy_class(
+            enemy_types.get(rng.choice(names)),
+            (rng.uniform(0, 3000), rng.uniform(0, 3000)),
+            [all_sprites, enemies],
+            None,
+            None,
+        )
+        for _ in range(count)
+    ]
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del alive
+    return used / count
+
+
+def main() -> None:
+    counts = [int(arg) for arg in sys.argv[1:]] or COUNTS
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    # grafiki rodzajów wczytane przed pomiarem, są wspólne dla obu wariantów
+    for name in enemy_types.names():
+        enemy_types.get(name)
+    # egzemplarz trzyma stan wyłącznie w slotach
+    probe = Enemy(enemy_types.get('ghost'), (0, 0), [], None, None)
+    assert not hasattr(probe, '__dict__')
+
+    for count in counts:
+        before = bytes_per_enemy(count, PerInstanceEnemy)
+        after = bytes_per_enemy(count, Enemy)
+        print(
+            f"{count:6d} enemies: per-instance data {before:7.0f} B/enemy, "
+            f"EnemyType + slots {after:7.0f} B/enemy "
+            f"({1 - after / before:.0%} less)"
+        )
+
+
+if __name__ == '__main__':
+    main()
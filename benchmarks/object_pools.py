@@ -0,0 +1,85 @@
+"""Benchmark pul obiektów: spawn i zabicie przeciwnika z efektem śmierci,
+z konstruowaniem nowych sprite'ów kontra ponowne użycie z pul.
+
+Oba warianty mierzone są REPEATS razy na przemian; wynik to mediana,
+a obok zakres przyspieszenia z poszczególnych powtórzeń.
+
+Uruchom z katalogu głównego: python -m benchmarks.object_pools [liczba_cykli]
+"""
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from entities.enemy import EnemyGroup
+from entities.factory import MainFactory
+from entities.particle import DeathEffect, EffectGroup, death_effects
+
+CYCLES = 5000
+REPEATS = 5
+ENEMY_TYPES = ['ghost', 'butcher', 'politician', 'bat', 'skeleton', 'black_magic', 'mage']
+
+
+def churn(cycles: int, pooled: bool) -> float:
+    """Czas (µs) jednego cyklu spawnu i zabicia"""
+    rng = random.Random(1)
+    factory = MainFactory()
+    all_sprites = pygame.sprite.Group()
+    enemies = EnemyGroup()
+    effects = EffectGroup()
+
+    start = time.perf_counter()
+    for _ in range(cycles):
+        name = rng.choice(ENEMY_TYPES)
+        pos = (rng.uniform(0, 2000), rng.uniform(0, 2000))
+        if pooled:
+            enemy = getattr(factory, f"create_{name}")(
+                pos, [all_sprites, enemies], None, None, None
+            )
+            effect = death_effects.acquire()
+            effect.spawn(enemy.rect.center, [all_sprites, effects])
+        else:
+            enemy = MainFactory.build(name)
+            enemy.spawn(pos, [all_sprites, enemies], None, None)
+            effect = DeathEffect(enemy.rect.center, [all_sprites, effects])
+        enemy.kill()
+        effect.kill()
+    elapsed = time.perf_counter() - start
+    return elapsed * 1e6 / cycles
+
+
+def main() -> None:
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else CYCLES
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    fresh, pooled = [], []
+    for _ in range(REPEATS):
+        fresh.append(churn(cycles, pooled=False))
+        pooled.append(churn(cycles, pooled=True))
+    fresh_us = statistics.median(fresh)
+    pooled_us = statistics.median(pooled)
+    speedups = [f / p for f, p in zip(fresh, pooled)]
+    print(
+        f"{platform.machine()}, {os.cpu_count()} CPU cores, "
+        f"Python {platform.python_version()}, pygame {pygame.version.ver}, "
+        f"video driver {pygame.display.get_driver()}, "
+        f"{cycles} cycles x {REPEATS} repeats (median)"
+    )
+    print(f"new sprites: {fresh_us:8.1f} µs/cycle")
+    print(
+        f"pooled:      {pooled_us:8.1f} µs/cycle ({fresh_us / pooled_us:.1f}x, "
+        f"{min(speedups):.1f}x-{max(speedups):.1f}x per repeat)"
+    )
+    print(f"pool counters: {death_effects.stats()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""Benchmark potoku klatek: symulacja i rysowanie kolejno kontra symulacja kolejnej
+klatki w wątku roboczym podczas rysowania bieżącej (FramePipeline).
+
+Każda klatka to jeden tick symulacji, rysowanie i display.flip, bez limitu FPS.
+Przebieg kolejny mierzy też osobno symulację i rysowanie: potok może skrócić
+klatkę najwyżej do dłuższej z nich i tylko na maszynie z więcej niż jednym rdzeniem.
+Bez pliku assets/floor_flat.png (nie ma go w repozytorium) podłoga jest
+jednolitym kafelkiem tego samego rozmiaru co kafelek mapy.
+Uruchom z katalogu głównego: python -m benchmarks.pipelined_frames [liczba_klatek]
+"""
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+import pygame
+
+import config
+from core.assetCache import asset_cache
+from core.game import Game
+from core.inputSource import ScriptedInput
+from core.saveManager import SaveManager
+from core.simClock import sim_clock
+from headless import wait_for, wander_script
+
+FRAMES = 1200
+WARMUP = 120
+FLOOR_PATH = os.path.join('assets', 'floor_flat.png')
+
+
+def stub_floor() -> None:
+    """Podstaw kafelek podłogi, jeśli brakuje pliku; wymaga otwartego okna"""
+    if os.path.exists(FLOOR_PATH):
+        return
+    tile = pygame.Surface((config.TILE_SIZE, config.TILE_SIZE))
+    tile.fill((40, 36, 48))
+    asset_cache.add_decoded(FLOOR_PATH, None, False, tile)
+
+
+def frame_rate(frames: int, pipelined: bool) -> tuple:
+    """Klatki na sekundę, średnia liczba przeciwników i czasy (ms na klatkę)
+    symulacji i rysowania, mierzone tylko w przebiegu kolejnym"""
+    random.seed(0)
+    game = Game(headless=True, pipelined=pipelined)
+    stub_floor()
+    game.input_source = ScriptedInput(wander_script)
+    wait_for(game, 'menu')
+    game.start_game(reset=True)
+    wait_for(game, 'game')
+
+    enemies = 0
+    simulate = draw = 0.0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for frame in range(WARMUP + frames):
+            if frame == WARMUP:
+                start = time.perf_counter()
+                simulate = draw = 0.0
+            game.input_source.advance()
+            if pipelined:
+                game.play_frame(sim_clock.step_ms)
+                pygame.display.flip()
+            else:
+                # to samo co play_frame, z osobnym pomiarem obu etapów
+                begin = time.perf_counter()
+                game.advance_simulation(sim_clock.step_ms)
+                snapshot = game.capture_frame()
+                middle = time.perf_counter()
+                game.draw_frame(snapshot)
+                pygame.display.flip()
+                simulate += middle - begin
+                draw += time.perf_counter() - middle
+            enemies += len(game.enemy_group)
+            if game.game_state == 'game_over':
+                if game.pipeline is not None:
+                    game.pipeline.finish()
+                game.reset_game()
+                game.game_state = 'game'
+        elapsed = time.perf_counter() - start
+    if game.pipeline is not None:
+        game.pipeline.shutdown()
+    return (
+        frames / elapsed,
+        enemies / (WARMUP + frames),
+        simulate * 1000 / frames,
+        draw * 1000 / frames,
+    )
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else FRAMES
+    # symulacja nie może nadpisać ani skasować zapisu gracza
+    SaveManager.SAVE_FILE = 'benchmark_save.json'
+
+    serial_fps, serial_enemies, simulate_ms, draw_ms = frame_rate(
+        frames, pipelined=False
+    )
+    pipelined_fps, pipelined_enemies, _, _ = frame_rate(frames, pipelined=True)
+    SaveManager.delete_save()
+    print(f"CPU cores: {os.cpu_count()}")
+    print(
+        f"serial:    {serial_fps:7.1f} frames/s ({serial_enemies:.0f} enemies), "
+        f"simulation {simulate_ms:.2f} ms + drawing {draw_ms:.2f} ms per frame, "
+        f"overlapped at best {1000 / max(simulate_ms, draw_ms):.1f} frames/s"
+    )
+    print(
+        f"pipelined: {pipelined_fps:7.1f} frames/s ({pipelined_enemies:.0f} enemies), "
+        f"{pipelined_fps / serial_fps - 1:+.0%}"
+    )
+
+
+if __name__ == '__main__':
+    main()
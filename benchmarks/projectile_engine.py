@@ -0,0 +1,157 @@
+"""Benchmark pocisków: sprite na pocisk kontra silnik tablicowy (ProjectileEngine).
+
+Każda klatka to jeden tick koła czasowego, jak w Game.simulate, więc w obu
+wariantach pociski żyją tyle samo ticków i są zastępowane nowymi.
+Uruchom z katalogu głównego: python -m benchmarks.projectile_engine [liczba_pocisków]
+"""
+import math
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+import config
+from core.mapManager import MapManager
+from core.spatialHash import SpatialGroup
+from core.timerWheel import timer_wheel
+from entities.projectile import (
+    OWNER_ENEMY,
+    OWNER_PLAYER,
+    PROJECTILE_TYPES,
+    ProjectileEngine,
+)
+
+FRAMES = 180
+TARGETS = 200
+KINDS = ['player', 'enemy_0', 'enemy_1']
+
+
+class Target(pygame.sprite.Sprite):
+    def __init__(self, pos) -> None:
+        super().__init__()
+        self.rect = pygame.Rect(0, 0, 70, 90)
+        self.rect.center = pos
+        self.hitbox = self.rect.inflate(0, -10)
+
+
+class SpriteBullet(pygame.sprite.Sprite):
+    """Pocisk w starym stylu: osobny sprite z własnym rect i hitboxem"""
+    def __init__(self, engine, pos, direction, kind, groups) -> None:
+        super().__init__(groups)
+        index = engine.kind_index[kind]
+        atlas = engine.atlas(index)
+        angle = math.degrees(math.atan2(direction.y, direction.x))
+        self.image = atlas[round(-angle * len(atlas) / 360) % len(atlas)]
+        self.rect = self.image.get_rect(center=pos)
+        self.hitbox = self.rect.inflate(-20, -20)
+        _, self.speed, self.lifetime, self.damage, _, self.owner = PROJECTILE_TYPES[kind]
+        self.direction = direction
+        self.deadline = timer_wheel.tick + timer_wheel.ticks_for(self.lifetime)
+
+    def update(self) -> None:
+        self.rect.x += self.direction.x * self.speed
+        self.rect.y += self.direction.y * self.speed
+        self.hitbox.center = self.rect.center
+        if timer_wheel.tick >= self.deadline:
+            self.kill()
+
+
+def random_shot(rng: random.Random):
+    pos = (rng.uniform(-1200, 1200), rng.uniform(-1200, 1200))
+    direction = pygame.math.Vector2(1, 0).rotate(rng.uniform(0, 360))
+    return pos, direction, rng.choice(KINDS)
+
+
+def build_world():
+    # timery poprzedniego przebiegu nie mogą odpalić w kolejnym
+    timer_wheel.clear()
+    rng = random.Random(2)
+    map_manager = MapManager(
+        pygame.sprite.Group(), pygame.sprite.Group(), lambda pos: None
+    )
+    map_manager.update((0, 0))
+    enemies = SpatialGroup(*[
+        Target((rng.randint(-1200, 1200), rng.randint(-1200, 1200)))
+        for _ in range(TARGETS)
+    ])
+    return map_manager, enemies, Target((0, 0))
+
+
+def sprite_frame_time(count: int, screen: pygame.Surface) -> float:
+    """Średni czas klatki (ms) dla pocisków jako sprite'ów"""
+    rng = random.Random(1)
+    map_manager, enemies, player = build_world()
+    engine = ProjectileEngine()
+    player_bullets = pygame.sprite.Group()
+    enemy_bullets = pygame.sprite.Group()
+    offset = pygame.math.Vector2(-config.SCREEN_WIDTH // 2, -config.SCREEN_HEIGHT // 2)
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        while len(player_bullets) + len(enemy_bullets) < count:
+            pos, direction, kind = random_shot(rng)
+            group = player_bullets if kind == 'player' else enemy_bullets
+            SpriteBullet(engine, pos, direction, kind, [group])
+
+        timer_wheel.advance(timer_wheel.tick + 1)
+        player_bullets.update()
+        enemy_bullets.update()
+        for bullet in player_bullets.sprites():
+            if enemies.query_rect(bullet.hitbox, 'hitbox'):
+                bullet.kill()
+        pygame.sprite.spritecollide(player, enemy_bullets, True)
+        for bullet in player_bullets.sprites():
+            if map_manager.rect_hits_wall(bullet.hitbox):
+                bullet.kill()
+        for bullet in enemy_bullets.sprites():
+            if map_manager.rect_hits_wall(bullet.rect, hitbox=False):
+                bullet.kill()
+
+        for group in (player_bullets, enemy_bullets):
+            for bullet in group:
+                screen.blit(bullet.image, bullet.rect.topleft - offset)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def engine_frame_time(count: int, screen: pygame.Surface) -> float:
+    """Średni czas klatki (ms) dla ProjectileEngine"""
+    rng = random.Random(1)
+    map_manager, enemies, player = build_world()
+    engine = ProjectileEngine()
+    targets = enemies.sprites()
+    offset = pygame.math.Vector2(-config.SCREEN_WIDTH // 2, -config.SCREEN_HEIGHT // 2)
+
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        while len(engine) < count:
+            engine.spawn(*random_shot(rng))
+
+        timer_wheel.advance(timer_wheel.tick + 1)
+        engine.update()
+        engine.collide(targets, OWNER_PLAYER)
+        engine.collide([player], OWNER_ENEMY, attr='rect', use_hitbox=False)
+        engine.collide_walls(map_manager)
+        engine.draw(screen, offset)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    pygame.init()
+    screen = pygame.display.set_mode(config.SCREEN_SIZE)
+
+    sprites = sprite_frame_time(count, screen)
+    engine = engine_frame_time(count, screen)
+    budget = 1000 / config.FPS
+    print(f"{count} bullets, sprite per bullet: {sprites:8.2f} ms/frame")
+    print(f"{count} bullets, projectile engine: {engine:8.2f} ms/frame")
+    print(f"speedup: {sprites / engine:.2f}x")
+    print(f"frame budget at {config.FPS} FPS: {budget:.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
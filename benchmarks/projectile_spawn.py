@@ -0,0 +1,87 @@
+"""Benchmark tworzenia pocisków: obrót w locie kontra atlas obrotów, dla sprite'a
+na pocisk i dla ProjectileEngine.spawn.
+
+Uruchom z katalogu głównego: python -m benchmarks.projectile_spawn
+"""
+import math
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+
+from core.assetCache import asset_cache
+from entities.projectile import PROJECTILE_SIZES, PROJECTILE_TYPES, ProjectileEngine
+
+SPAWN_COUNT = 20000
+KIND = 'player'
+
+
+class RotatingBullet(pygame.sprite.Sprite):
+    """Pocisk sprzed atlasu: obraz bazowy obracany przy każdym strzale"""
+    def __init__(self, pos, direction, groups) -> None:
+        super().__init__(groups)
+        file_name = PROJECTILE_TYPES[KIND][0]
+        base = asset_cache.get_image(
+            os.path.join('assets', 'projectile', file_name),
+            PROJECTILE_SIZES[file_name],
+        )
+        angle = math.degrees(math.atan2(direction.y, direction.x))
+        self.image = pygame.transform.rotate(base, -angle)
+        self.rect = self.image.get_rect(center=pos)
+        self.hitbox = self.rect.inflate(-20, -20)
+        self.direction = direction
+
+
+class AtlasBullet(pygame.sprite.Sprite):
+    """Pocisk z atlasu obrotów: klatka wybierana po kącie"""
+    def __init__(self, engine, pos, direction, groups) -> None:
+        super().__init__(groups)
+        atlas = engine.atlas(engine.kind_index[KIND])
+        angle = math.degrees(math.atan2(direction.y, direction.x))
+        self.image = atlas[round(-angle * len(atlas) / 360) % len(atlas)]
+        self.rect = self.image.get_rect(center=pos)
+        self.hitbox = self.rect.inflate(-20, -20)
+        self.direction = direction
+
+
+def spawn_rate(spawn, directions) -> float:
+    """Zwróć liczbę pocisków tworzonych na milisekundę"""
+    # rozgrzewka, aby obraz bazowy i atlas były już w cache
+    spawn(directions[0])
+
+    start = time.perf_counter()
+    for direction in directions:
+        spawn(direction)
+    return len(directions) / ((time.perf_counter() - start) * 1000)
+
+
+def main() -> None:
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    directions = [
+        pygame.math.Vector2(math.cos(a), math.sin(a))
+        for a in (i * 0.37 for i in range(SPAWN_COUNT))
+    ]
+
+    group = pygame.sprite.Group()
+    rotate = spawn_rate(lambda d: RotatingBullet((0, 0), d, [group]), directions)
+    group.empty()
+    atlas_engine = ProjectileEngine()
+    atlas = spawn_rate(
+        lambda d: AtlasBullet(atlas_engine, (0, 0), d, [group]), directions
+    )
+    group.empty()
+    engine = ProjectileEngine()
+    batched = spawn_rate(lambda d: engine.spawn((0, 0), d, KIND), directions)
+
+    print(f"sprite, rotate per spawn: {rotate:8.1f} bullets/ms")
+    print(f"sprite, rotation atlas:   {atlas:8.1f} bullets/ms")
+    print(f"ProjectileEngine.spawn:   {batched:8.1f} bullets/ms")
+    print(f"speedup vs rotate per spawn: {batched / rotate:.2f}x")
+    print(asset_cache.stats())
+
+
+if __name__ == '__main__':
+    main()
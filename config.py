@@ -19,10 +19,68 @@ STAT_BOOST_ENERGY = 10
 BULLET_SPEED = 12
 BULLET_LIFETIME = 1000
 SHOOT_COOLDOWN = 400
+# headings pre-rendered per projectile image, at least 1
+PROJECTILE_ROTATION_STEPS = 64
 
 # audio settings
 MUSIC_VOLUME = 0.2
+MUSIC_CROSSFADE_MS = 2000
 SFX_VOLUME = 0.5
+SFX_CHANNELS = 16
+SFX_HEARING_DISTANCE = 900
+SFX_MIN_GAIN = 0.05
+VOICE_LIMITS = {'attack': 1, 'step': 1, 'ui': 2, 'enemy': 6}
+
+# asset settings
+ASSET_CACHE_BUDGET = 64 * 1024 * 1024
+ASSET_PACK_PATH = os.path.join("assets", "assets.pack")
+PRELOAD_WORKERS = 4
+
+# enemy settings
+ENEMY_MIN_SEPARATION = 110
+ENEMY_REPEL_STRENGTH = 5.0
+ENEMY_SHOOT_RANGE = 500
+ENEMY_LOS_TICKS = 6
+ENEMY_FLOW_MIN_DISTANCE = 128
+FLOW_FIELD_BUDGET = 1200
+ENEMY_DESPAWN_DISTANCE = 2000
+SPAWN_BUDGET_MS = 2.0
+
+# AI level-of-detail settings
+AI_NEAR_DISTANCE = 800
+AI_FAR_DISTANCE = 1400
+AI_MID_INTERVAL = 2
+AI_FAR_INTERVAL = 4
+AI_MAX_STEP = 4
+AI_SCREEN_MARGIN = 100
+AI_UPDATE_BUDGET = 150
+
+# object pool settings: instances built up front, per enemy type and for effects
+POOL_PREWARM = {
+    'ghost': 8,
+    'politician': 8,
+    'butcher': 8,
+    'bat': 8,
+    'skeleton': 8,
+    'black_magic': 8,
+    'mage': 8,
+    'death_effect': 16,
+}
+PROJECTILE_CAPACITY = 256
+
+# collision settings
+SPATIAL_CELL_SIZE = 128
+PRECISE_COLLISION = False
+
+# simulation settings
+SIM_TICK_RATE = 60
+MAX_FRAME_MS = 250
+MAX_SIM_STEPS = 5
+# frame cap while playing, independent of SIM_TICK_RATE (0 = uncapped);
+# menu, loading and game over screens are always capped at FPS
+MAX_RENDER_FPS = 120
+# simulation of the next frame on a worker thread while the current one is drawn
+PIPELINED_RENDER = False
 
 # other settings
 ICON_PATH = os.path.join("assets", "icon.png")
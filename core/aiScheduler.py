@@ -0,0 +1,81 @@
+from typing import Dict, Tuple
+
+import numpy as np
+
+import config
+
+
+class AIScheduler:
+    """Poziomy szczegółowości AI: częstotliwość aktualizacji przeciwnika zależy od
+    odległości od gracza i widoczności na ekranie.
+
+    Bliscy i widoczni przeciwnicy aktualizowani są co tick. Dalsi co kilka ticków,
+    większym krokiem, po kolei (round-robin) i najwyżej budget na tick.
+    """
+    def __init__(self, budget: int = config.AI_UPDATE_BUDGET) -> None:
+        self.budget = budget
+        self.tick: int = 0
+        self.cursor: int = 0
+
+        self.near_updates: int = 0
+        self.far_updates: int = 0
+        self.deferred: int = 0
+
+    def intervals(self, distance: np.ndarray) -> np.ndarray:
+        """Co ile ticków aktualizować przeciwników spoza ekranu"""
+        return np.select(
+            [distance < config.AI_NEAR_DISTANCE, distance < config.AI_FAR_DISTANCE],
+            [1, config.AI_MID_INTERVAL],
+            config.AI_FAR_INTERVAL,
+        )
+
+    def schedule(
+        self, store, center: Tuple[float, float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Krok każdego wiersza magazynu przeciwników w tym ticku (0 = pominięty)
+        i maska widocznych na ekranie"""
+        n = store.count
+        px, py = center
+        half_width = config.SCREEN_WIDTH // 2 + config.AI_SCREEN_MARGIN
+        half_height = config.SCREEN_HEIGHT // 2 + config.AI_SCREEN_MARGIN
+        visible = (
+            (np.abs(store.x[:n] - px) < half_width)
+            & (np.abs(store.y[:n] - py) < half_height)
+        )
+
+        interval = self.intervals(store.distance[:n])
+        interval[visible] = 1
+        ai_tick = store.ai_tick[:n]
+        # nowi przeciwnicy wykonują pierwszy krok od razu
+        fresh = ai_tick < 0
+        elapsed = np.where(fresh, 1, self.tick - ai_tick)
+        due = (elapsed >= interval) | fresh
+
+        background = np.flatnonzero(due & ~fresh & (interval > 1))
+        if len(background) > self.budget:
+            # round-robin: zacznij od wiersza, na którym skończył poprzedni tick
+            split = np.searchsorted(background, self.cursor % n)
+            rotated = np.concatenate((background[split:], background[:split]))
+            due[rotated[self.budget:]] = False
+            self.cursor = int(rotated[self.budget - 1]) + 1
+            self.deferred += len(background) - self.budget
+            self.far_updates += self.budget
+        else:
+            self.far_updates += len(background)
+        self.near_updates += int(np.count_nonzero(due)) - min(
+            len(background), self.budget
+        )
+
+        ai_tick[due] = self.tick
+        steps = np.where(due, np.minimum(elapsed, config.AI_MAX_STEP), 0)
+        self.tick += 1
+        return steps, visible
+
+    def stats(self) -> Dict[str, int]:
+        """Zwróć liczniki harmonogramu AI"""
+        return {
+            'ticks': self.tick,
+            'near_updates': self.near_updates,
+            'far_updates': self.far_updates,
+            'deferred': self.deferred,
+        }
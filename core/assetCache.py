@@ -0,0 +1,226 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+import config
+from core.assetPack import AssetPack
+
+# Transformacja to krotka operacji, np. (('rotate', 90),) lub (('flip', True, False),)
+Transform = Tuple[Tuple[Any, ...], ...]
+
+
+class AssetCache:
+    """Wspólny cache powierzchni z limitem pamięci i licznikami trafień"""
+    def __init__(self, budget_bytes: int = config.ASSET_CACHE_BUDGET) -> None:
+        self.budget_bytes = budget_bytes
+        self.memory_used: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        self._surfaces: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+        self._sizes: Dict[tuple, int] = {}
+        self._atlases: Dict[tuple, List[pygame.Surface]] = {}
+        # id powierzchni -> (powierzchnia, maska); powierzchnia trzymana, aby id nie wróciło
+        self._masks: Dict[int, Tuple[pygame.Surface, pygame.mask.Mask]] = {}
+        self.pack: Optional[AssetPack] = None
+
+    def get_image(
+        self,
+        path: str,
+        size: Optional[Tuple[int, int]] = None,
+        transform: Transform = (),
+        alpha: bool = True,
+    ) -> pygame.Surface:
+        """Zwróć powierzchnię z cache lub wczytaj ją z dysku"""
+        key = (path, size, transform, alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        if transform:
+            surface = self._base_image(path, size, alpha)
+            for operation in transform:
+                surface = self.apply_transform(surface, operation)
+        else:
+            surface = self._decode(path, size, alpha)
+
+        self._store(key, surface)
+        return surface
+
+    def _base_image(
+        self, path: str, size: Optional[Tuple[int, int]], alpha: bool
+    ) -> pygame.Surface:
+        """Obraz bez transformacji dla wariantu; nie zmienia liczników,
+        bo trafienie lub chybienie liczy już zapytanie o wariant"""
+        key = (path, size, (), alpha)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+
+        surface = self._decode(path, size, alpha)
+        self._store(key, surface)
+        return surface
+
+    def _decode(
+        self, path: str, size: Optional[Tuple[int, int]], alpha: bool
+    ) -> pygame.Surface:
+        """Wczytaj obraz z paczki, a gdy go tam nie ma, z dysku"""
+        surface = self._load_from_pack(path, size, alpha)
+        if surface is None:
+            surface = self.load_image(path, size, alpha)
+        return surface
+
+    def add_decoded(
+        self,
+        path: str,
+        size: Optional[Tuple[int, int]],
+        alpha: bool,
+        surface: pygame.Surface,
+    ) -> pygame.Surface:
+        """Dodaj obraz zdekodowany poza głównym wątkiem, konwertując go do formatu ekranu"""
+        key = (path, size, (), alpha)
+        if key in self._surfaces:
+            return self._surfaces[key]
+
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        self._store(key, surface)
+        return surface
+
+    def attach_pack(self, pack: Optional[AssetPack]) -> None:
+        """Używaj wypalonej paczki zasobów zamiast luźnych plików"""
+        self.pack = pack
+
+    def _load_from_pack(
+        self, path: str, size: Optional[Tuple[int, int]], alpha: bool
+    ) -> Optional[pygame.Surface]:
+        """Zwróć obraz z paczki, w razie potrzeby skalując wersję natywną"""
+        if self.pack is None:
+            return None
+
+        surface = self.pack.get(path, size, alpha)
+        if surface is None and size is not None:
+            native = self.pack.get(path, None, alpha)
+            if native is not None:
+                surface = pygame.transform.scale(native, size)
+        if surface is None:
+            return None
+        # piksele paczki są w RGBA; bez konwersji blit przeliczałby je w każdej klatce
+        return surface.convert_alpha() if alpha else surface.convert()
+
+    def get_rotation_atlas(
+        self,
+        path: str,
+        size: Optional[Tuple[int, int]] = None,
+        steps: int = config.PROJECTILE_ROTATION_STEPS,
+    ) -> List[pygame.Surface]:
+        """Zwróć obraz obrócony o kolejne kąty co 360 / steps stopni"""
+        if steps < 1:
+            raise ValueError(f"Liczba kroków obrotu musi być dodatnia: {steps}")
+        key = (path, size, steps)
+        atlas = self._atlases.get(key)
+        if atlas is not None:
+            self.hits += 1
+            return atlas
+
+        self.misses += 1
+        base = self._base_image(path, size, True)
+        atlas = [
+            self.apply_transform(base, ('rotate', i * 360 / steps))
+            for i in range(steps)
+        ]
+        self._atlases[key] = atlas
+        return atlas
+
+    def get_mask(self, surface: pygame.Surface) -> pygame.mask.Mask:
+        """Maska kolizji powierzchni, liczona raz dla każdej klatki i wariantu"""
+        entry = self._masks.get(id(surface))
+        if entry is not None and entry[0] is surface:
+            return entry[1]
+
+        mask = pygame.mask.from_surface(surface)
+        self._masks[id(surface)] = (surface, mask)
+        return mask
+
+    @staticmethod
+    def load_image(
+        path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = True
+    ) -> pygame.Surface:
+        """Wczytaj i przeskaluj obraz z pominięciem cache"""
+        surface = pygame.image.load(path)
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        if size is not None and surface.get_size() != tuple(size):
+            surface = pygame.transform.scale(surface, size)
+        return surface
+
+    @staticmethod
+    def apply_transform(
+        surface: pygame.Surface, operation: Tuple[Any, ...]
+    ) -> pygame.Surface:
+        """Zastosuj pojedynczą operację transformacji do powierzchni"""
+        name = operation[0]
+        if name == 'rotate':
+            return pygame.transform.rotate(surface, operation[1])
+        if name == 'flip':
+            return pygame.transform.flip(surface, operation[1], operation[2])
+        if name == 'add':
+            tinted = surface.copy()
+            tinted.fill(operation[1], special_flags=pygame.BLEND_RGB_ADD)
+            return tinted
+        if name == 'alpha':
+            faded = surface.copy()
+            faded.set_alpha(operation[1])
+            return faded
+        raise ValueError(f"Nieznana transformacja: {name}")
+
+    def _store(self, key: tuple, surface: pygame.Surface) -> None:
+        """Dodaj powierzchnię do cache i usuń najstarsze przy przekroczeniu limitu"""
+        size_bytes = surface.get_pitch() * surface.get_height()
+        self._surfaces[key] = surface
+        self._sizes[key] = size_bytes
+        self.memory_used += size_bytes
+
+        while self.memory_used > self.budget_bytes and len(self._surfaces) > 1:
+            old_key, old_surface = self._surfaces.popitem(last=False)
+            self.memory_used -= self._sizes.pop(old_key)
+            self._masks.pop(id(old_surface), None)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Wyczyść cache"""
+        self._surfaces.clear()
+        self._sizes.clear()
+        self._atlases.clear()
+        self._masks.clear()
+        self.memory_used = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Zwróć liczniki cache"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._surfaces),
+            'atlases': len(self._atlases),
+            'masks': len(self._masks),
+            'memory_used': self.memory_used,
+            'budget_bytes': self.budget_bytes,
+            'pack_hits': self.pack.hits if self.pack else 0,
+            'pack_stale': self.pack.stale if self.pack else 0,
+        }
+
+
+asset_cache = AssetCache()
+
+
+def collide_masks(a: pygame.sprite.Sprite, b: pygame.sprite.Sprite) -> bool:
+    """Odpowiednik pygame.sprite.collide_mask korzystający z masek z cache"""
+    offset = (b.rect.x - a.rect.x, b.rect.y - a.rect.y)
+    mask = asset_cache.get_mask(a.image)
+    return mask.overlap(asset_cache.get_mask(b.image), offset) is not None
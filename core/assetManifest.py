@@ -0,0 +1,62 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+import config
+from entities.enemy import enemy_types
+from entities.projectile import PROJECTILE_SIZES
+
+# (ścieżka, docelowy rozmiar lub None dla natywnego, czy z kanałem alfa)
+AssetEntry = Tuple[str, Optional[Tuple[int, int]], bool]
+
+UI_BUTTONS = ['play', 'exit', 'continue']
+PLAYER_DIRECTIONS = ['up', 'down', 'left', 'right']
+
+
+def asset_groups() -> Dict[str, List[AssetEntry]]:
+    """Obrazy potrzebne w poszczególnych stanach gry wraz z docelowymi rozmiarami"""
+    ui_path = os.path.join('assets', 'ui')
+    player_path = os.path.join('assets', 'player')
+    player_size = (config.PLAYER_SIZE, config.PLAYER_SIZE)
+
+    menu: List[AssetEntry] = [
+        (config.ICON_PATH, None, True),
+        (os.path.join(ui_path, 'cursor.png'), (32, 32), True),
+        (os.path.join(ui_path, 'ui.png'), (250, 100), True),
+        (os.path.join(ui_path, 'start.png'), config.SCREEN_SIZE, True),
+    ]
+    for button in UI_BUTTONS:
+        menu.append((os.path.join(ui_path, f'{button}.png'), None, True))
+        menu.append((os.path.join(ui_path, f'{button}_hover.png'), None, True))
+
+    game: List[AssetEntry] = [
+        (os.path.join('assets', 'floor_flat.png'), None, False),
+        (os.path.join('assets', 'wall.png'), (config.TILE_SIZE, config.TILE_SIZE), True),
+        (os.path.join('assets', 'dead.png'), (80, 80), True),
+    ]
+    for direction in PLAYER_DIRECTIONS:
+        for i in range(4):
+            path = os.path.join(player_path, f'{direction}_{i}.png')
+            game.append((path, player_size, True))
+        path = os.path.join(player_path, f'attack_{direction}.png')
+        game.append((path, player_size, True))
+
+    for name, enemy_type in enemy_types.records().items():
+        size = enemy_type.size
+        for i in range(3):
+            path = os.path.join('assets', 'enemies', name, f'{name}_{i}.png')
+            game.append((path, size, True))
+
+    for file_name, size in PROJECTILE_SIZES.items():
+        path = os.path.join('assets', 'projectile', file_name)
+        game.append((path, size, True))
+
+    game_over: List[AssetEntry] = [
+        (os.path.join(ui_path, 'end.png'), config.SCREEN_SIZE, True),
+    ]
+
+    return {'menu': menu, 'game': game, 'game_over': game_over}
+
+
+def asset_manifest() -> List[AssetEntry]:
+    """Wszystkie obrazy wczytywane przez grę"""
+    return [entry for group in asset_groups().values() for entry in group]
@@ -0,0 +1,151 @@
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Optional, Tuple
+
+import pygame
+
+PACK_MAGIC = b'RMGPACK1'
+PACK_VERSION = 1
+HEADER = struct.Struct('<8sQ')
+ALIGNMENT = 16
+
+
+def pack_key(path: str, size: Optional[Tuple[int, int]], alpha: bool) -> str:
+    """Klucz wpisu w indeksie paczki"""
+    size_part = f"{size[0]}x{size[1]}" if size else 'native'
+    pixel_format = 'RGBA' if alpha else 'RGBX'
+    return f"{os.path.normpath(path)}|{size_part}|{pixel_format}"
+
+
+class AssetPack:
+    """Paczka z przeskalowanymi, zdekodowanymi obrazami mapowana w pamięci"""
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.hits: int = 0
+        self.stale: int = 0
+
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._view = memoryview(self._mmap)
+
+        magic, index_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"{path} nie jest paczką zasobów")
+
+        index_start = HEADER.size
+        index = json.loads(bytes(self._view[index_start:index_start + index_length]))
+        if index.get('version') != PACK_VERSION:
+            raise ValueError(f"{path}: nieobsługiwana wersja paczki")
+
+        self.entries: Dict[str, dict] = index['entries']
+
+    @classmethod
+    def open(cls, path: str) -> Optional['AssetPack']:
+        """Otwórz paczkę lub zwróć None, jeśli jej nie ma albo jest uszkodzona"""
+        if not os.path.exists(path):
+            return None
+
+        try:
+            return cls(path)
+        except (OSError, ValueError, KeyError, struct.error) as e:
+            print(f"Nie można otworzyć paczki zasobów {path}: {e}")
+            return None
+
+    def has(
+        self, path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = True
+    ) -> bool:
+        """Czy paczka zawiera aktualny wpis dla obrazu"""
+        entry = self.entries.get(pack_key(path, size, alpha))
+        return entry is not None and not self.is_stale(path, entry)
+
+    def get(
+        self, path: str, size: Optional[Tuple[int, int]] = None, alpha: bool = True
+    ) -> Optional[pygame.Surface]:
+        """Zwróć powierzchnię z paczki bez kopiowania pikseli lub None"""
+        entry = self.entries.get(pack_key(path, size, alpha))
+        if entry is None:
+            return None
+
+        if self.is_stale(path, entry):
+            self.stale += 1
+            return None
+
+        width, height = entry['width'], entry['height']
+        offset = entry['offset']
+        length = width * height * 4
+        self.hits += 1
+        return pygame.image.frombuffer(
+            self._view[offset:offset + length], (width, height), entry['format']
+        )
+
+    @staticmethod
+    def is_stale(path: str, entry: dict) -> bool:
+        """Sprawdź, czy plik źródłowy zmienił się od czasu wypalenia paczki"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        return (
+            stat.st_mtime_ns != entry['mtime_ns']
+            or stat.st_size != entry['source_size']
+        )
+
+    @staticmethod
+    def bake(
+        assets: Iterable[Tuple[str, Optional[Tuple[int, int]], bool]], output: str
+    ) -> int:
+        """Zapisz podane obrazy (ścieżka, rozmiar, alfa) do jednego pliku paczki"""
+        entries: Dict[str, dict] = {}
+        blobs = []
+        data_size = 0
+
+        for path, size, alpha in assets:
+            try:
+                surface = pygame.image.load(path)
+            except FileNotFoundError:
+                print(f"Pominięto brakujący plik: {path}")
+                continue
+
+            if size is not None and surface.get_size() != tuple(size):
+                surface = pygame.transform.scale(surface, size)
+
+            pixel_format = 'RGBA' if alpha else 'RGBX'
+            pixels = pygame.image.tobytes(surface, pixel_format)
+            stat = os.stat(path)
+            entries[pack_key(path, size, alpha)] = {
+                'offset': data_size,
+                'width': surface.get_width(),
+                'height': surface.get_height(),
+                'format': pixel_format,
+                'mtime_ns': stat.st_mtime_ns,
+                'source_size': stat.st_size,
+            }
+
+            padding = -len(pixels) % ALIGNMENT
+            blobs.append(pixels + bytes(padding))
+            data_size += len(pixels) + padding
+
+        # offsety w indeksie są względne; przesuwamy je za nagłówek i indeks
+        data_start = 0
+        while True:
+            index = json.dumps(
+                {'version': PACK_VERSION, 'entries': entries}
+            ).encode('utf-8')
+            new_start = HEADER.size + len(index)
+            new_start += -new_start % ALIGNMENT
+            if new_start == data_start:
+                break
+            for entry in entries.values():
+                entry['offset'] += new_start - data_start
+            data_start = new_start
+
+        with open(output, 'wb') as f:
+            f.write(HEADER.pack(PACK_MAGIC, len(index)))
+            f.write(index)
+            f.write(bytes(data_start - HEADER.size - len(index)))
+            for blob in blobs:
+                f.write(blob)
+
+        return len(entries)
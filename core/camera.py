@@ -1,6 +1,33 @@
 import os
+from operator import itemgetter
+from typing import List, NamedTuple, Optional, Tuple
+
 import pygame
 
+from core.assetCache import asset_cache
+
+
+class WorldSnapshot(NamedTuple):
+    """Stan świata potrzebny do narysowania klatki"""
+    # lewy górny róg gracza sprzed ticku i po nim oraz jego rozmiar, do kamery
+    player_previous: Tuple[int, int]
+    player_topleft: Tuple[int, int]
+    player_size: Tuple[int, int]
+    level: int
+    # (środek y, obraz, poprzednia pozycja lub None, pozycja, szerokość,
+    # pasek życia (zdrowie, rodzaj) lub None, czy to gracz)
+    sprites: List[tuple]
+    projectiles: Optional[tuple]
+
+
+def lerp(previous: tuple, current: tuple, alpha: float) -> pygame.math.Vector2:
+    """Pozycja między poprzednim a bieżącym tickiem"""
+    return pygame.math.Vector2(
+        previous[0] + (current[0] - previous[0]) * alpha,
+        previous[1] + (current[1] - previous[1]) * alpha,
+    )
+
+
 class CameraGroup(pygame.sprite.Group):
     """Grupa sprite z obsługą kamery"""
     def __init__(self) -> None:
@@ -10,21 +37,72 @@ class CameraGroup(pygame.sprite.Group):
         self.half_height = self.display_surface.get_height() // 2
         self.offset = pygame.math.Vector2()
 
-        self.floor_surf = pygame.image.load(
-            os.path.join('assets', 'floor_flat.png')
-        ).convert()
+        self.floor_surf = None
+        self.projectiles = None
+        # pozycje sprite'ów sprzed ostatniego ticku symulacji
+        self.previous = {}
+        self.font = pygame.font.Font(
+            os.path.join('assets', 'DungeonFont.ttf'), 24
+        )
+
+    def load_floor(self) -> None:
+        """Wczytaj teksturę podłogi przy pierwszym rysowaniu"""
+        self.floor_surf = asset_cache.get_image(
+            os.path.join('assets', 'floor_flat.png'), alpha=False
+        )
         self.floor_rect = self.floor_surf.get_rect()
 
         self.bg_width = self.floor_rect.width
         self.bg_height = self.floor_rect.height
-        self.font = pygame.font.Font(
-            os.path.join('assets', 'DungeonFont.ttf'), 24
+
+    def snapshot(self, sprites: list) -> None:
+        """Zapamiętaj pozycje ruchomych sprite'ów przed krokiem symulacji"""
+        self.previous = {sprite: sprite.rect.topleft for sprite in sprites}
+
+    def capture(self, player) -> WorldSnapshot:
+        """Migawka do narysowania świata, niezależna od dalszych kroków symulacji"""
+        previous = self.previous
+        sprites = []
+        for sprite in self.sprites():
+            bar = None
+            enemy_type = getattr(sprite, 'enemy_type', None)
+            if enemy_type is not None:
+                health = sprite.health
+                if health < enemy_type.hp:
+                    bar = (health, enemy_type)
+            rect = sprite.rect
+            sprites.append((
+                rect.centery,
+                sprite.image,
+                previous.get(sprite),
+                rect.topleft,
+                rect.width,
+                bar,
+                sprite is player,
+            ))
+
+        projectiles = None
+        if self.projectiles is not None:
+            projectiles = self.projectiles.snapshot()
+        return WorldSnapshot(
+            previous.get(player, player.rect.topleft),
+            player.rect.topleft,
+            player.rect.size,
+            player.level,
+            sprites,
+            projectiles,
         )
 
-    def custom_draw(self, player) -> None:
-        """Rysuj sprite'y z uwzględnieniem kamery"""
-        self.offset.x = player.rect.centerx - self.half_width
-        self.offset.y = player.rect.centery - self.half_height
+    def draw_snapshot(self, world: WorldSnapshot, alpha: float = 1.0) -> None:
+        """Rysuj migawkę świata; nie czyta stanu symulacji, więc może działać
+        równolegle z kolejnym krokiem"""
+        if self.floor_surf is None:
+            self.load_floor()
+
+        player_x, player_y = lerp(world.player_previous, world.player_topleft, alpha)
+        player_width, player_height = world.player_size
+        self.offset.x = player_x + player_width // 2 - self.half_width
+        self.offset.y = player_y + player_height // 2 - self.half_height
 
         start_col = int(self.offset.x // self.bg_width)
         start_row = int(self.offset.y // self.bg_height)
@@ -39,40 +117,40 @@ class CameraGroup(pygame.sprite.Group):
 
                 self.display_surface.blit(self.floor_surf, (x, y))
 
-        for sprite in sorted(
-            self.sprites(), key=lambda sprite: sprite.rect.centery
+        for _, image, previous, topleft, width, bar, is_player in sorted(
+            world.sprites, key=itemgetter(0)
         ):
-            offset_pos = sprite.rect.topleft - self.offset
-            self.display_surface.blit(sprite.image, offset_pos)
+            if previous is not None:
+                topleft = lerp(previous, topleft, alpha)
+            offset_pos = topleft - self.offset
+            self.display_surface.blit(image, offset_pos)
 
-            if (
-                hasattr(sprite, 'xp_reward')
-                and sprite.health < sprite.max_health
-            ):
+            if bar is not None:
+                health, enemy_type = bar
                 bar_x = (
                     offset_pos[0]
-                    + (sprite.rect.width // 2)
-                    - (sprite.bar_max_width // 2)
+                    + (width // 2)
+                    - (enemy_type.bar_max_width // 2)
                 )
                 bar_y = offset_pos[1] - 10
-                ratio = sprite.health / sprite.max_health
-                current_bar_width = sprite.bar_max_width * ratio
+                ratio = health / enemy_type.hp
+                current_bar_width = enemy_type.bar_max_width * ratio
                 bg_rect = pygame.Rect(
-                    bar_x, bar_y, sprite.bar_max_width, sprite.bar_height
+                    bar_x, bar_y, enemy_type.bar_max_width, enemy_type.bar_height
                 )
                 pygame.draw.rect(self.display_surface, '#111111', bg_rect)
                 if current_bar_width > 0:
                     hp_rect = pygame.Rect(
-                        bar_x, bar_y, current_bar_width, sprite.bar_height
+                        bar_x, bar_y, current_bar_width, enemy_type.bar_height
                     )
                     pygame.draw.rect(self.display_surface, 'red', hp_rect)
 
-            if sprite == player:
-                level_text = f"Lvl: {player.level}"
+            if is_player:
+                level_text = f"Lvl: {world.level}"
                 text_surf = self.font.render(level_text, True, 'white')
 
                 text_rect = text_surf.get_rect(
-                    centerx=offset_pos[0] + sprite.rect.width // 2,
+                    centerx=offset_pos[0] + width // 2,
                     bottom=offset_pos[1] - 10,
                 )
 
@@ -82,4 +160,9 @@ class CameraGroup(pygame.sprite.Group):
                 shadow_rect.y += 1
                 self.display_surface.blit(shadow_surf, shadow_rect)
 
-                self.display_surface.blit(text_surf, text_rect)
\ No newline at end of file
+                self.display_surface.blit(text_surf, text_rect)
+
+        if world.projectiles is not None:
+            self.projectiles.draw(
+                self.display_surface, self.offset, alpha, world.projectiles
+            )
@@ -0,0 +1,77 @@
+from typing import Any, Dict, List
+
+import numpy as np
+import pygame
+
+
+class ComponentStore:
+    """Komponenty encji jako gęsto upakowane tablice NumPy (po jednej na pole).
+
+    Wiersze 0..count-1 są zawsze zajęte: usunięcie przenosi ostatni wiersz na
+    zwolnione miejsce, więc systemy przetwarzają tablice [:count] hurtowo.
+    Encja zna swój wiersz przez atrybut row.
+    """
+    def __init__(self, components: Dict[str, Any], capacity: int = 256) -> None:
+        self.components = components
+        self.count = 0
+        self.capacity = capacity
+        for name, dtype in components.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+        self.entities: List[Any] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def grow(self) -> None:
+        self.capacity *= 2
+        for name in self.components:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def add(self, entity, values: Dict[str, Any]) -> int:
+        """Przydziel encji wiersz z podanymi wartościami (pozostałe pola zerowe)"""
+        if self.count == self.capacity:
+            self.grow()
+        row = self.count
+        for name in self.components:
+            getattr(self, name)[row] = values.get(name, 0)
+        self.entities.append(entity)
+        entity.row = row
+        self.count += 1
+        return row
+
+    def remove(self, entity) -> None:
+        """Zwolnij wiersz encji, przenosząc na jego miejsce ostatni wiersz"""
+        row = entity.row
+        last = self.count - 1
+        if row != last:
+            for name in self.components:
+                array = getattr(self, name)
+                array[row] = array[last]
+            moved = self.entities[last]
+            self.entities[row] = moved
+            moved.row = row
+        self.entities.pop()
+        self.count = last
+        entity.row = -1
+
+
+class StoreGroup(pygame.sprite.Group):
+    """Grupa, której każdy członek ma wiersz w ComponentStore.
+
+    Sprite dołączający do grupy podaje wartości startowe przez components().
+    """
+    def __init__(self, components: Dict[str, Any], *sprites, **kwargs) -> None:
+        self.store = ComponentStore(components)
+        super().__init__(*sprites, **kwargs)
+
+    def add_internal(self, sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        sprite.store = self.store
+        self.store.add(sprite, sprite.components())
+
+    def remove_internal(self, sprite) -> None:
+        super().remove_internal(sprite)
+        self.store.remove(sprite)
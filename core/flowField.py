@@ -0,0 +1,133 @@
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import numpy as np
+
+import config
+
+# kierunki: najpierw prostopadłe, aby przy remisie BFS wybierał ruch prosty;
+# przeciwne kierunki sąsiadują parami, więc odwrotność to indeks ^ 1
+DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, -1), (1, -1), (-1, 1)]
+DIRECTION_VECTORS = np.array(
+    [(dx / np.hypot(dx, dy), dy / np.hypot(dx, dy)) for dx, dy in DIRECTIONS]
+)
+
+
+class FlowField:
+    """Wspólne pole kierunków do gracza, liczone BFS-em po kafelkach aktywnych chunk'ów.
+
+    Nowe pole liczone jest przyrostowo (najwyżej budget kafelków na klatkę), a do
+    czasu jego ukończenia przeciwnicy korzystają z poprzedniego.
+    """
+    def __init__(self, budget: int = config.FLOW_FIELD_BUDGET) -> None:
+        self.budget = budget
+
+        # gotowe pole: indeks kierunku na kafelek (-1 = brak) i początek w kafelkach
+        self.field: Optional[np.ndarray] = None
+        self.origin: Tuple[int, int] = (0, 0)
+
+        self.source_grid: Optional[np.ndarray] = None
+        self.target_tile: Optional[Tuple[int, int]] = None
+
+        # stan liczonego pola
+        self.pending: Optional[dict] = None
+        self.completed: int = 0
+
+    def update(self, map_manager, target_pos: Tuple[float, float]) -> None:
+        """Rozpocznij nowe pole po zmianie kafelka celu lub mapy i kontynuuj liczenie"""
+        grid, first_col, first_row = map_manager.occupancy_grid()
+        tile = config.TILE_SIZE
+        target_tile = (int(target_pos[0] // tile), int(target_pos[1] // tile))
+
+        if grid is not self.source_grid or target_tile != self.target_tile:
+            self.source_grid = grid
+            self.target_tile = target_tile
+            self.start(grid, (first_col, first_row), target_tile)
+
+        if self.pending is not None:
+            self.step(self.budget)
+
+    def start(
+        self, grid: np.ndarray, origin: Tuple[int, int], target_tile: Tuple[int, int]
+    ) -> None:
+        rows, cols = grid.shape
+        col = target_tile[0] - origin[0]
+        row = target_tile[1] - origin[1]
+        if not (0 <= col < cols and 0 <= row < rows):
+            self.pending = None
+            return
+
+        # ramka ze ścian dookoła siatki zastępuje sprawdzanie granic w pętli BFS
+        walls = np.pad(grid, 1, constant_values=True)
+        width = cols + 2
+        start = (row + 1) * width + col + 1
+        directions: List[int] = [-1] * walls.size
+        visited = bytearray(walls.tobytes())
+        visited[start] = 1
+        # kafelek celu jest punktem startu, nawet gdy gracz stoi przy ścianie na nim
+        queue: Deque[int] = deque([start])
+        self.pending = {
+            'walls': walls.tobytes(),
+            'shape': walls.shape,
+            'origin': origin,
+            'directions': directions,
+            'visited': visited,
+            'queue': queue,
+        }
+
+    def step(self, budget: int) -> None:
+        """Rozwiń najwyżej budget kafelków z kolejki BFS"""
+        pending = self.pending
+        walls = pending['walls']
+        width = pending['shape'][1]
+        directions = pending['directions']
+        visited = pending['visited']
+        queue = pending['queue']
+        # (kierunek, przesunięcie indeksu, przesunięcia sąsiadów prostopadłych)
+        moves = [
+            (direction, dy * width + dx, dx, dy * width)
+            for direction, (dx, dy) in enumerate(DIRECTIONS)
+        ]
+
+        while queue and budget > 0:
+            budget -= 1
+            index = queue.popleft()
+            for direction, offset, side_x, side_y in moves:
+                next_index = index + offset
+                if visited[next_index]:
+                    continue
+                # bez ścinania narożników ścian przy ruchu po skosie
+                if side_x and side_y and (
+                    walls[index + side_x] or walls[index + side_y]
+                ):
+                    continue
+                visited[next_index] = 1
+                # z sąsiada idzie się z powrotem, w stronę celu
+                directions[next_index] = direction ^ 1
+                queue.append(next_index)
+
+        if not queue:
+            field = np.array(directions, dtype=np.int8).reshape(pending['shape'])
+            self.field = field[1:-1, 1:-1]
+            self.origin = pending['origin']
+            self.pending = None
+            self.completed += 1
+
+    def lookup(self, centers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Kierunki z pola dla punktów (n, 2) i maska punktów, dla których są znane"""
+        count = len(centers)
+        vectors = np.zeros((count, 2))
+        if self.field is None:
+            return vectors, np.zeros(count, dtype=bool)
+
+        tile = config.TILE_SIZE
+        rows, cols = self.field.shape
+        col = np.floor(centers[:, 0] / tile).astype(np.int64) - self.origin[0]
+        row = np.floor(centers[:, 1] / tile).astype(np.int64) - self.origin[1]
+        inside = (col >= 0) & (col < cols) & (row >= 0) & (row < rows)
+
+        direction = np.full(count, -1, dtype=np.int64)
+        direction[inside] = self.field[row[inside], col[inside]]
+        known = direction >= 0
+        vectors[known] = DIRECTION_VECTORS[direction[known]]
+        return vectors, known
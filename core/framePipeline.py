@@ -0,0 +1,52 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import NamedTuple, Optional
+
+from core.camera import WorldSnapshot
+from core.inputSource import SampledInput
+from core.ui import HudState
+
+
+class FrameSnapshot(NamedTuple):
+    """Wszystko, czego potrzeba do narysowania klatki rozgrywki"""
+    world: WorldSnapshot
+    hud: HudState
+    interpolation: float
+
+
+class FramePipeline:
+    """Symulacja kolejnej klatki w wątku roboczym, gdy wątek główny rysuje bieżącą.
+
+    advance czeka na krok zlecony w poprzedniej klatce, robi migawkę jego wyniku
+    i zleca następny krok; migawkę rysuje wątek główny równolegle z symulacją.
+    Obraz i wejście są przez to opóźnione o jedną klatkę. Zysk bierze się z
+    kodu zwalniającego GIL po obu stronach: operacji NumPy w systemach oraz
+    blitów i display.flip w pygame.
+    """
+    def __init__(self, game) -> None:
+        self.game = game
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='simulation'
+        )
+        self.pending: Optional[Future] = None
+        # wejście czytane w wątku głównym; symulacja widzi jego kopię z klatki
+        self.input = SampledInput()
+
+    def advance(self, frame_ms: float) -> FrameSnapshot:
+        """Migawka stanu po poprzednim kroku; następny krok rusza w tle"""
+        self.finish()
+        snapshot = self.game.capture_frame()
+
+        self.input.sample(self.game.input_source)
+        self.game.player.input_source = self.input
+        self.pending = self.executor.submit(self.game.advance_simulation, frame_ms)
+        return snapshot
+
+    def finish(self) -> None:
+        """Poczekaj na zlecony krok; przed każdą zmianą stanu gry w wątku głównym"""
+        if self.pending is not None:
+            pending, self.pending = self.pending, None
+            pending.result()
+
+    def shutdown(self) -> None:
+        self.finish()
+        self.executor.shutdown()
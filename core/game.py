@@ -1,70 +1,208 @@
 import os.path
 import random
 import sys
+import time
 from typing import Dict, Tuple
 
 import pygame
 
 import config
+from core.aiScheduler import AIScheduler
+from core.assetCache import asset_cache, collide_masks
+from core.assetManifest import asset_groups
+from core.assetPack import AssetPack
 from core.mapManager import MapManager
+from core.music import MusicPlaylist
+from core.preloader import Preloader
 from core.saveManager import SaveManager
-from core.ui import UI
+from core.simClock import sim_clock
+from core.spawnDirector import SpawnDirector
+from core.timerWheel import timer_wheel
+from core.soundManager import sound_bank, voices
+from core.ui import UI, HudState, LoadingScreen
 from core.camera import CameraGroup
+from core.flowField import FlowField
+from core.framePipeline import FramePipeline, FrameSnapshot
+from core.systems import (
+    EffectSystem,
+    EnemySystem,
+    PlayerSystem,
+    ProjectileSystem,
+    SystemPipeline,
+)
+from core.inputSource import InputSource, pygame_input
+from entities.enemy import EnemyGroup, enemy_types
 from entities.factory import MainFactory
+from entities.particle import EffectGroup, death_effects
 from entities.player import Player
-
-
-def collide_hitbox(sprite1, sprite2) -> bool:
-    return sprite1.hitbox.colliderect(sprite2.hitbox)
+from entities.projectile import OWNER_ENEMY, OWNER_PLAYER, ProjectileEngine
 
 
 class Game:
     """Główna klasa gry"""
-    def __init__(self) -> None:
+    def __init__(
+        self, headless: bool = False, pipelined: bool = config.PIPELINED_RENDER
+    ) -> None:
+        self.startup_begin = time.perf_counter()
+        # bez okna (sterowniki dummy): bez kursora, wejście podawane przez input_source
+        self.headless = headless
+        self.input_source: InputSource = pygame_input
         pygame.init()
         pygame.mixer.init()
         self.screen = pygame.display.set_mode(config.SCREEN_SIZE)
-        icon_surface = pygame.image.load(config.ICON_PATH)
-        pygame.display.set_icon(icon_surface)
         pygame.display.set_caption("Real of the Mad God Clone")
-
-        cursor_image = pygame.image.load(
-            os.path.join('assets', 'ui', 'cursor.png')
-        )
-        cursor_image = pygame.transform.scale(cursor_image, (32, 32))
-        cursor = pygame.cursors.Cursor((0, 0), cursor_image)
-        pygame.mouse.set_cursor(cursor)
+        asset_cache.attach_pack(AssetPack.open(config.ASSET_PACK_PATH))
 
         self.clock = pygame.time.Clock()
-
+        self.startup_phases: Dict[str, float] = {
+            'init': time.perf_counter() - self.startup_begin
+        }
+        self.startup_reported = False
+
+        self.loading_screen = LoadingScreen()
+        voices.init()
+        self.preloader = Preloader()
+        for group, entries in asset_groups().items():
+            self.preloader.load_images(group, entries)
+        sound_bank.preload(self.preloader, 'game')
+
+        # all_sprites służy tylko do rysowania; aktualizacje idą przez rejestry systemów
         self.all_sprites = CameraGroup()
         self.obstacle_sprites = pygame.sprite.Group()
-        self.enemy_group = pygame.sprite.Group()
-        self.player_bullets = pygame.sprite.Group()
-        self.enemy_bullets = pygame.sprite.Group()
+        self.enemy_group = EnemyGroup()
+        self.effect_group = EffectGroup()
+        self.projectiles = ProjectileEngine()
+        self.all_sprites.projectiles = self.projectiles
 
         self.factory = MainFactory()
+        self.spawn_director = SpawnDirector(self.spawn_enemy_at_pos)
+        self.ai_scheduler = AIScheduler()
 
-        self.setup_music()
-        self.setup_player()
-        self.ui = UI()
-        self.map_manager = MapManager(
-            self.all_sprites,
-            self.obstacle_sprites,
-            self.spawn_enemy_at_pos,
-            self.player,
-        )
+        self.ui = None
+        self.music = None
+        self.player = None
+        self.map_manager = None
+        self.flow_field = None
+        self.systems = None
 
         self.font = pygame.font.Font(
             os.path.join('assets', 'DungeonFont.ttf'), 24
         )
-        self.game_state = 'menu'
+        self.game_state = 'loading'
+        self.loading_target = 'menu'
+        self.reset_on_load = False
 
         self.start_time = 0
         self.final_time = 0
         self.elapsed_time_on_load = 0
         self.kill_stats: Dict[str, int] = {}
 
+        # czas (ms) czekający na kolejne ticki i położenie klatki między tickami
+        self.accumulator = 0.0
+        self.interpolation = 1.0
+        # symulacja w osobnym wątku równolegle z rysowaniem (None = kolejno)
+        self.pipeline = FramePipeline(self) if pipelined else None
+
+    def setup_window(self) -> None:
+        """Ikona okna i kursor myszy"""
+        icon_surface = asset_cache.get_image(config.ICON_PATH)
+        pygame.display.set_icon(icon_surface)
+        if self.headless:
+            return
+
+        cursor_image = asset_cache.get_image(
+            os.path.join('assets', 'ui', 'cursor.png'), (32, 32)
+        )
+        cursor = pygame.cursors.Cursor((0, 0), cursor_image)
+        pygame.mouse.set_cursor(cursor)
+
+    def setup_world(self) -> None:
+        """Tworzenie gracza i menedżera mapy"""
+        self.setup_player()
+        self.map_manager = MapManager(
+            self.all_sprites,
+            self.obstacle_sprites,
+            self.spawn_director.request,
+            self.player,
+        )
+        self.player.wall_grid = self.map_manager
+        self.factory.prewarm(config.POOL_PREWARM)
+        death_effects.prewarm(config.POOL_PREWARM.get('death_effect', 0))
+        self.flow_field = FlowField()
+        self.systems = SystemPipeline([
+            PlayerSystem(self.player),
+            EnemySystem(
+                self.enemy_group,
+                self.player,
+                self.map_manager,
+                self.flow_field,
+                self.ai_scheduler,
+            ),
+            ProjectileSystem(self.projectiles),
+            EffectSystem(self.effect_group),
+        ])
+
+    def update_loading(self) -> None:
+        """Odbiór zasobów wczytanych w tle i przygotowanie kolejnych stanów"""
+        self.preloader.poll()
+
+        if self.ui is None and self.preloader.is_ready('menu'):
+            phase_start = time.perf_counter()
+            self.setup_window()
+            self.ui = UI()
+            if not self.headless:
+                self.setup_music()
+            self.startup_phases['menu_setup'] = time.perf_counter() - phase_start
+
+        if self.player is None and self.preloader.is_ready('game'):
+            phase_start = time.perf_counter()
+            self.setup_world()
+            self.startup_phases['world_setup'] = time.perf_counter() - phase_start
+
+        if (
+            self.game_state == 'loading'
+            and self.preloader.is_ready(self.loading_target)
+            and self.ui is not None
+            and (self.loading_target != 'game' or self.player is not None)
+        ):
+            if self.loading_target == 'menu':
+                self.startup_phases['menu_ready'] = (
+                    time.perf_counter() - self.startup_begin
+                )
+            if self.reset_on_load:
+                self.reset_on_load = False
+                self.reset_game()
+            self.game_state = self.loading_target
+
+        if not self.startup_reported and self.preloader.is_finished():
+            self.startup_reported = True
+            self.preloader.shutdown()
+            self.report_startup()
+
+    def report_startup(self) -> None:
+        """Wypisz czasy poszczególnych etapów uruchamiania gry"""
+        for group, seconds in self.preloader.timings.items():
+            self.startup_phases[f'assets_{group}'] = seconds
+        self.startup_phases['total'] = time.perf_counter() - self.startup_begin
+
+        phases = ', '.join(
+            f"{name}: {seconds * 1000:.0f} ms"
+            for name, seconds in self.startup_phases.items()
+        )
+        print(f"Czas uruchamiania - {phases}")
+
+    def start_game(self, reset: bool) -> None:
+        """Przejście do rozgrywki, z ekranem wczytywania jeśli zasoby nie są gotowe"""
+        if self.player is None or not self.preloader.is_ready('game'):
+            self.reset_on_load = reset
+            self.loading_target = 'game'
+            self.game_state = 'loading'
+            return
+
+        if reset:
+            self.reset_game()
+        self.game_state = 'game'
+
     def setup_player(self) -> None:
         """Tworzenie gracza i ładowanie zapisu gry"""
         save_data = SaveManager.load_game()
@@ -74,44 +212,15 @@ class Game:
             (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2),
             [self.all_sprites],
             self.obstacle_sprites,
-            self.player_bullets,
+            self.projectiles,
             save_data=save_data,
         )
+        self.player.input_source = self.input_source
 
     def setup_music(self) -> None:
         """Inicjalizacja muzyki w tle"""
-        music_folder = os.path.join('assets', 'music')
-        self.playlist = []
-
-        if os.path.exists(music_folder):
-            for file in os.listdir(music_folder):
-                if file.endswith('.mp3') or file.endswith('.ogg'):
-                    self.playlist.append(os.path.join(music_folder, file))
-
-        self.current_track = 0
-
-        if self.playlist:
-            self.play_music()
-    
-    def play_music(self) -> None:
-        """Odtwarzanie muzyki z playlisty"""
-        if self.playlist:
-            try:
-                pygame.mixer.music.load(self.playlist[self.current_track])
-                pygame.mixer.music.set_volume(config.MUSIC_VOLUME)
-                pygame.mixer.music.play()
-
-                self.MUSIC_END = pygame.USEREVENT + 1
-                pygame.mixer.music.set_endevent(self.MUSIC_END)
-            except pygame.error:
-                print("Błąd odtwarzania pliku muzycznego")
-
-    def update_playlist(self) -> None:
-        """Aktualizacja playlisty muzycznej"""
-        self.current_track += 1
-        if self.current_track >= len(self.playlist):
-            self.current_track = 0
-        self.play_music()
+        self.music = MusicPlaylist(os.path.join('assets', 'music'))
+        self.music.start()
 
     def setup_enemies(self) -> None:
         """Tworzenie enemy"""
@@ -120,115 +229,71 @@ class Game:
             (600, 100),
             [self.all_sprites, self.enemy_group],
             self.player,
-            self.enemy_bullets,
+            self.projectiles,
             self.obstacle_sprites,
         )
         current_level_factory.create_politician(
             (500, 150),
             [self.all_sprites, self.enemy_group],
             self.player,
-            self.player_bullets,
+            self.projectiles,
             self.obstacle_sprites,
         )
         current_level_factory.create_butcher(
             (400, 150),
             [self.all_sprites, self.enemy_group],
             self.player,
-            self.player_bullets,
+            self.projectiles,
             self.obstacle_sprites,
         )
         current_level_factory.create_bat(
             (300, 150),
             [self.all_sprites, self.enemy_group],
             self.player,
-            self.player_bullets,
+            self.projectiles,
             self.obstacle_sprites,
         )
 
     def check_collision(self) -> None:
         """Sprawdzanie kolizji między obiektami"""
-        for sprite in list(self.player_bullets):
-            if hasattr(sprite, 'sprite_type') and sprite.sprite_type in [
-                'wall',
-                'enemy',
-            ]:
-                print(
-                    f"ERROR: Found {sprite.sprite_type} in player_bullets group! "
-                    "Removing it."
-                )
-                sprite.kill()
+        hits = self.projectiles.collide(self.enemy_group.sprites(), OWNER_PLAYER)
+        for enemy, damage in hits:
+            if enemy.take_damage(damage):
+                name = enemy.enemy_type.name
 
-        hits = pygame.sprite.groupcollide(
-            self.enemy_group, self.player_bullets, False, False, collide_hitbox
-        )
-        if hits:
-            bullets_to_remove = []
-            for enemy in hits:
-                bullets = hits[enemy]
-                valid_bullets = [
-                    b
-                    for b in bullets
-                    if hasattr(b, 'type') and b.type == 'player'
-                ]
-                if valid_bullets:
-                    was_alive = enemy.health > 0
-                    for bullet in valid_bullets:
-                        is_piercing = getattr(bullet, 'power', 1) == 2
-                        enemy_id = id(enemy)
-                        if is_piercing:
-                            if enemy_id not in bullet.hit_enemies:
-                                damage = 20
-                                enemy.take_damage(damage)
-                                bullet.hit_enemies.add(enemy_id)
-                        else:
-                            damage = getattr(bullet, 'damage', 10)
-                            enemy.take_damage(damage)
-                            bullets_to_remove.append(bullet)
-
-                    if was_alive and enemy.health <= 0:
-                        name = getattr(enemy, 'enemy_name', 'unknown')
-
-                        try:
-                            self.kill_stats[name] += 1
-                        except KeyError:
-                            self.kill_stats[name] = 1
-
-                        print(self.kill_stats)
-                        self.player.gain_xp(enemy.xp_reward)
-
-            for bullet in bullets_to_remove:
-                bullet.kill()
-
-        hits = pygame.sprite.spritecollide(
-            self.player, self.enemy_bullets, True
-        )
-        if hits:
-            for bullet in hits:
-                self.player.health -= 10
-                print(f"HP Gracza: {self.player.health}")
-                self.player.take_damage(10)
-
-        pygame.sprite.groupcollide(
-            self.player_bullets, self.obstacle_sprites, True, False, collide_hitbox
-        )
-        if hasattr(self, 'enemy_bullets'):
-            pygame.sprite.groupcollide(
-                self.enemy_bullets, self.obstacle_sprites, True, False
-            )
+                try:
+                    self.kill_stats[name] += 1
+                except KeyError:
+                    self.kill_stats[name] = 1
 
-        body_hits = pygame.sprite.spritecollide(
-            self.player, self.enemy_group, False
+                print(self.kill_stats)
+                self.player.gain_xp(enemy.enemy_type.xp_reward)
+
+        hits = self.projectiles.collide(
+            [self.player], OWNER_ENEMY, attr='rect', use_hitbox=False
         )
+        for _ in hits:
+            self.player.health -= 10
+            print(f"HP Gracza: {self.player.health}")
+            self.player.take_damage(10)
+
+        self.projectiles.collide_walls(self.map_manager)
+
+        body_hits = self.enemy_group.query_rect(self.player.rect)
+        if config.PRECISE_COLLISION:
+            body_hits = [
+                enemy for enemy in body_hits if collide_masks(self.player, enemy)
+            ]
         if body_hits:
             self.player.take_damage(20)
 
         if self.player.health <= 0:
             self.game_state = 'game_over'
-            self.final_time = pygame.time.get_ticks() - self.start_time
+            self.final_time = sim_clock.ticks() - self.start_time
             SaveManager.delete_save()
 
-    def spawn_enemy_at_pos(self, pos: Tuple[float, float]) -> None:
-        """Tworzenie przeciwnika w określonej pozycji"""
+    def spawn_enemy_at_pos(self, pos: Tuple[float, float]) -> bool:
+        """Tworzenie przeciwnika w określonej pozycji (kandydaci z SpawnDirector)"""
         max_enemies = 120
 
         if self.player and hasattr(self.player, 'level'):
@@ -236,63 +301,158 @@ class Game:
             max_enemies = min(max_enemies, 200)
 
         if len(self.enemy_group) >= max_enemies:
-            return
+            return False
 
-        min_spawn_distance = 150
-        spawn_pos = pygame.math.Vector2(pos)
+        # kandydat z kolejki mógł zostać daleko za graczem
+        if self.player:
+            dx = pos[0] - self.player.rect.centerx
+            dy = pos[1] - self.player.rect.centery
+            if dx * dx + dy * dy > config.ENEMY_DESPAWN_DISTANCE ** 2:
+                return False
 
-        for enemy in self.enemy_group:
-            enemy_pos = pygame.math.Vector2(enemy.rect.center)
-            distance = (spawn_pos - enemy_pos).magnitude()
-            if distance < min_spawn_distance:
-                return
+        min_spawn_distance = 150
+        if self.enemy_group.query_radius(pos, min_spawn_distance):
+            return False
 
-        enemy_type = random.choice(
-            ['ghost', 'butcher', 'politician', 'bat', 'skeleton',
-             'black_magic', 'mage']
-        )
+        enemy_type = random.choice(enemy_types.names())
         groups = [self.all_sprites, self.enemy_group]
-        getattr(self.factory, f"create_{enemy_type}")(
-            pos, groups, self.player, self.enemy_bullets, self.obstacle_sprites
+        enemy = self.factory.spawn(
+            enemy_type, pos, groups, self.player, self.projectiles
         )
+        enemy.wall_grid = self.map_manager
+        enemy.effect_groups = [self.all_sprites, self.effect_group]
+        return True
 
     def reset_game(self) -> None:
         """Resetowanie stanu gry"""
+        # kill zamiast empty: przeciwnicy i efekty wracają do swoich pul
+        for sprite in [*self.enemy_group, *self.effect_group]:
+            sprite.kill()
         self.all_sprites.empty()
         self.obstacle_sprites.empty()
-        self.player_bullets.empty()
-        self.enemy_group.empty()
-        self.enemy_bullets.empty()
+        self.projectiles.clear()
+        self.spawn_director.clear()
+        timer_wheel.clear()
 
         self.kill_stats = {k: 0 for k in self.kill_stats}
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = sim_clock.ticks()
         self.elapsed_time_on_load = 0
 
         SaveManager.delete_save()
 
-        self.setup_player()
+        self.setup_world()
         self.player.level = 1
-        self.map_manager = MapManager(
-            self.all_sprites,
-            self.obstacle_sprites,
-            self.spawn_enemy_at_pos,
-            self.player,
+
+    def pool_stats(self) -> Dict[str, Dict[str, int]]:
+        """Liczniki pul przeciwników, efektów śmierci i pocisków"""
+        stats = self.factory.stats()
+        stats['death_effect'] = death_effects.stats()
+        stats['projectile'] = self.projectiles.stats()
+        return stats
+
+    def advance_simulation(self, frame_ms: float) -> int:
+        """Wykonaj tyle stałych kroków symulacji, ile czasu uzbierało się od ostatniej klatki"""
+        self.accumulator += min(frame_ms, config.MAX_FRAME_MS)
+        step_ms = sim_clock.step_ms
+
+        steps = 0
+        while (
+            self.accumulator >= step_ms
+            and steps < config.MAX_SIM_STEPS
+            and self.game_state == 'game'
+        ):
+            self.tick()
+            self.accumulator -= step_ms
+            steps += 1
+
+        # po limicie nadrabiania zaległy czas przepada, gra zwalnia zamiast się zacinać
+        if self.accumulator >= step_ms:
+            self.accumulator %= step_ms
+        self.interpolation = self.accumulator / step_ms
+        return steps
+
+    def tick(self) -> None:
+        """Jeden tick: migawka pozycji do interpolacji, krok symulacji i zegar"""
+        # ściany i efekty stoją w miejscu, więc nie potrzebują migawki
+        self.all_sprites.snapshot([self.player, *self.enemy_group.sprites()])
+        self.simulate()
+        sim_clock.advance()
+
+    def simulate(self) -> None:
+        """Jeden stały krok symulacji rozgrywki"""
+        # jeden znacznik czasu na tick: koło wywołuje należne timery
+        timer_wheel.advance(sim_clock.tick_count)
+        if self.start_time == 0:
+            self.start_time = sim_clock.ticks()
+        current_time = sim_clock.ticks()
+        self.final_time = (
+            (current_time - self.start_time) + self.elapsed_time_on_load
         )
 
+        if self.player.rect:
+            self.map_manager.update(self.player.rect.center)
+            self.spawn_director.update()
+            voices.set_listener(self.player.rect.center)
+            self.flow_field.update(self.map_manager, self.player.rect.center)
+
+        self.systems.update()
+
+        self.check_collision()
+
+    def capture_frame(self) -> FrameSnapshot:
+        """Migawka rozgrywki do narysowania, niezależna od dalszej symulacji"""
+        return FrameSnapshot(
+            self.all_sprites.capture(self.player),
+            HudState.capture(self.player),
+            self.interpolation,
+        )
+
+    def draw_frame(self, snapshot: FrameSnapshot) -> None:
+        self.screen.fill('black')
+        self.all_sprites.draw_snapshot(snapshot.world, snapshot.interpolation)
+        self.ui.display(snapshot.hud)
+
+    def play_frame(self, frame_ms: float) -> None:
+        """Symulacja i rysowanie klatki rozgrywki, kolejno lub potokowo"""
+        if self.pipeline is None:
+            self.advance_simulation(frame_ms)
+            snapshot = self.capture_frame()
+        else:
+            snapshot = self.pipeline.advance(frame_ms)
+        self.draw_frame(snapshot)
+
+    def quit(self) -> None:
+        """Zwolnij wątki robocze i zakończ program"""
+        if self.pipeline is not None:
+            self.pipeline.shutdown()
+        self.preloader.shutdown()
+        pygame.quit()
+        sys.exit()
+
     def run(self) -> None:
         """Główna pętla gry"""
         while True:
             events = pygame.event.get()
+            if self.pipeline is not None:
+                # stan gry zmieniany w wątku głównym tylko przy wstrzymanej symulacji
+                self.pipeline.finish()
 
             for event in events:
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
+
+            if not self.startup_reported:
+                self.update_loading()
 
-                if hasattr(self, 'MUSIC_END') and event.type == self.MUSIC_END:
-                    self.update_playlist()
+            if self.music:
+                self.music.update()
 
-            if self.game_state == 'menu':
+            if self.game_state == 'loading':
+                self.loading_screen.draw(
+                    self.preloader.progress(self.loading_target)
+                )
+
+            elif self.game_state == 'menu':
                 self.ui.show_menu()
 
                 for event in events:
@@ -300,52 +460,24 @@ class Game:
                         SaveManager.has_save()
                         and self.ui.continue_button.is_clicked(event)
                     ):
-                        self.game_state = 'game'
+                        self.start_game(reset=False)
                     elif self.ui.play_button.is_clicked(event):
-                        self.reset_game()
-                        self.game_state = 'game'
+                        self.start_game(reset=True)
                     elif self.ui.exit_button.is_clicked(event):
-                        pygame.quit()
-                        sys.exit()
+                        self.quit()
                     elif event.type == pygame.KEYDOWN:
                         if event.key == pygame.K_SPACE:
-                            self.reset_game()
-                            self.game_state = 'game'
+                            self.start_game(reset=True)
                         elif event.key == pygame.K_ESCAPE:
-                            pygame.quit()
-                            sys.exit()
+                            self.quit()
 
             elif self.game_state == 'game':
-                self.screen.fill('black')
-
-                if self.start_time == 0:
-                    self.start_time = pygame.time.get_ticks()
-                current_time = pygame.time.get_ticks()
-                self.final_time = (
-                    (current_time - self.start_time) + self.elapsed_time_on_load
-                )
-
                 for event in events:
                     if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                         SaveManager.save_game(self.player, self.final_time)
                         self.game_state = 'menu'
 
-                if self.player.rect:
-                    self.map_manager.update(self.player.rect.center)
-
-                for sprite in self.all_sprites:
-                    if (
-                        hasattr(sprite, 'sprite_type')
-                        and sprite.sprite_type == 'enemy'
-                    ):
-                        sprite.update(self.enemy_group)
-                    else:
-                        sprite.update()
-
-                self.check_collision()
-
-                self.all_sprites.custom_draw(self.player)
-                self.ui.display(self.player)
+                self.play_frame(self.clock.get_time())
 
             elif self.game_state == 'game_over':
                 self.ui.show_game_over(
@@ -361,4 +493,8 @@ class Game:
                             self.game_state = 'menu'
 
             pygame.display.flip()
-            self.clock.tick(config.FPS)
\ No newline at end of file
+            # symulacja ma stały krok, więc rozgrywka może rysować częściej niż ticki
+            if self.game_state == 'game':
+                self.clock.tick(config.MAX_RENDER_FPS)
+            else:
+                self.clock.tick(config.FPS)
\ No newline at end of file
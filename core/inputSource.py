@@ -0,0 +1,78 @@
+from typing import Callable, Iterable, Sequence, Set, Tuple
+
+import pygame
+
+# stan wejścia w jednym ticku: (wciśnięte klawisze, przyciski myszy, pozycja myszy)
+InputState = Tuple[Iterable[int], Sequence[bool], Tuple[int, int]]
+
+
+class InputSource:
+    """Klawiatura i mysz czytane bezpośrednio z pygame"""
+    def keys(self):
+        return pygame.key.get_pressed()
+
+    def mouse_buttons(self) -> Sequence[bool]:
+        return pygame.mouse.get_pressed()
+
+    def mouse_pos(self) -> Tuple[int, int]:
+        return pygame.mouse.get_pos()
+
+
+class PressedKeys:
+    """Zbiór wciśniętych klawiszy indeksowany jak wynik pygame.key.get_pressed()"""
+    def __init__(self, pressed: Iterable[int]) -> None:
+        self.pressed: Set[int] = set(pressed)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+class ScriptedInput(InputSource):
+    """Wejście z programu: script(tick) zwraca stan klawiszy i myszy dla danego ticku"""
+    def __init__(self, script: Callable[[int], InputState]) -> None:
+        self.script = script
+        self.tick = -1
+        self.advance()
+
+    def advance(self) -> None:
+        """Przejdź do następnego ticku skryptu (wywoływać przed każdym krokiem gry)"""
+        self.tick += 1
+        keys, buttons, pos = self.script(self.tick)
+        self._keys = PressedKeys(keys)
+        self._buttons = tuple(buttons)
+        self._pos = pos
+
+    def keys(self) -> PressedKeys:
+        return self._keys
+
+    def mouse_buttons(self) -> Sequence[bool]:
+        return self._buttons
+
+    def mouse_pos(self) -> Tuple[int, int]:
+        return self._pos
+
+
+class SampledInput(InputSource):
+    """Stan wejścia odczytany w wątku głównym, podawany symulacji w innym wątku"""
+    def __init__(self) -> None:
+        self._keys = PressedKeys(())
+        self._buttons: Sequence[bool] = (False, False, False)
+        self._pos: Tuple[int, int] = (0, 0)
+
+    def sample(self, source: InputSource) -> None:
+        """Zapamiętaj bieżący stan źródła (wywoływać w wątku głównym)"""
+        self._keys = source.keys()
+        self._buttons = tuple(source.mouse_buttons())
+        self._pos = tuple(source.mouse_pos())
+
+    def keys(self):
+        return self._keys
+
+    def mouse_buttons(self) -> Sequence[bool]:
+        return self._buttons
+
+    def mouse_pos(self) -> Tuple[int, int]:
+        return self._pos
+
+
+pygame_input = InputSource()
@@ -1,11 +1,16 @@
+import math
 import random
-from typing import Callable, Dict, List, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pygame
 
 import config
 from entities.tile import Tile
 
+# odległość hitboxu ściany od krawędzi kafelka (Tile.hitbox = inflate(-40, -40))
+WALL_HITBOX_INSET = 20
+
 
 class MapManager:
     """Zarządzanie generowaniem i ładowaniem mapy gry"""
@@ -21,6 +26,8 @@ class MapManager:
         self.spawn_callback = spawn_callback
         self.player = player
         self.active_chunks: Dict[Tuple[int, int], List[Tile]] = {}
+        self.occupancy: Dict[Tuple[int, int], bytearray] = {}
+        self._grid: Optional[Tuple[np.ndarray, int, int]] = None
 
         self.CHUNK_SIZE_TILES = 20
         self.CHUNK_PIXEL_SIZE = self.CHUNK_SIZE_TILES * config.TILE_SIZE
@@ -29,6 +36,9 @@ class MapManager:
         self.SPAWN_THROTTLE_FRAMES = 10
         self.frame_counter: int = 0
 
+        self.rays_cast: int = 0
+        self.cells_checked: int = 0
+
     def update(self, player_pos: Tuple[float, float]) -> None:
         """Aktualizuj aktywne chunk'i na podstawie pozycji gracza"""
         px, py = player_pos
@@ -109,8 +119,11 @@ class MapManager:
                     wall_positions.add((col, row))
 
         chunk_walls: List[Tile] = []
+        occupancy = bytearray(self.CHUNK_SIZE_TILES * self.CHUNK_SIZE_TILES)
 
         for col, row in wall_positions:
+            occupancy[row * self.CHUNK_SIZE_TILES + col] = 1
+
             tile_x = start_x + (col * config.TILE_SIZE)
             tile_y = start_y + (row * config.TILE_SIZE)
 
@@ -138,6 +151,8 @@ class MapManager:
             chunk_walls.append(wall)
 
         self.active_chunks[chunk_coord] = chunk_walls
+        self.occupancy[chunk_coord] = occupancy
+        self._grid = None
 
     def unload_chunk(self, chunk_coord: Tuple[int, int]) -> None:
         """Usuń chunk i jego ściany z aktywnych chunk'ów"""
@@ -146,4 +161,114 @@ class MapManager:
         for wall in walls:
             wall.kill()
 
-        del self.active_chunks[chunk_coord]
\ No newline at end of file
+        del self.active_chunks[chunk_coord]
+        del self.occupancy[chunk_coord]
+        self._grid = None
+
+    def is_wall(self, col: int, row: int) -> bool:
+        """Czy w kafelku o globalnych współrzędnych (col, row) stoi ściana"""
+        size = self.CHUNK_SIZE_TILES
+        occupancy = self.occupancy.get((col // size, row // size))
+        return occupancy is not None and occupancy[(row % size) * size + col % size] == 1
+
+    @staticmethod
+    def wall_rect(col: int, row: int, hitbox: bool = True) -> pygame.Rect:
+        """Prostokąt ściany; hitbox odpowiada Tile.hitbox"""
+        tile = config.TILE_SIZE
+        rect = pygame.Rect(col * tile, row * tile, tile, tile)
+        if hitbox:
+            return rect.inflate(-2 * WALL_HITBOX_INSET, -2 * WALL_HITBOX_INSET)
+        return rect
+
+    def walls_near(
+        self, rect: pygame.Rect, hitbox: bool = True, margin: int = 1
+    ) -> List[pygame.Rect]:
+        """Prostokąty ścian z kafelków pokrywanych przez rect (plus margines w kafelkach)"""
+        tile = config.TILE_SIZE
+        first_col = rect.left // tile - margin
+        last_col = (rect.right - 1) // tile + margin
+        first_row = rect.top // tile - margin
+        last_row = (rect.bottom - 1) // tile + margin
+
+        size = self.CHUNK_SIZE_TILES
+        walls = []
+        for row in range(first_row, last_row + 1):
+            chunk_y = row // size
+            row_offset = (row % size) * size
+            for col in range(first_col, last_col + 1):
+                occupancy = self.occupancy.get((col // size, chunk_y))
+                if occupancy is not None and occupancy[row_offset + col % size]:
+                    walls.append(self.wall_rect(col, row, hitbox))
+        return walls
+
+    def rect_hits_wall(self, rect: pygame.Rect, hitbox: bool = True) -> bool:
+        """Czy prostokąt nachodzi na hitbox (lub cały kafelek) którejkolwiek ściany"""
+        return any(
+            wall.colliderect(rect) for wall in self.walls_near(rect, hitbox, margin=0)
+        )
+
+    def line_of_sight(
+        self, start: Tuple[float, float], end: Tuple[float, float]
+    ) -> bool:
+        """Czy odcinek start-end omija kafelki ze ścianami (DDA po siatce kafelków)"""
+        self.rays_cast += 1
+        tile = config.TILE_SIZE
+        x0, y0 = start[0] / tile, start[1] / tile
+        x1, y1 = end[0] / tile, end[1] / tile
+        col, row = math.floor(x0), math.floor(y0)
+        steps = abs(math.floor(x1) - col) + abs(math.floor(y1) - row)
+
+        dx = x1 - x0
+        dy = y1 - y0
+        step_col = 1 if dx > 0 else -1
+        step_row = 1 if dy > 0 else -1
+        # parametr t (0..1 wzdłuż odcinka), przy którym promień przetnie kolejną krawędź
+        if dx:
+            t_max_x = (col + (dx > 0) - x0) / dx
+            t_delta_x = abs(1 / dx)
+        else:
+            t_max_x = t_delta_x = math.inf
+        if dy:
+            t_max_y = (row + (dy > 0) - y0) / dy
+            t_delta_y = abs(1 / dy)
+        else:
+            t_max_y = t_delta_y = math.inf
+
+        for _ in range(steps + 1):
+            self.cells_checked += 1
+            if self.is_wall(col, row):
+                return False
+            if t_max_x < t_max_y:
+                col += step_col
+                t_max_x += t_delta_x
+            else:
+                row += step_row
+                t_max_y += t_delta_y
+        return True
+
+    def occupancy_grid(self) -> Tuple[np.ndarray, int, int]:
+        """Gęsta tablica zajętości [wiersz, kolumna] aktywnych chunk'ów i jej początek w kafelkach"""
+        if self._grid is not None:
+            return self._grid
+
+        size = self.CHUNK_SIZE_TILES
+        if not self.occupancy:
+            self._grid = (np.zeros((0, 0), dtype=bool), 0, 0)
+            return self._grid
+
+        chunk_xs = [x for x, _ in self.occupancy]
+        chunk_ys = [y for _, y in self.occupancy]
+        min_x, min_y = min(chunk_xs), min(chunk_ys)
+        grid = np.zeros(
+            ((max(chunk_ys) - min_y + 1) * size, (max(chunk_xs) - min_x + 1) * size),
+            dtype=bool,
+        )
+        for (x, y), occupancy in self.occupancy.items():
+            row = (y - min_y) * size
+            col = (x - min_x) * size
+            grid[row:row + size, col:col + size] = np.frombuffer(
+                occupancy, dtype=np.uint8
+            ).reshape(size, size)
+
+        self._grid = (grid, min_x * size, min_y * size)
+        return self._grid
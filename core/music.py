@@ -0,0 +1,110 @@
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional
+
+import pygame
+
+import config
+
+
+class MusicPlaylist:
+    """Playlista, która dekoduje następny utwór w tle i zmienia utwory z przenikaniem"""
+    def __init__(
+        self,
+        music_folder: str,
+        crossfade_ms: int = config.MUSIC_CROSSFADE_MS,
+        first_channel: int = config.SFX_CHANNELS,
+    ) -> None:
+        self.tracks: List[str] = []
+        if os.path.exists(music_folder):
+            for file in sorted(os.listdir(music_folder)):
+                if file.endswith('.mp3') or file.endswith('.ogg'):
+                    self.tracks.append(os.path.join(music_folder, file))
+
+        self.crossfade_ms = crossfade_ms
+        self.channels: List[pygame.mixer.Channel] = []
+        if pygame.mixer.get_init() and self.tracks:
+            if pygame.mixer.get_num_channels() < first_channel + 2:
+                pygame.mixer.set_num_channels(first_channel + 2)
+            self.channels = [
+                pygame.mixer.Channel(first_channel),
+                pygame.mixer.Channel(first_channel + 1),
+            ]
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='music'
+        )
+        self.current_track = -1
+        self.current_channel = 0
+        self.current_sound: Optional[pygame.mixer.Sound] = None
+        self.next_track: Optional[Future] = None
+
+        self.started_at = 0.0
+        self.switch_due: Optional[float] = None
+        self.switch_latencies: List[float] = []
+
+    @staticmethod
+    def decode(path: str) -> Optional[pygame.mixer.Sound]:
+        """Dekodowanie całego utworu poza głównym wątkiem"""
+        try:
+            sound = pygame.mixer.Sound(path)
+        except (FileNotFoundError, pygame.error):
+            print(f"Błąd odtwarzania pliku muzycznego: {path}")
+            return None
+        sound.set_volume(config.MUSIC_VOLUME)
+        return sound
+
+    def start(self) -> None:
+        """Rozpocznij dekodowanie pierwszego utworu"""
+        if self.channels and self.next_track is None:
+            self.prepare_next()
+            self.switch_due = time.perf_counter()
+
+    def prepare_next(self) -> None:
+        index = (self.current_track + 1) % len(self.tracks)
+        self.next_track = self.executor.submit(self.decode, self.tracks[index])
+
+    def update(self) -> None:
+        """Sprawdź, czy pora przejść do następnego utworu (wywoływane co klatkę)"""
+        if not self.channels or self.next_track is None:
+            return
+
+        now = time.perf_counter()
+        if self.switch_due is None and self.current_sound is not None:
+            fade_s = self.crossfade_ms / 1000
+            length = self.current_sound.get_length()
+            if now - self.started_at >= max(0.0, length - fade_s):
+                self.switch_due = now
+
+        if self.switch_due is not None and self.next_track.done():
+            self.switch(now)
+
+    def switch(self, now: float) -> None:
+        """Przełącz na przygotowany utwór bez dekodowania w głównym wątku"""
+        sound = self.next_track.result()
+        self.current_track = (self.current_track + 1) % len(self.tracks)
+        self.prepare_next()
+
+        if sound is None:
+            return
+
+        fade_ms = 0
+        if self.current_sound is not None:
+            self.channels[self.current_channel].fadeout(self.crossfade_ms)
+            self.current_channel = 1 - self.current_channel
+            fade_ms = self.crossfade_ms
+
+        self.current_sound = sound
+        self.channels[self.current_channel].play(sound, fade_ms=fade_ms)
+
+        self.switch_latencies.append(time.perf_counter() - self.switch_due)
+        self.started_at = now
+        self.switch_due = None
+
+    @property
+    def last_switch_latency_ms(self) -> float:
+        """Opóźnienie ostatniej zmiany utworu względem momentu, gdy była potrzebna"""
+        if not self.switch_latencies:
+            return 0.0
+        return self.switch_latencies[-1] * 1000
@@ -0,0 +1,57 @@
+from typing import Callable, Dict, List, Set
+
+
+class ObjectPool:
+    """Pula obiektów używanych ponownie zamiast konstruowania nowych.
+
+    create buduje nieaktywny obiekt; pula zapisuje się w jego atrybucie pool,
+    a obiekt wraca do niej przez release (zwykle z kill). Przywrócenie stanu
+    pobranego obiektu należy do wołającego.
+    """
+    def __init__(self, create: Callable[[], object], prewarm: int = 0) -> None:
+        self.create = create
+        self.free: List[object] = []
+        self.live: Set[object] = set()
+
+        self.peak: int = 0
+        self.created: int = 0
+        self.reused: int = 0
+        self.prewarm(prewarm)
+
+    def build(self) -> object:
+        obj = self.create()
+        obj.pool = self
+        self.created += 1
+        return obj
+
+    def prewarm(self, count: int) -> None:
+        """Utwórz z góry obiekty, aby pula miała ich łącznie co najmniej count"""
+        for _ in range(count - len(self.free) - len(self.live)):
+            self.free.append(self.build())
+
+    def acquire(self) -> object:
+        """Wolny obiekt z puli albo nowy, gdy pula jest pusta"""
+        if self.free:
+            obj = self.free.pop()
+            self.reused += 1
+        else:
+            obj = self.build()
+        self.live.add(obj)
+        self.peak = max(self.peak, len(self.live))
+        return obj
+
+    def release(self, obj) -> None:
+        """Oddaj obiekt do puli; ponowne oddanie jest ignorowane"""
+        if obj in self.live:
+            self.live.remove(obj)
+            self.free.append(obj)
+
+    def stats(self) -> Dict[str, int]:
+        """Zwróć liczniki puli"""
+        return {
+            'live': len(self.live),
+            'free': len(self.free),
+            'peak': self.peak,
+            'created': self.created,
+            'reused': self.reused,
+        }
@@ -0,0 +1,122 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+import config
+from core.assetCache import asset_cache
+from core.assetManifest import AssetEntry
+
+
+class Preloader:
+    """Równoległe dekodowanie zasobów w tle, podzielone na grupy stanów gry"""
+    def __init__(self, workers: int = config.PRELOAD_WORKERS) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='preload'
+        )
+
+        # grupa -> lista (future, funkcja kończąca wywoływana w głównym wątku)
+        self._pending: Dict[str, List[Tuple[Future, Optional[Callable]]]] = {}
+        self._totals: Dict[str, int] = {}
+        self._started: Dict[str, float] = {}
+        self.timings: Dict[str, float] = {}
+
+    def submit(
+        self,
+        group: str,
+        load: Callable[[], Any],
+        finish: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        """Dodaj zadanie: load w wątku roboczym, finish w głównym wątku"""
+        self._started.setdefault(group, time.perf_counter())
+        self._pending.setdefault(group, []).append(
+            (self.executor.submit(load), finish)
+        )
+        self._totals[group] = self._totals.get(group, 0) + 1
+
+    def load_images(self, group: str, entries: List[AssetEntry]) -> None:
+        """Zleć dekodowanie obrazów grupy w tle"""
+        for path, size, alpha in entries:
+            self.submit(
+                group,
+                lambda p=path, s=size, a=alpha: self._decode(p, s, a),
+                lambda surface, p=path, s=size, a=alpha: self._store(
+                    p, s, a, surface
+                ),
+            )
+
+    @staticmethod
+    def _decode(
+        path: str, size: Optional[Tuple[int, int]], alpha: bool
+    ) -> Optional[pygame.Surface]:
+        """Dekodowanie i skalowanie obrazu poza głównym wątkiem"""
+        if asset_cache.pack and asset_cache.pack.has(path, size, alpha):
+            return None
+
+        try:
+            surface = pygame.image.load(path)
+        except FileNotFoundError:
+            print(f"Nie znaleziono pliku: {path}")
+            return None
+
+        if size is not None and surface.get_size() != tuple(size):
+            surface = pygame.transform.scale(surface, size)
+        return surface
+
+    @staticmethod
+    def _store(
+        path: str,
+        size: Optional[Tuple[int, int]],
+        alpha: bool,
+        surface: Optional[pygame.Surface],
+    ) -> None:
+        """Konwersja do formatu ekranu i zapis w cache (główny wątek)"""
+        if surface is not None:
+            asset_cache.add_decoded(path, size, alpha, surface)
+        elif asset_cache.pack:
+            asset_cache.get_image(path, size, alpha=alpha)
+
+    def poll(self) -> None:
+        """Dokończ w głównym wątku zadania, których dekodowanie się zakończyło"""
+        for group, tasks in self._pending.items():
+            if not tasks:
+                continue
+
+            remaining = []
+            for future, finish in tasks:
+                if not future.done():
+                    remaining.append((future, finish))
+                    continue
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Błąd wczytywania zasobu ({group}): {e}")
+                    continue
+
+                if finish:
+                    finish(result)
+
+            self._pending[group] = remaining
+            if not remaining and group not in self.timings:
+                self.timings[group] = time.perf_counter() - self._started[group]
+
+    def is_ready(self, group: str) -> bool:
+        """Czy wszystkie zasoby grupy są już gotowe"""
+        return not self._pending.get(group)
+
+    def progress(self, group: str) -> float:
+        """Postęp wczytywania grupy w zakresie 0-1"""
+        total = self._totals.get(group, 0)
+        if total == 0:
+            return 1.0
+        return 1 - len(self._pending.get(group, [])) / total
+
+    def is_finished(self) -> bool:
+        """Czy wszystkie zlecone grupy zostały wczytane"""
+        return all(not tasks for tasks in self._pending.values())
+
+    def shutdown(self) -> None:
+        """Zwolnij wątki robocze"""
+        self.executor.shutdown(wait=False)
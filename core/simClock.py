@@ -0,0 +1,18 @@
+import config
+
+
+class SimClock:
+    """Czas symulacji w milisekundach, przesuwany o stały krok przy każdym ticku"""
+    def __init__(self, tick_rate: int = config.SIM_TICK_RATE) -> None:
+        self.step_ms = 1000 / tick_rate
+        self.tick_count: int = 0
+
+    def advance(self) -> None:
+        self.tick_count += 1
+
+    def ticks(self) -> int:
+        """Odpowiednik pygame.time.get_ticks() liczony w czasie symulacji"""
+        return int(self.tick_count * self.step_ms)
+
+
+sim_clock = SimClock()
@@ -0,0 +1,54 @@
+class SlottedSprite:
+    """Sprite bez __dict__: protokół pygame.sprite.Sprite ze stanem w slotach.
+
+    pygame.sprite.Sprite nie ma __slots__, więc każda jego podklasa ma __dict__.
+    Grupy pygame przyjmują też obiekty spoza tej klasy, jeśli mają add_internal
+    i remove_internal (gałąź dla starych sprite'ów w Group.add/remove/has).
+    """
+    __slots__ = ('_groups',)
+
+    def __init__(self, *groups) -> None:
+        self._groups = set()
+        if groups:
+            self.add(*groups)
+
+    def add(self, *groups) -> None:
+        for group in groups:
+            if hasattr(group, '_spritegroup'):
+                if group not in self._groups:
+                    group.add_internal(self)
+                    self.add_internal(group)
+            else:
+                self.add(*group)
+
+    def remove(self, *groups) -> None:
+        for group in groups:
+            if hasattr(group, '_spritegroup'):
+                if group in self._groups:
+                    group.remove_internal(self)
+                    self.remove_internal(group)
+            else:
+                self.remove(*group)
+
+    def add_internal(self, group) -> None:
+        self._groups.add(group)
+
+    def remove_internal(self, group) -> None:
+        self._groups.remove(group)
+
+    def update(self, *args, **kwargs) -> None:
+        pass
+
+    def kill(self) -> None:
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups.clear()
+
+    def groups(self) -> list:
+        return list(self._groups)
+
+    def alive(self) -> bool:
+        return bool(self._groups)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} Sprite(in {len(self._groups)} groups)>"
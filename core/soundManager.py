@@ -0,0 +1,186 @@
+import os
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+import config
+
+# nazwa -> (ścieżka, kategoria, priorytet)
+SOUND_EFFECTS: Dict[str, Tuple[str, str, int]] = {
+    'attack': (os.path.join('assets', 'sfx', 'attack.mp3'), 'attack', 3),
+    'step': (os.path.join('assets', 'sfx', 'walking_1.wav'), 'step', 1),
+    'level_up': (os.path.join('assets', 'sfx', 'next_level.mp3'), 'ui', 5),
+    'enemy_die': (os.path.join('assets', 'sfx', 'die.mp3'), 'enemy', 2),
+}
+
+
+class SoundBank:
+    """Efekty dźwiękowe dekodowane raz i współdzielone przez całą grę"""
+    def __init__(self) -> None:
+        self._sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
+
+    @staticmethod
+    def decode(path: str) -> Optional[pygame.mixer.Sound]:
+        """Zdekoduj plik dźwiękowy (może być wywołane w wątku roboczym)"""
+        if not pygame.mixer.get_init():
+            return None
+
+        try:
+            sound = pygame.mixer.Sound(path)
+        except FileNotFoundError:
+            print(f"Nie znaleziono pliku dźwiękowego: {path}")
+            return None
+        sound.set_volume(config.SFX_VOLUME)
+        return sound
+
+    def add(self, name: str, sound: Optional[pygame.mixer.Sound]) -> None:
+        self._sounds[name] = sound
+
+    def get(self, name: str) -> Optional[pygame.mixer.Sound]:
+        """Zwróć zdekodowany efekt, wczytując go przy pierwszym użyciu"""
+        if name not in self._sounds:
+            self._sounds[name] = self.decode(SOUND_EFFECTS[name][0])
+        return self._sounds[name]
+
+    def preload(self, preloader, group: str) -> None:
+        """Zleć dekodowanie wszystkich efektów w tle"""
+        for name, (path, _, _) in SOUND_EFFECTS.items():
+            preloader.submit(
+                group,
+                lambda p=path: self.decode(p),
+                lambda sound, n=name: self.add(n, sound),
+            )
+
+
+class Voice:
+    """Informacje o efekcie odtwarzanym na danym kanale"""
+    def __init__(self, category: str, priority: float, started: int) -> None:
+        self.category = category
+        self.priority = priority
+        self.started = started
+
+
+class VoiceManager:
+    """Stała pula kanałów z limitami kategorii, priorytetami i tłumieniem z odległością"""
+    def __init__(self, bank: SoundBank) -> None:
+        self.bank = bank
+        self.channels: List[pygame.mixer.Channel] = []
+        self.voices: List[Optional[Voice]] = []
+        self.listener_pos: Optional[Tuple[float, float]] = None
+
+        self.played: int = 0
+        self.stolen: int = 0
+        self.dropped: int = 0
+
+    def init(
+        self, channel_count: int = config.SFX_CHANNELS, first_channel: int = 0
+    ) -> None:
+        """Przydziel kanały miksera; wywołać po pygame.mixer.init()"""
+        if not pygame.mixer.get_init():
+            return
+
+        if pygame.mixer.get_num_channels() < first_channel + channel_count:
+            pygame.mixer.set_num_channels(first_channel + channel_count)
+        self.channels = [
+            pygame.mixer.Channel(i)
+            for i in range(first_channel, first_channel + channel_count)
+        ]
+        self.voices = [None] * channel_count
+
+    def set_listener(self, pos: Tuple[float, float]) -> None:
+        self.listener_pos = pos
+
+    def attenuation(self, pos: Optional[Tuple[float, float]]) -> Tuple[float, float]:
+        """Głośność (lewy, prawy) zależna od odległości i położenia względem słuchacza"""
+        if pos is None or self.listener_pos is None:
+            return 1.0, 1.0
+
+        dx = pos[0] - self.listener_pos[0]
+        dy = pos[1] - self.listener_pos[1]
+        distance = (dx * dx + dy * dy) ** 0.5
+        gain = max(0.0, 1 - distance / config.SFX_HEARING_DISTANCE)
+
+        pan = max(-1.0, min(1.0, dx / config.SFX_HEARING_DISTANCE))
+        return gain * min(1.0, 1 - pan), gain * min(1.0, 1 + pan)
+
+    def play(
+        self, name: str, pos: Optional[Tuple[float, float]] = None
+    ) -> Optional[pygame.mixer.Channel]:
+        """Odtwórz efekt, w razie potrzeby zabierając kanał słabszemu dźwiękowi"""
+        if not self.channels:
+            return None
+
+        sound = self.bank.get(name)
+        if sound is None:
+            return None
+
+        left, right = self.attenuation(pos)
+        gain = max(left, right)
+        if gain < config.SFX_MIN_GAIN:
+            self.dropped += 1
+            return None
+
+        _, category, base_priority = SOUND_EFFECTS[name]
+        priority = base_priority * gain
+        now = pygame.time.get_ticks()
+
+        index = self.find_channel(category, priority)
+        if index is None:
+            self.dropped += 1
+            return None
+
+        channel = self.channels[index]
+        if channel.get_busy():
+            self.stolen += 1
+        channel.play(sound)
+        channel.set_volume(left, right)
+        self.voices[index] = Voice(category, priority, now)
+        self.played += 1
+        return channel
+
+    def find_channel(self, category: str, priority: float) -> Optional[int]:
+        """Wybierz kanał: wolny, albo najsłabszy i najstarszy, który można przejąć"""
+        active = []
+        free = None
+        for i, channel in enumerate(self.channels):
+            if channel.get_busy() and self.voices[i] is not None:
+                active.append(i)
+            elif free is None:
+                free = i
+
+        in_category = [i for i in active if self.voices[i].category == category]
+        limit = config.VOICE_LIMITS.get(category, len(self.channels))
+        if len(in_category) >= limit:
+            return self.weakest(in_category, priority)
+
+        if free is not None:
+            return free
+        return self.weakest(active, priority)
+
+    def weakest(self, candidates: List[int], priority: float) -> Optional[int]:
+        """Kanał z najniższym priorytetem, o ile nie jest ważniejszy od nowego dźwięku"""
+        if not candidates:
+            return None
+
+        index = min(
+            candidates,
+            key=lambda i: (self.voices[i].priority, self.voices[i].started),
+        )
+        if self.voices[index].priority > priority:
+            return None
+        return index
+
+    def stats(self) -> Dict[str, int]:
+        """Zwróć liczniki menedżera głosów"""
+        busy = sum(1 for channel in self.channels if channel.get_busy())
+        return {
+            'channels': len(self.channels),
+            'busy': busy,
+            'played': self.played,
+            'stolen': self.stolen,
+            'dropped': self.dropped,
+        }
+
+
+sound_bank = SoundBank()
+voices = VoiceManager(sound_bank)
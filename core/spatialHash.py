@@ -0,0 +1,114 @@
+from typing import Dict, List, Set, Tuple
+
+import pygame
+
+import config
+
+CellRange = Tuple[int, int, int, int]
+
+
+class SpatialHash:
+    """Jednorodna siatka komórek dla ruchomych sprite'ów, aktualizowana przyrostowo"""
+    def __init__(self, cell_size: int = config.SPATIAL_CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], Set[pygame.sprite.Sprite]] = {}
+        self.ranges: Dict[pygame.sprite.Sprite, CellRange] = {}
+
+    def cell_range(self, rect: pygame.Rect) -> CellRange:
+        size = self.cell_size
+        return (
+            rect.left // size,
+            rect.top // size,
+            (rect.right - 1) // size,
+            (rect.bottom - 1) // size,
+        )
+
+    def insert(self, sprite: pygame.sprite.Sprite) -> None:
+        cell_range = self.cell_range(sprite.rect)
+        self.ranges[sprite] = cell_range
+        left, top, right, bottom = cell_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                self.cells.setdefault((x, y), set()).add(sprite)
+
+    def remove(self, sprite: pygame.sprite.Sprite) -> None:
+        cell_range = self.ranges.pop(sprite, None)
+        if cell_range is None:
+            return
+
+        left, top, right, bottom = cell_range
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.cells.get((x, y))
+                if cell is not None:
+                    cell.discard(sprite)
+                    if not cell:
+                        del self.cells[(x, y)]
+
+    def update(self, sprite: pygame.sprite.Sprite) -> None:
+        """Przenieś sprite do nowych komórek tylko wtedy, gdy je zmienił"""
+        if self.ranges.get(sprite) != self.cell_range(sprite.rect):
+            self.remove(sprite)
+            self.insert(sprite)
+
+    def candidates(self, rect: pygame.Rect) -> Set[pygame.sprite.Sprite]:
+        """Sprite'y z komórek pokrywanych przez prostokąt (bez dokładnego testu)"""
+        found: Set[pygame.sprite.Sprite] = set()
+        left, top, right, bottom = self.cell_range(rect)
+        for x in range(left, right + 1):
+            for y in range(top, bottom + 1):
+                cell = self.cells.get((x, y))
+                if cell:
+                    found |= cell
+        return found
+
+    def query_rect(
+        self, rect: pygame.Rect, attr: str = 'rect'
+    ) -> List[pygame.sprite.Sprite]:
+        """Sprite'y, których rect (lub hitbox) nachodzi na podany prostokąt"""
+        return [
+            sprite
+            for sprite in self.candidates(rect)
+            if getattr(sprite, attr).colliderect(rect)
+        ]
+
+    def query_radius(
+        self, center: Tuple[float, float], radius: float
+    ) -> List[pygame.sprite.Sprite]:
+        """Sprite'y, których środek leży bliżej niż radius od punktu"""
+        cx, cy = center
+        area = pygame.Rect(0, 0, radius * 2 + 1, radius * 2 + 1)
+        area.center = (int(cx), int(cy))
+        radius_sq = radius * radius
+
+        found = []
+        for sprite in self.candidates(area):
+            sx, sy = sprite.rect.center
+            if (sx - cx) ** 2 + (sy - cy) ** 2 < radius_sq:
+                found.append(sprite)
+        return found
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """Grupa sprite'ów utrzymująca własny SpatialHash (indeksowany po rect)"""
+    def __init__(self, *sprites, cell_size: int = config.SPATIAL_CELL_SIZE) -> None:
+        self.spatial_hash = SpatialHash(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None) -> None:
+        super().add_internal(sprite, layer)
+        self.spatial_hash.insert(sprite)
+
+    def remove_internal(self, sprite) -> None:
+        super().remove_internal(sprite)
+        self.spatial_hash.remove(sprite)
+
+    def update_sprite(self, sprite) -> None:
+        """Wywołać po przesunięciu sprite'a"""
+        self.spatial_hash.update(sprite)
+
+    def query_rect(self, rect: pygame.Rect, attr: str = 'rect') -> list:
+        return self.spatial_hash.query_rect(rect, attr)
+
+    def query_radius(self, center: Tuple[float, float], radius: float) -> list:
+        return self.spatial_hash.query_radius(center, radius)
@@ -0,0 +1,53 @@
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Tuple
+
+import config
+
+
+class SpawnDirector:
+    """Kolejka kandydatów na przeciwników, przetwarzana w limicie czasu na klatkę"""
+    def __init__(
+        self,
+        spawn: Callable[[Tuple[float, float]], bool],
+        budget_ms: float = config.SPAWN_BUDGET_MS,
+    ) -> None:
+        self.spawn = spawn
+        self.budget_ms = budget_ms
+        self.queue: Deque[Tuple[float, float]] = deque()
+
+        self.requested: int = 0
+        self.spawned: int = 0
+        self.rejected: int = 0
+        self.max_queue: int = 0
+
+    def request(self, pos: Tuple[float, float]) -> None:
+        """Zgłoś kandydata (wywoływane przez MapManager przy generowaniu chunk'a)"""
+        self.queue.append(pos)
+        self.requested += 1
+        self.max_queue = max(self.max_queue, len(self.queue))
+
+    def update(self) -> None:
+        """Przetwórz kandydatów, dopóki nie skończy się budżet czasu tej klatki"""
+        deadline = time.perf_counter() + self.budget_ms / 1000
+        # co najmniej jeden kandydat na klatkę, aby kolejka zawsze malała
+        while self.queue:
+            if self.spawn(self.queue.popleft()):
+                self.spawned += 1
+            else:
+                self.rejected += 1
+            if time.perf_counter() >= deadline:
+                break
+
+    def clear(self) -> None:
+        self.queue.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Zwróć liczniki reżysera spawnów"""
+        return {
+            'queued': len(self.queue),
+            'max_queue': self.max_queue,
+            'requested': self.requested,
+            'spawned': self.spawned,
+            'rejected': self.rejected,
+        }
@@ -0,0 +1,102 @@
+import numpy as np
+
+import config
+
+MIN_SEPARATION = config.ENEMY_MIN_SEPARATION
+
+# przesunięcia do sąsiednich komórek siatki (3x3)
+NEIGHBOUR_OFFSETS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+
+def neighbour_pairs(centers: np.ndarray, radius: float):
+    """Indeksy (i, j) par punktów z tej samej lub sąsiedniej komórki o boku radius"""
+    count = len(centers)
+    cells = np.floor(centers / radius).astype(np.int64)
+    # klucz komórki; przesunięcie o 2**20 utrzymuje współrzędne dodatnie
+    keys = (cells[:, 0] + 2 ** 20) * 2 ** 21 + (cells[:, 1] + 2 ** 20)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    pairs_i = []
+    pairs_j = []
+    for dx, dy in NEIGHBOUR_OFFSETS:
+        neighbour_keys = keys + dx * 2 ** 21 + dy
+        start = np.searchsorted(sorted_keys, neighbour_keys, 'left')
+        end = np.searchsorted(sorted_keys, neighbour_keys, 'right')
+        counts = end - start
+        total = int(counts.sum())
+        if total == 0:
+            continue
+
+        first = np.repeat(np.cumsum(counts) - counts, counts)
+        within = np.arange(total) - first
+        pairs_i.append(np.repeat(np.arange(count), counts))
+        pairs_j.append(order[np.repeat(start, counts) + within])
+
+    if not pairs_i:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty
+    return np.concatenate(pairs_i), np.concatenate(pairs_j)
+
+
+def separation_vectors(
+    centers: np.ndarray, min_separation: float = MIN_SEPARATION, pairs=None
+) -> np.ndarray:
+    """Wektory odpychania od sąsiadów bliższych niż min_separation, dla wszystkich środków naraz.
+
+    pairs to gotowe pary z neighbour_pairs o promieniu co najmniej min_separation.
+    """
+    repel = np.zeros_like(centers, dtype=np.float64)
+    if len(centers) < 2:
+        return repel
+
+    if pairs is None:
+        pairs = neighbour_pairs(centers, min_separation)
+    i, j = pairs
+    x = centers[:, 0]
+    y = centers[:, 1]
+    dx = x[i] - x[j]
+    dy = y[i] - y[j]
+    dist_sq = dx * dx + dy * dy
+
+    close = (dist_sq > 0) & (dist_sq < min_separation * min_separation)
+    i, dx, dy = i[close], dx[close], dy[close]
+    dist = np.sqrt(dist_sq[close])
+
+    # ((min - d) / min) ** 1.5, rozłożone na składowe znormalizowanego wektora
+    scale = ((min_separation - dist) / min_separation) ** 1.5 / dist
+    count = len(centers)
+    repel[:, 0] = np.bincount(i, dx * scale, count)
+    repel[:, 1] = np.bincount(i, dy * scale, count)
+    return repel
+
+
+def steering(
+    centers: np.ndarray,
+    target: tuple,
+    stop_distances: np.ndarray,
+    flow_field=None,
+    repel_strength: float = config.ENEMY_REPEL_STRENGTH,
+    pairs=None,
+) -> tuple:
+    """Odległość i kierunek do celu, odpychanie i zatrzymanie dla całej hordy"""
+    diff = np.asarray(target, dtype=np.float64) - centers
+    distance = np.hypot(diff[:, 0], diff[:, 1])
+
+    # kierunek jednostkowy; dla zerowej odległości zostaje wektor zerowy
+    unit = np.zeros_like(diff)
+    moving = distance > 0
+    unit[moving] = diff[moving] / distance[moving, None]
+
+    # dalsi przeciwnicy omijają ściany, idąc za polem przepływu
+    heading = unit
+    if flow_field is not None:
+        flow, known = flow_field.lookup(centers)
+        follow = known & (distance > config.ENEMY_FLOW_MIN_DISTANCE)
+        heading = np.where(follow[:, None], flow, unit)
+
+    repel = separation_vectors(centers, MIN_SEPARATION, pairs)
+    direction = heading + repel * repel_strength
+    direction[distance < stop_distances] = 0
+    return distance, unit, direction
+
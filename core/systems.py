@@ -0,0 +1,324 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+import numpy as np
+import pygame
+
+import config
+from core.aiScheduler import AIScheduler
+from core.flowField import FlowField
+from core.mapManager import WALL_HITBOX_INSET
+from core.simClock import sim_clock
+from core.steering import neighbour_pairs, steering
+from entities.enemy import EnemyGroup
+from entities.particle import FADE_STEP, EffectGroup
+from entities.projectile import ProjectileEngine
+
+# bok komórki przy szukaniu sąsiadów: większy niż odległość odpychania
+# i niż suma połówek hitboxów z ruchem z jednego kroku
+NEIGHBOUR_CELL = 128
+# przesunięcia kafelków okna 3x3 wokół hitboxa
+WINDOW_COLS = np.repeat(np.arange(3), 3)
+WINDOW_ROWS = np.tile(np.arange(3), 3)
+
+
+def block_walls(
+    moved: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    half_w: np.ndarray,
+    half_h: np.ndarray,
+    delta: np.ndarray,
+    axis: int,
+    walls: tuple,
+) -> np.ndarray:
+    """Współrzędna osi axis po ruchu, dosunięta do krawędzi ścian zamiast w nie"""
+    grid, first_col, first_row = walls
+    rows, cols = grid.shape
+    tile = config.TILE_SIZE
+    inset = WALL_HITBOX_INSET
+    if axis == 0:
+        x = moved
+    else:
+        y = moved
+    left = x - half_w
+    right = x + half_w
+    top = y - half_h
+    bottom = y + half_h
+
+    # hitbox (do 100 px) leży w oknie 3x3 kafelków od lewego górnego rogu
+    c = np.floor(left / tile).astype(np.int64)[:, None] + WINDOW_COLS
+    r = np.floor(top / tile).astype(np.int64)[:, None] + WINDOW_ROWS
+    gc = c - first_col
+    gr = r - first_row
+    inside = (gc >= 0) & (gc < cols) & (gr >= 0) & (gr < rows)
+    wall = np.zeros(c.shape, dtype=bool)
+    wall[inside] = grid[gr[inside], gc[inside]]
+
+    wall_left = c * tile + inset
+    wall_right = wall_left + tile - 2 * inset
+    wall_top = r * tile + inset
+    wall_bottom = wall_top + tile - 2 * inset
+    hit = (
+        wall
+        & (left[:, None] < wall_right) & (right[:, None] > wall_left)
+        & (top[:, None] < wall_bottom) & (bottom[:, None] > wall_top)
+    )
+
+    if axis == 0:
+        near, far, half = wall_left, wall_right, half_w
+    else:
+        near, far, half = wall_top, wall_bottom, half_h
+    forward = np.where(hit, near, np.inf).min(axis=1) - half
+    backward = np.where(hit, far, -np.inf).max(axis=1) + half
+    blocked = hit.any(axis=1)
+    return np.where(
+        blocked & (delta > 0),
+        forward,
+        np.where(blocked & (delta < 0), backward, moved),
+    )
+
+
+class System(ABC):
+    """Etap symulacji aktualizujący wyłącznie encje ze swojego rejestru"""
+    name = 'system'
+
+    @abstractmethod
+    def update(self) -> None:
+        pass
+
+
+class PlayerSystem(System):
+    name = 'player'
+
+    def __init__(self, player) -> None:
+        self.player = player
+
+    def update(self) -> None:
+        self.player.update()
+
+
+class EnemySystem(System):
+    """Przeciwnicy jako wiersze magazynu komponentów, przetwarzani etapami hurtowo.
+
+    Etapy: usuwanie odległych, sterowanie, harmonogram AI, ruch z kolizjami,
+    animacja z błyskiem trafienia i strzały. Kod Pythona na pojedynczego
+    przeciwnika wykonuje się tylko dla tych, którym coś się zmieniło.
+    """
+    name = 'enemies'
+
+    def __init__(
+        self,
+        enemies: EnemyGroup,
+        player,
+        map_manager,
+        flow_field: FlowField,
+        scheduler: AIScheduler,
+    ) -> None:
+        self.enemies = enemies
+        self.player = player
+        self.map_manager = map_manager
+        self.flow_field = flow_field
+        self.scheduler = scheduler
+
+    def update(self) -> None:
+        store = self.enemies.store
+        self.despawn(store)
+        if store.count == 0:
+            return
+
+        n = store.count
+        # jedne pary sąsiadów na tick, dla odpychania i dla blokowania ruchu
+        pairs = neighbour_pairs(
+            np.column_stack((store.x[:n], store.y[:n])), NEIGHBOUR_CELL
+        )
+        self.steer(store, pairs)
+        steps, visible = self.scheduler.schedule(store, self.player.rect.center)
+        self.move(store, steps, pairs)
+        self.animate(store, steps, visible)
+        self.shoot(store, steps)
+
+    def despawn(self, store) -> None:
+        """Usuń przeciwników zbyt daleko od gracza"""
+        n = store.count
+        far = np.flatnonzero(store.distance[:n] > config.ENEMY_DESPAWN_DISTANCE)
+        for enemy in [store.entities[row] for row in far.tolist()]:
+            enemy.kill()
+
+    def steer(self, store, pairs: tuple) -> None:
+        n = store.count
+        centers = np.column_stack((store.x[:n], store.y[:n]))
+        distance, unit, direction = steering(
+            centers,
+            self.player.rect.center,
+            store.stop_distance[:n],
+            self.flow_field,
+            pairs=pairs,
+        )
+        store.distance[:n] = distance
+        store.aim_x[:n] = unit[:, 0]
+        store.aim_y[:n] = unit[:, 1]
+
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        length[length == 0] = 1
+        store.dir_x[:n] = direction[:, 0] / length
+        store.dir_y[:n] = direction[:, 1] / length
+
+    def move(self, store, steps: np.ndarray, pairs: tuple) -> None:
+        """Ruch po osiach, jak wcześniej w Enemy.move, z blokowaniem przez ściany
+        i innych przeciwników"""
+        n = store.count
+        x = store.x[:n]
+        y = store.y[:n]
+        half_w = store.half_w[:n]
+        half_h = store.half_h[:n]
+        old_left = np.rint(x - half_w)
+        old_top = np.rint(y - half_h)
+
+        walls = None
+        if self.map_manager is not None:
+            walls = self.map_manager.occupancy_grid()
+        pair_i, pair_j = pairs
+        keep = (
+            (pair_i != pair_j)
+            & (steps[pair_i] > 0)
+            & (np.abs(x[pair_i] - x[pair_j]) < NEIGHBOUR_CELL)
+            & (np.abs(y[pair_i] - y[pair_j]) < NEIGHBOUR_CELL)
+        )
+        pair_i, pair_j = pair_i[keep], pair_j[keep]
+
+        for axis, position in enumerate((x, y)):
+            direction = store.dir_x[:n] if axis == 0 else store.dir_y[:n]
+            delta = direction * store.speed[:n] * steps
+            moved = position + delta
+
+            # przeciwnik nie wchodzi w hitbox sąsiada, w którego stronę idzie,
+            # ani w jego starym, ani w nowym położeniu
+            i, j = pair_i, pair_j
+            reach = (half_w if axis == 0 else half_h)
+            other = (y if axis == 0 else x)
+            other_reach = (half_h if axis == 0 else half_w)
+            overlap = (
+                np.abs(other[i] - other[j]) < other_reach[i] + other_reach[j]
+            ) & (
+                (np.abs(moved[i] - position[j]) < reach[i] + reach[j])
+                | (np.abs(moved[i] - moved[j]) < reach[i] + reach[j])
+            )
+            toward = delta[i] * (position[j] - position[i]) > 0
+            blocked = i[overlap & toward]
+            moved[blocked] = position[blocked]
+            # ściany na końcu, jak w Enemy.collision: wypychają według kierunku ruchu
+            if walls is not None:
+                moved = block_walls(moved, x, y, half_w, half_h, delta, axis, walls)
+            position[:] = moved
+
+        # zaokrąglany róg, nie środek: hitbox o nieparzystym boku nie wchodzi w ścianę
+        left = np.rint(x - half_w)
+        top = np.rint(y - half_h)
+        changed = np.flatnonzero((left != old_left) | (top != old_top))
+        entities = store.entities
+        for row, hx, hy in zip(
+            changed.tolist(), left[changed].tolist(), top[changed].tolist()
+        ):
+            enemy = entities[row]
+            enemy.hitbox.topleft = (int(hx), int(hy))
+            enemy.rect.center = enemy.hitbox.center
+            self.enemies.update_sprite(enemy)
+
+    def animate(self, store, steps: np.ndarray, visible: np.ndarray) -> None:
+        """Klatki animacji i błysk trafienia; obraz zmieniany tylko widocznym"""
+        n = store.count
+        active = visible & (steps > 0)
+        frame = store.frame[:n]
+        frame[active] += store.anim_speed[:n][active] * steps[active]
+        frame[frame >= store.frame_count[:n]] = 0
+
+        hit = store.hit_until[:n] > sim_clock.ticks()
+        facing = store.dir_x[:n] < 0
+        key = frame.astype(np.int16) * 4 + facing * 2 + hit
+        image_key = store.image_key[:n]
+        changed = np.flatnonzero(active & (key != image_key))
+        image_key[changed] = key[changed]
+
+        entities = store.entities
+        for row, value in zip(changed.tolist(), key[changed].tolist()):
+            entities[row].select_image(value)
+
+    def shoot(self, store, steps: np.ndarray) -> None:
+        """Strzały przeciwników, którym minął cooldown i mają gracza w zasięgu"""
+        n = store.count
+        now = sim_clock.ticks()
+        ready = np.flatnonzero(
+            store.shoots[:n]
+            & (steps > 0)
+            & (store.ready_at[:n] <= now)
+            & (store.distance[:n] < config.ENEMY_SHOOT_RANGE)
+        )
+        entities = store.entities
+        for row in ready.tolist():
+            enemy = entities[row]
+            direction = pygame.math.Vector2(store.aim_x[row], store.aim_y[row])
+            if enemy.shoot(direction):
+                store.ready_at[row] = now + enemy.enemy_type.cooldown
+
+
+class ProjectileSystem(System):
+    name = 'projectiles'
+
+    def __init__(self, projectiles: ProjectileEngine) -> None:
+        self.projectiles = projectiles
+
+    def update(self) -> None:
+        self.projectiles.update()
+
+
+class EffectSystem(System):
+    """Wygaszanie efektów hurtowo; obraz zmieniany tylko wygasającym"""
+    name = 'effects'
+
+    def __init__(self, effects: EffectGroup) -> None:
+        self.effects = effects
+
+    def update(self) -> None:
+        store = self.effects.store
+        n = store.count
+        if n == 0:
+            return
+
+        fading = np.flatnonzero(store.fade_at[:n] <= sim_clock.ticks())
+        if len(fading) == 0:
+            return
+
+        alpha = store.alpha[:n]
+        alpha[fading] -= FADE_STEP
+        entities = store.entities
+        finished = []
+        for row, value in zip(fading.tolist(), alpha[fading].tolist()):
+            if value <= 0:
+                finished.append(entities[row])
+            else:
+                entities[row].set_alpha(value)
+        # usuwanie przestawia wiersze, więc dopiero po przejściu pętli
+        for effect in finished:
+            effect.kill()
+
+
+class SystemPipeline:
+    """Systemy wykonywane po kolei w każdym ticku, z czasem ostatniego wykonania.
+
+    Statyczna geometria (ściany) nie ma systemu, więc nie jest odwiedzana.
+    """
+    def __init__(self, systems: List[System]) -> None:
+        self.systems = systems
+        self.timings: Dict[str, float] = {system.name: 0.0 for system in systems}
+
+    def update(self) -> None:
+        for system in self.systems:
+            start = time.perf_counter()
+            system.update()
+            self.timings[system.name] = (time.perf_counter() - start) * 1000
+
+    def stats(self) -> Dict[str, float]:
+        """Czas (ms) ostatniego wykonania każdego systemu"""
+        return dict(self.timings)
@@ -0,0 +1,106 @@
+import math
+from typing import Callable, List
+
+from core.simClock import sim_clock
+
+
+class Timer:
+    """Zaplanowane wywołanie; cancel() wyłącza je bez szukania w kole"""
+    __slots__ = ('deadline', 'callback', 'cancelled')
+
+    def __init__(self, deadline: int, callback: Callable[[], None]) -> None:
+        self.deadline = deadline
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TimerWheel:
+    """Hierarchiczne koło czasowe liczone w tickach symulacji.
+
+    Poziom 0 ma sloty po jednym ticku, każdy kolejny obejmuje cały obrót
+    poprzedniego. Timery z wyższych poziomów przenoszone są niżej, gdy zbliża
+    się ich termin, więc koszt ticku zależy od liczby odpalonych timerów,
+    a nie od liczby obiektów, które na coś czekają.
+    """
+    def __init__(self, slot_bits: int = 6, levels: int = 3) -> None:
+        self.slot_bits = slot_bits
+        self.slot_count = 1 << slot_bits
+        self.slot_mask = self.slot_count - 1
+        self.levels = levels
+        self.wheels: List[List[List[Timer]]] = [
+            [[] for _ in range(self.slot_count)] for _ in range(levels)
+        ]
+        self.tick: int = 0
+        self.pending: int = 0
+        self.fired: int = 0
+
+    def __len__(self) -> int:
+        return self.pending
+
+    def ticks_for(self, delay_ms: float) -> int:
+        """Liczba ticków odpowiadająca opóźnieniu w milisekundach (co najmniej 1)"""
+        return max(1, math.ceil(delay_ms / sim_clock.step_ms))
+
+    def schedule(self, delay_ms: float, callback: Callable[[], None]) -> Timer:
+        """Wywołaj callback po delay_ms milisekundach czasu symulacji"""
+        return self.schedule_at(self.tick + self.ticks_for(delay_ms), callback)
+
+    def schedule_at(self, deadline: int, callback: Callable[[], None]) -> Timer:
+        """Wywołaj callback w ticku deadline (najwcześniej w następnym)"""
+        timer = Timer(max(deadline, self.tick + 1), callback)
+        self.insert(timer)
+        self.pending += 1
+        return timer
+
+    def insert(self, timer: Timer) -> None:
+        delta = timer.deadline - self.tick
+        for level in range(self.levels):
+            shift = self.slot_bits * level
+            if delta < 1 << (shift + self.slot_bits) or level == self.levels - 1:
+                # timery spoza zasięgu koła czekają w ostatnim slocie najwyższego poziomu
+                key = min(timer.deadline, self.tick + (1 << (shift + self.slot_bits)) - 1)
+                self.wheels[level][(key >> shift) & self.slot_mask].append(timer)
+                return
+
+    def cascade(self, level: int) -> None:
+        """Przenieś timery z bieżącego slotu poziomu level na niższe poziomy"""
+        shift = self.slot_bits * level
+        slot = self.wheels[level][(self.tick >> shift) & self.slot_mask]
+        timers = slot[:]
+        slot.clear()
+        for timer in timers:
+            self.insert(timer)
+
+    def advance(self, tick: int) -> None:
+        """Przesuń koło do ticku tick, wywołując po drodze wszystkie należne timery"""
+        while self.tick < tick:
+            self.tick += 1
+            for level in range(self.levels - 1, 0, -1):
+                # wyższy poziom przesuwa się co pełny obrót niższego
+                if self.tick & ((1 << (self.slot_bits * level)) - 1) == 0:
+                    self.cascade(level)
+
+            slot = self.wheels[0][self.tick & self.slot_mask]
+            while slot:
+                timers = slot[:]
+                slot.clear()
+                for timer in timers:
+                    if timer.deadline > self.tick:
+                        self.insert(timer)
+                        continue
+                    self.pending -= 1
+                    if not timer.cancelled:
+                        self.fired += 1
+                        timer.callback()
+
+    def clear(self) -> None:
+        for wheel in self.wheels:
+            for slot in wheel:
+                slot.clear()
+        self.pending = 0
+
+
+timer_wheel = TimerWheel()
@@ -1,11 +1,34 @@
 import os
+from typing import NamedTuple
 
 import pygame
 
 import config
+from core.assetCache import asset_cache
 from core.saveManager import SaveManager
 
 
+class HudState(NamedTuple):
+    """Wartości pasków interfejsu skopiowane z gracza, do rysowania z migawki"""
+    health: int
+    max_health: int
+    energy: int
+    max_energy: int
+    xp: int
+    xp_to_next_level: int
+
+    @classmethod
+    def capture(cls, player) -> 'HudState':
+        return cls(
+            player.health,
+            player.max_health,
+            player.energy,
+            player.max_energy,
+            player.xp,
+            player.xp_to_next_level,
+        )
+
+
 class Button:
     def __init__(
         self,
@@ -50,8 +73,8 @@ class ImageButton:
     def __init__(
         self, x: int, y: int, normal_image_path: str, hover_image_path: str
     ) -> None:
-        self.normal_image = pygame.image.load(normal_image_path).convert_alpha()
-        self.hover_image = pygame.image.load(hover_image_path).convert_alpha()
+        self.normal_image = asset_cache.get_image(normal_image_path)
+        self.hover_image = asset_cache.get_image(hover_image_path)
         self.rect = self.normal_image.get_rect(topleft=(x, y))
         self.is_hovered = False
 
@@ -69,31 +92,50 @@ class ImageButton:
             and self.is_hovered
         )
 
+class LoadingScreen:
+    """Lekki ekran wczytywania, nie wymaga żadnych plików z assets"""
+    def __init__(self) -> None:
+        self.display_surface = pygame.display.get_surface()
+        self.font = pygame.font.Font(None, 32)
+        self.bar_rect = pygame.Rect(0, 0, 400, 16)
+        self.bar_rect.center = (config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 + 30)
+
+    def draw(self, progress: float) -> None:
+        self.display_surface.fill('black')
+
+        text_surf = self.font.render("Wczytywanie...", True, 'white')
+        text_rect = text_surf.get_rect(
+            center=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2 - 10)
+        )
+        self.display_surface.blit(text_surf, text_rect)
+
+        pygame.draw.rect(self.display_surface, '#333333', self.bar_rect)
+        fill_rect = self.bar_rect.copy()
+        fill_rect.width = int(self.bar_rect.width * progress)
+        if fill_rect.width > 0:
+            pygame.draw.rect(self.display_surface, 'white', fill_rect)
+
+
 class UI:
     def __init__(self) -> None:
         self.display_surface = pygame.display.get_surface()
         self.font = pygame.font.Font(None, config.UI_FONT_SIZE)
 
         path = os.path.join("assets", "ui", 'ui.png')
-        self.ui_image = pygame.image.load(path).convert_alpha()
-        self.ui_image = pygame.transform.scale(self.ui_image, (250, 100))
+        self.ui_image = asset_cache.get_image(path, (250, 100))
         self.ui_rect = self.ui_image.get_rect(
             midbottom=(config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT - 10)
         )
 
         start_path = os.path.join("assets", "ui", 'start.png')
-        start_image_original = pygame.image.load(start_path).convert_alpha()
-        self.start_image = pygame.transform.scale(
-            start_image_original, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        self.start_image = asset_cache.get_image(
+            start_path, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
         )
         self.start_rect = self.start_image.get_rect(topleft=(0, 0))
 
-        end_path = os.path.join("assets", "ui", 'end.png')
-        end_image_original = pygame.image.load(end_path).convert_alpha()
-        self.end_image = pygame.transform.scale(
-            end_image_original, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
-        )
-        self.end_rect = self.end_image.get_rect(topleft=(0, 0))
+        self.end_path = os.path.join("assets", "ui", 'end.png')
+        self.end_image = None
+        self.end_rect = pygame.Rect(0, 0, config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
 
         self.hp_bar_start_pos = (42, 9)
         self.hp_bar_size = (200, 13)
@@ -111,25 +153,19 @@ class UI:
         continue_image_path = os.path.join('assets', 'ui', 'continue.png')
         continue_hover_path = os.path.join('assets', 'ui', 'continue_hover.png')
 
-        play_img = pygame.image.load(play_image_path).convert_alpha()
-        play_hover_img = pygame.image.load(play_hover_path).convert_alpha()
-        exit_img = pygame.image.load(exit_image_path).convert_alpha()
-        exit_hover_img = pygame.image.load(exit_hover_path).convert_alpha()
-        continue_img = pygame.image.load(continue_image_path).convert_alpha()
-        continue_hover_img = pygame.image.load(continue_hover_path).convert_alpha()
+        play_img = asset_cache.get_image(play_image_path)
 
         scale_factor = 0.5
         play_width = int(play_img.get_width() * scale_factor)
         play_height = int(play_img.get_height() * scale_factor)
+        button_size = (play_width, play_height)
 
-        play_img = pygame.transform.scale(play_img, (play_width, play_height))
-        play_hover_img = pygame.transform.scale(play_hover_img, (play_width, play_height))
-        exit_img = pygame.transform.scale(exit_img, (play_width, play_height))
-        exit_hover_img = pygame.transform.scale(exit_hover_img, (play_width, play_height))
-        continue_img = pygame.transform.scale(continue_img, (play_width, play_height))
-        continue_hover_img = pygame.transform.scale(
-            continue_hover_img, (play_width, play_height)
-        )
+        play_img = asset_cache.get_image(play_image_path, button_size)
+        play_hover_img = asset_cache.get_image(play_hover_path, button_size)
+        exit_img = asset_cache.get_image(exit_image_path, button_size)
+        exit_hover_img = asset_cache.get_image(exit_hover_path, button_size)
+        continue_img = asset_cache.get_image(continue_image_path, button_size)
+        continue_hover_img = asset_cache.get_image(continue_hover_path, button_size)
 
         button_spacing = 20
         center_x = config.SCREEN_WIDTH // 2 - play_width // 2
@@ -177,28 +213,28 @@ class UI:
         if current_width > 0:
             pygame.draw.rect(self.display_surface, color, bar_rect)
 
-    def display(self, player) -> None:
+    def display(self, hud: HudState) -> None:
         self.display_surface.blit(self.ui_image, self.ui_rect)
 
         self.show_bar(
-            player.health,
-            player.max_health,
+            hud.health,
+            hud.max_health,
             self.hp_bar_start_pos,
             self.hp_bar_size,
             config.HEALTH_COLOR,
         )
 
         self.show_bar(
-            player.energy,
-            player.max_energy,
+            hud.energy,
+            hud.max_energy,
             self.energy_bar_start_pos,
             self.energy_bar_size,
             config.ENERGY_COLOR,
         )
 
         self.show_bar(
-            player.xp,
-            player.xp_to_next_level,
+            hud.xp,
+            hud.xp_to_next_level,
             self.xp_bar_start_pos,
             self.xp_bar_size,
             config.XP_COLOR,
@@ -234,6 +270,10 @@ class UI:
         self.exit_button.draw(self.display_surface)
 
     def show_game_over(self, final_time: int, level: int, kill_stats: dict) -> None:
+        if self.end_image is None:
+            self.end_image = asset_cache.get_image(
+                self.end_path, (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+            )
         self.display_surface.blit(self.end_image, self.end_rect)
 
         end_font = pygame.font.Font(None, 32)
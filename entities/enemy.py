@@ -1,414 +1,296 @@
+import json
 import os
 import random
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pygame
 
-from entities.particle import DeathEffect
-from entities.projectile import Projectile
-
-
-class Enemy(pygame.sprite.Sprite):
-    def __init__(
-        self,
-        pos: tuple,
-        groups: list,
-        player,
-        enemy_name: str,
-        hp: int,
-        speed: float,
-        size: tuple,
-        bullet_group,
-        xp_reward: int,
-        obstacle_sprites: list,
-        shoot_type: str = None,
-        stop_distance: int = 0,
-    ) -> None:
-        super().__init__(groups)
-        self.sprite_type = 'enemy'
-        self.bar_max_width = 40
-        self.bar_height = 5
-
-        self.player = player
-        self.speed = speed
-        self.health = hp
-        self.max_health = hp
-        self.size = size
-        self.sprite_groups = groups
-        self.bullet_group = bullet_group
-        self.xp_reward = xp_reward
-
-        self.frame_index = 0
-        self.animation_speed = 0.15
-        self.enemy_name = enemy_name
-
-        self.import_graphics(enemy_name)
-        self.image = self.frames[0]
-        self.rect = self.image.get_rect(topleft=pos)
-        self.direction = pygame.math.Vector2()
-        self.stop_distance = stop_distance
-        self.shoot_type = shoot_type
-        self.projectile_type = random.randint(0, 1) if shoot_type else None
-        self.can_shoot = True
-        self.shoot_time = 0
-        self.cooldown = 1500
-
-        self._is_hit = False
-        self.hit_time = 0
-        self.hit_duration = 150
-
-        self.obstacle_sprites = obstacle_sprites
-        self.rect = self.image.get_rect(topleft=pos)
-        self.hitbox = self.rect.inflate(0, -10)
-
-    def import_graphics(self, name: str) -> None:
-        self.frames = []
+import config
+from core.assetCache import asset_cache
+from core.entityStore import StoreGroup
+from core.simClock import sim_clock
+from core.slottedSprite import SlottedSprite
+from core.soundManager import voices
+from core.spatialHash import SpatialGroup
+from entities.particle import death_effects
+
+HURT_TINT = (200, 0, 0, 255)
+ENEMY_TYPES_PATH = os.path.join('assets', 'enemies', 'enemy_types.json')
+
+
+class EnemyType(NamedTuple):
+    """Niezmienne dane rodzaju przeciwnika, wspólne dla wszystkich jego egzemplarzy"""
+    name: str
+    title: str
+    size: Tuple[int, int]
+    hp: int
+    speed: float
+    xp_reward: int
+    hitbox_inflation: Tuple[int, int]
+    shoots: bool
+    stop_distance: int
+    cooldown: int
+    animation_speed: float
+    hit_duration: int
+    bar_max_width: int
+    bar_height: int
+    # klatki animacji i warianty [klatka][kierunek][trafienie]; puste do wczytania
+    frames: Tuple[pygame.Surface, ...] = ()
+    variants: tuple = ()
+
+
+class EnemyRegistry:
+    """Rodzaje przeciwników wczytywane raz z tabeli JSON.
+
+    Statystyki czytane są przy pierwszym dostępie do tabeli, a grafiki rodzaju
+    przy pierwszym pobraniu go przez get, gdy okno i zasoby są już gotowe.
+    """
+    def __init__(self, path: str = ENEMY_TYPES_PATH) -> None:
+        self.path = path
+        self.table: Optional[Dict[str, EnemyType]] = None
+        self.loaded: Dict[str, EnemyType] = {}
+
+    def records(self) -> Dict[str, EnemyType]:
+        """Rodzaje z tabeli, bez grafik"""
+        if self.table is None:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            defaults = data.get('defaults', {})
+            self.table = {}
+            for name, fields in data['types'].items():
+                fields = {**defaults, **fields}
+                fields['size'] = tuple(fields['size'])
+                fields['hitbox_inflation'] = tuple(fields['hitbox_inflation'])
+                self.table[name] = EnemyType(name=name, **fields)
+        return self.table
+
+    def names(self) -> List[str]:
+        return list(self.records())
+
+    def get(self, name: str) -> EnemyType:
+        """Rodzaj przeciwnika z wczytanymi grafikami"""
+        enemy_type = self.loaded.get(name)
+        if enemy_type is None:
+            enemy_type = self.import_graphics(self.records()[name])
+            self.loaded[name] = enemy_type
+        return enemy_type
+
+    def import_graphics(self, enemy_type: EnemyType) -> EnemyType:
+        frames = []
+        variants = []
+        name = enemy_type.name
         path = os.path.join('assets', 'enemies', name)
 
         for i in range(3):
             file_name = f"{name}_{i}.png"
             full_path = os.path.join(path, file_name)
             try:
-                self.image = pygame.image.load(full_path).convert_alpha()
-                self.image = pygame.transform.scale(self.image, self.size)
-                self.frames.append(self.image)
+                frames.append(asset_cache.get_image(full_path, enemy_type.size))
+                variants.append(self.build_variants(full_path, enemy_type.size))
             except (FileNotFoundError, TypeError):
                 print(f"OSTRZEŻENIE: Nie znaleziono pliku: {full_path}")
                 pass
-
-    def get_player_distance_direction(self, player) -> tuple:
-        enemy_vec = pygame.math.Vector2(self.rect.center)
-        player_vec = pygame.math.Vector2(player.rect.center)
-
-        diff_vec = player_vec - enemy_vec
-        distance = diff_vec.magnitude()
-
-        if distance > 0:
-            direction = diff_vec.normalize()
-        else:
-            direction = pygame.math.Vector2()
-
-        return (distance, direction)
-
-    def collision(self, direction: str, enemy_group=None) -> None:
-        if not self.obstacle_sprites:
-            return
-
-        if direction == 'horizontal':
-            for sprite in self.obstacle_sprites:
-                if sprite.hitbox.colliderect(self.hitbox):
-                    if self.direction.x > 0:
-                        self.hitbox.right = sprite.hitbox.left
-                    if self.direction.x < 0:
-                        self.hitbox.left = sprite.hitbox.right
-
-            if enemy_group:
-                for sprite in enemy_group:
-                    if sprite is not self and sprite.hitbox.colliderect(self.hitbox):
-                        if self.direction.x > 0:
-                            self.hitbox.right = sprite.hitbox.left
-                        if self.direction.x < 0:
-                            self.hitbox.left = sprite.hitbox.right
-
-        if direction == 'vertical':
-            for sprite in self.obstacle_sprites:
-                if sprite.hitbox.colliderect(self.hitbox):
-                    if self.direction.y > 0:
-                        self.hitbox.bottom = sprite.hitbox.top
-                    if self.direction.y < 0:
-                        self.hitbox.top = sprite.hitbox.bottom
-
-            if enemy_group:
-                for sprite in enemy_group:
-                    if sprite is not self and sprite.hitbox.colliderect(self.hitbox):
-                        if self.direction.y > 0:
-                            self.hitbox.bottom = sprite.hitbox.top
-                        if self.direction.y < 0:
-                            self.hitbox.top = sprite.hitbox.bottom
-
-    def move(self, enemy_group=None) -> None:
-        if self.direction.magnitude() != 0:
-            self.direction = self.direction.normalize()
-
-        self.hitbox.x += self.direction.x * self.speed
-        self.collision('horizontal', enemy_group)
-
-        self.hitbox.y += self.direction.y * self.speed
-        self.collision('vertical', enemy_group)
-
-        self.rect.center = self.hitbox.center
-
-    def shoot(self) -> None:
-        if self.shoot_type and self.can_shoot:
-            distance, direction = self.get_player_distance_direction(self.player)
-
-            if distance < 500:
-                Projectile(
-                    self.rect.center,
-                    direction,
-                    [self.sprite_groups[0], self.bullet_group],
-                    type='enemy',
-                    enemy_projectile_type=self.projectile_type,
-                )
-                self.can_shoot = False
-                self.shoot_time = pygame.time.get_ticks()
-
-    def take_damage(self, damage: int) -> None:
-        self.health -= damage
-        self._is_hit = True
-        self.hit_time = pygame.time.get_ticks()
-
-        print(
-            f"{type(self).__name__} took {damage} damage. "
-            f"Health: {self.health}/{self.max_health}"
+        return enemy_type._replace(frames=tuple(frames), variants=tuple(variants))
+
+    @staticmethod
+    def build_variants(full_path: str, size: Tuple[int, int]) -> tuple:
+        """Tabela wariantów klatki: [kierunek][trafienie]"""
+        flip = ('flip', True, False)
+        hurt = ('add', HURT_TINT)
+        variants = (
+            (
+                asset_cache.get_image(full_path, size),
+                asset_cache.get_image(full_path, size, (hurt,)),
+            ),
+            (
+                asset_cache.get_image(full_path, size, (flip,)),
+                asset_cache.get_image(full_path, size, (flip, hurt)),
+            ),
         )
-        if self.health <= 0:
-            DeathEffect(self.rect.center, [self.sprite_groups[0]])
-            self.kill()
-
-    def hit_reaction(self) -> None:
-        if self._is_hit:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.hit_time >= self.hit_duration:
-                self._is_hit = False
-
-        original_img = self.frames[int(self.frame_index)]
-
-        if self.direction.x < 0:
-            self.image = pygame.transform.flip(original_img, True, False)
-        else:
-            self.image = original_img.copy()
-
-        if self._is_hit:
-            hurt_surf = self.image.copy()
-            hurt_surf.fill((200, 0, 0, 255), special_flags=pygame.BLEND_RGB_ADD)
-            self.image = hurt_surf
-
-    def shoot_cooldown_handler(self) -> None:
-        if not self.can_shoot:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.shoot_time >= self.cooldown:
-                self.can_shoot = True
-
-    def animate(self) -> None:
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(self.frames):
-            self.frame_index = 0
-
-        original_img = self.frames[int(self.frame_index)]
-
-        if self.direction.x < 0:
-            self.image = pygame.transform.flip(original_img, True, False)
-        else:
-            self.image = original_img.copy()
-
-        if self._is_hit:
-            hurt_surf = self.image.copy()
-            hurt_surf.fill((200, 0, 0, 255), special_flags=pygame.BLEND_RGB_ADD)
-            self.image = hurt_surf
-
-    def repel_neighbors(self, enemy_group=None) -> pygame.math.Vector2:
-        repel_vector = pygame.math.Vector2(0, 0)
-        min_separation = 110
-
-        if enemy_group is None:
-            return repel_vector
-
-        for sprite in enemy_group:
-            if (
-                sprite is not self
-                and hasattr(sprite, 'sprite_type')
-                and sprite.sprite_type == 'enemy'
-            ):
-                enemy_vec = pygame.math.Vector2(self.rect.center)
-                other_vec = pygame.math.Vector2(sprite.rect.center)
-
-                diff = enemy_vec - other_vec
-                dist = diff.magnitude()
-
-                if 0 < dist < min_separation:
-                    strength = ((min_separation - dist) / min_separation) ** 1.5
-                    if dist > 0:
-                        diff = diff.normalize()
-                        repel_vector += diff * strength
-
-        return repel_vector
-
-    def update(self, enemy_group=None) -> None:
-        dist, direction = self.get_player_distance_direction(self.player)
-        self.direction = direction
-
-        if enemy_group:
-            repel = self.repel_neighbors(enemy_group)
-            self.direction += repel * 5.0
-
-        if dist < self.stop_distance:
-            self.direction = pygame.math.Vector2()
-
-        if dist > 2000:
-            self.kill()
-
-        self.move(enemy_group)
-        self.hit_reaction()
-        self.animate()
-        self.shoot()
-        self.shoot_cooldown_handler()
-
+        # maski liczone zawsze: PRECISE_COLLISION można włączyć w trakcie gry
+        for image in variants[0] + variants[1]:
+            asset_cache.get_mask(image)
+        return variants
+
+
+enemy_types = EnemyRegistry()
+
+# komponenty przeciwnika przetwarzane hurtowo przez core.systems.EnemySystem
+ENEMY_COMPONENTS = {
+    # pozycja środka hitboxa i połowy jego wymiarów
+    'x': np.float64,
+    'y': np.float64,
+    'half_w': np.float64,
+    'half_h': np.float64,
+    # prędkość: znormalizowany kierunek ze sterowania i szybkość na tick
+    'dir_x': np.float64,
+    'dir_y': np.float64,
+    'speed': np.float64,
+    'stop_distance': np.float64,
+    # kierunek jednostkowy i odległość do gracza
+    'aim_x': np.float64,
+    'aim_y': np.float64,
+    'distance': np.float64,
+    'health': np.int32,
+    # cooldown strzału i błysk trafienia: czas symulacji (ms), do którego trwają
+    'shoots': np.bool_,
+    'ready_at': np.int64,
+    'hit_until': np.int64,
+    # animacja; image_key to zakodowany wybrany wariant obrazu (-1 = brak)
+    'frame': np.float64,
+    'anim_speed': np.float64,
+    'frame_count': np.int16,
+    'image_key': np.int16,
+    # tick ostatniej aktualizacji przez core.aiScheduler (-1 = jeszcze żadnej)
+    'ai_tick': np.int64,
+}
+
+
+class EnemyGroup(StoreGroup, SpatialGroup):
+    """Rejestr przeciwników: siatka przestrzenna i magazyn ich komponentów"""
+    def __init__(self, *sprites) -> None:
+        super().__init__(ENEMY_COMPONENTS, *sprites)
+
+
+class Enemy(SlottedSprite):
+    """Przeciwnik jako sprite do rysowania i kolizji.
+
+    Dane rodzaju są we wspólnym EnemyType, a stan symulacji w wierszu magazynu
+    grupy EnemyGroup, więc przeciwnik musi do niej należeć. Egzemplarz trzyma
+    tylko zmienny stan, w slotach.
+    """
+    __slots__ = (
+        'enemy_type',
+        'image',
+        'rect',
+        'hitbox',
+        # wiersz w magazynie komponentów, nadawany przy dołączeniu do EnemyGroup
+        'store',
+        'row',
+        # pula, do której przeciwnik wraca po kill (None = bez puli)
+        'pool',
+        'player',
+        # grupy efektu śmierci; gra dodaje rejestr efektów, aby był aktualizowany
+        'effect_groups',
+        'bullet_group',
+        'wall_grid',
+        'projectile_type',
+        'los_tick',
+        'los_visible',
+    )
+    sprite_type = 'enemy'
 
-class Ghost(Enemy):
     def __init__(
         self,
+        enemy_type: EnemyType,
         pos: tuple,
         groups: list,
         player,
-        enemy_name: str,
-        hp: int,
-        speed: float,
         bullet_group,
-        obstacle_sprites: list,
     ) -> None:
-        super().__init__(
-            pos,
-            groups,
-            player,
-            enemy_name,
-            hp,
-            speed,
-            (60, 80),
-            bullet_group,
-            10,
-            obstacle_sprites,
-            'enemy',
-        )
-
+        super().__init__()
+        self.enemy_type = enemy_type
+        self.image = enemy_type.frames[0]
+        self.rect = self.image.get_rect(topleft=pos)
+        self.hitbox = self.rect.inflate(*enemy_type.hitbox_inflation)
 
-class Politician(Enemy):
-    def __init__(
-        self,
-        pos: tuple,
-        groups: list,
-        player,
-        enemy_name: str,
-        hp: int,
-        speed: float,
-        bullet_group,
-        obstacle_sprites: list,
-    ) -> None:
-        super().__init__(
-            pos, groups, player, enemy_name, hp, speed, (55, 80), bullet_group, 69, obstacle_sprites
-        )
+        self.store = None
+        self.row = -1
+        self.pool = None
 
+        self.spawn(pos, groups, player, bullet_group)
 
-class Butcher(Enemy):
-    def __init__(
-        self,
-        pos: tuple,
-        groups: list,
-        player,
-        enemy_name: str,
-        hp: int,
-        speed: float,
-        bullet_group,
-        obstacle_sprites: list,
-    ) -> None:
-        super().__init__(
-            pos,
-            groups,
-            player,
-            enemy_name,
-            hp,
-            speed,
-            (80, 110),
-            bullet_group,
-            150,
-            obstacle_sprites,
+    def spawn(self, pos: tuple, groups: list, player, bullet_group) -> None:
+        """Aktywuj przeciwnika, nowego lub pobranego z puli, w pozycji pos"""
+        self.player = player
+        self.effect_groups = groups[:1]
+        self.bullet_group = bullet_group
+        self.wall_grid = None
+
+        shoots = self.enemy_type.shoots
+        self.projectile_type = random.randint(0, 1) if shoots else None
+        self.los_tick = -config.ENEMY_LOS_TICKS
+        self.los_visible = True
+
+        self.image = self.enemy_type.frames[0]
+        self.rect.topleft = pos
+        self.hitbox.center = self.rect.center
+
+        # dodanie do grup na końcu, gdy rect jest już znany siatce przestrzennej
+        self.add(groups)
+
+    def kill(self) -> None:
+        """Usuń ze wszystkich grup i oddaj przeciwnika do puli"""
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def components(self) -> dict:
+        """Wartości startowe komponentów przeciwnika"""
+        enemy_type = self.enemy_type
+        return {
+            'x': self.hitbox.x + self.hitbox.width / 2,
+            'y': self.hitbox.y + self.hitbox.height / 2,
+            'half_w': self.hitbox.width / 2,
+            'half_h': self.hitbox.height / 2,
+            'speed': enemy_type.speed,
+            'stop_distance': enemy_type.stop_distance,
+            'health': enemy_type.hp,
+            'shoots': enemy_type.shoots,
+            'anim_speed': enemy_type.animation_speed,
+            'frame_count': len(enemy_type.frames),
+            'image_key': -1,
+            'ai_tick': -1,
+        }
+
+    @property
+    def health(self) -> int:
+        return int(self.store.health[self.row])
+
+    def select_image(self, key: int) -> None:
+        """Ustaw wariant obrazu zakodowany jako klatka * 4 + kierunek * 2 + trafienie"""
+        self.image = self.enemy_type.variants[key >> 2][(key >> 1) & 1][key & 1]
+
+    def shoot(self, direction: pygame.math.Vector2) -> bool:
+        """Strzel w kierunku gracza, jeśli go widać"""
+        if not self.has_line_of_sight():
+            return False
+
+        self.bullet_group.spawn(
+            self.rect.center, direction, f'enemy_{self.projectile_type}'
         )
+        return True
 
+    def has_line_of_sight(self) -> bool:
+        """Czy gracz jest widoczny; wynik promienia ważny przez ENEMY_LOS_TICKS klatek"""
+        if self.wall_grid is None:
+            return True
 
-class Bat(Enemy):
-    def __init__(
-        self,
-        pos: tuple,
-        groups: list,
-        player,
-        enemy_name: str,
-        hp: int,
-        speed: float,
-        bullet_group,
-        obstacle_sprites: list,
-    ) -> None:
-        super().__init__(
-            pos, groups, player, enemy_name, hp, speed, (70, 70), bullet_group, 20, obstacle_sprites
-        )
+        tick = self.wall_grid.frame_counter
+        if tick - self.los_tick >= config.ENEMY_LOS_TICKS:
+            self.los_tick = tick
+            self.los_visible = self.wall_grid.line_of_sight(
+                self.rect.center, self.player.rect.center
+            )
+        return self.los_visible
 
+    def take_damage(self, damage: int) -> bool:
+        """Zadaj obrażenia; zwraca True, gdy to trafienie zabiło przeciwnika"""
+        if self.row < 0:
+            return False
 
-class Skeleton(Enemy):
-    def __init__(
-        self,
-        pos: tuple,
-        groups: list,
-        player,
-        enemy_name: str,
-        hp: int,
-        speed: float,
-        bullet_group,
-        obstacle_sprites: list,
-    ) -> None:
-        super().__init__(
-            pos, groups, player, enemy_name, hp, speed, (80, 90), bullet_group, 100, obstacle_sprites
-        )
+        self.store.health[self.row] -= damage
+        self.store.hit_until[self.row] = sim_clock.ticks() + self.enemy_type.hit_duration
 
-
-class BlackMagic(Enemy):
-    def __init__(
-        self,
-        pos: tuple,
-        groups: list,
-        player,
-        enemy_name: str,
-        hp: int,
-        speed: float,
-        bullet_group,
-        obstacle_sprites: list,
-    ) -> None:
-        super().__init__(
-            pos,
-            groups,
-            player,
-            enemy_name,
-            hp,
-            speed,
-            (75, 95),
-            bullet_group,
-            120,
-            obstacle_sprites,
-            shoot_type='enemy',
-            stop_distance=250,
+        print(
+            f"{self.enemy_type.title} took {damage} damage. "
+            f"Health: {self.health}/{self.enemy_type.hp}"
         )
+        if self.health <= 0:
+            death_effects.acquire().spawn(self.rect.center, self.effect_groups)
+            voices.play('enemy_die', self.rect.center)
+            self.kill()
+            return True
+        return False
 
-
-class Mage(Enemy):
-    def __init__(
-        self,
-        pos: tuple,
-        groups: list,
-        player,
-        enemy_name: str,
-        hp: int,
-        speed: float,
-        bullet_group,
-        obstacle_sprites: list,
-    ) -> None:
-        super().__init__(
-            pos,
-            groups,
-            player,
-            enemy_name,
-            hp,
-            speed,
-            (70, 90),
-            bullet_group,
-            110,
-            obstacle_sprites,
-            shoot_type='enemy',
-            stop_distance=200,
-        )
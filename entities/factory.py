@@ -1,14 +1,9 @@
 from abc import ABC, abstractmethod
+from functools import partial
+from typing import Dict
 
-from entities.enemy import (
-    Bat,
-    BlackMagic,
-    Butcher,
-    Ghost,
-    Mage,
-    Politician,
-    Skeleton,
-)
+from core.objectPool import ObjectPool
+from entities.enemy import Enemy, enemy_types
 
 
 class EnemyFactory(ABC):
@@ -58,102 +53,69 @@ class EnemyFactory(ABC):
 
 
 class MainFactory(EnemyFactory):
-    """Glówna fabryka do tworzenia przeciwników"""
+    """Glówna fabryka do tworzenia przeciwników.
+
+    Rodzaje i ich statystyki pochodzą z rejestru enemy_types. Każdy rodzaj ma
+    własną pulę: zabity przeciwnik wraca do niej i jest aktywowany ponownie
+    zamiast tworzenia nowego sprite'a.
+    """
+
+    def __init__(self) -> None:
+        self.pools: Dict[str, ObjectPool] = {
+            name: ObjectPool(partial(self.build, name))
+            for name in enemy_types.names()
+        }
+
+    @staticmethod
+    def build(name: str) -> Enemy:
+        """Nieaktywny przeciwnik do puli, poza wszystkimi grupami"""
+        return Enemy(enemy_types.get(name), (0, 0), [], None, None)
+
+    def prewarm(self, sizes: Dict[str, int]) -> None:
+        """Utwórz z góry przeciwników według liczby na rodzaj"""
+        for name, pool in self.pools.items():
+            pool.prewarm(sizes.get(name, 0))
+
+    def spawn(self, name: str, pos: tuple, groups: list, player, bullet_group):
+        enemy = self.pools[name].acquire()
+        enemy.spawn(pos, groups, player, bullet_group)
+        return enemy
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Liczniki pul wszystkich rodzajów"""
+        return {name: pool.stats() for name, pool in self.pools.items()}
 
     def create_ghost(
         self, pos: tuple, groups: list, player, bullet_group, obstacle_sprites
     ):
-        return Ghost(
-            pos,
-            groups,
-            player,
-            enemy_name='ghost',
-            hp=50,
-            speed=3,
-            bullet_group=bullet_group,
-            obstacle_sprites=obstacle_sprites,
-        )
+        return self.spawn('ghost', pos, groups, player, bullet_group)
 
     def create_politician(
         self, pos: tuple, groups: list, player, bullet_group, obstacle_sprites
     ):
-        return Politician(
-            pos,
-            groups,
-            player,
-            enemy_name='politician',
-            hp=50,
-            speed=2.25,
-            bullet_group=bullet_group,
-            obstacle_sprites=obstacle_sprites,
-        )
+        return self.spawn('politician', pos, groups, player, bullet_group)
 
     def create_butcher(
         self, pos: tuple, groups: list, player, bullet_group, obstacle_sprites
     ):
-        return Butcher(
-            pos,
-            groups,
-            player,
-            enemy_name='butcher',
-            hp=50,
-            speed=2,
-            bullet_group=bullet_group,
-            obstacle_sprites=obstacle_sprites,
-        )
+        return self.spawn('butcher', pos, groups, player, bullet_group)
 
     def create_bat(
         self, pos: tuple, groups: list, player, bullet_group, obstacle_sprites
     ):
-        return Bat(
-            pos,
-            groups,
-            player,
-            enemy_name='bat',
-            hp=50,
-            speed=3,
-            bullet_group=bullet_group,
-            obstacle_sprites=obstacle_sprites,
-        )
+        return self.spawn('bat', pos, groups, player, bullet_group)
 
     def create_skeleton(
         self, pos: tuple, groups: list, player, bullet_group, obstacle_sprites
     ):
-        return Skeleton(
-            pos,
-            groups,
-            player,
-            enemy_name='skeleton',
-            hp=80,
-            speed=2.5,
-            bullet_group=bullet_group,
-            obstacle_sprites=obstacle_sprites,
-        )
+        return self.spawn('skeleton', pos, groups, player, bullet_group)
 
     def create_black_magic(
         self, pos: tuple, groups: list, player, bullet_group, obstacle_sprites
     ):
-        return BlackMagic(
-            pos,
-            groups,
-            player,
-            enemy_name='black_magic',
-            hp=70,
-            speed=2,
-            bullet_group=bullet_group,
-            obstacle_sprites=obstacle_sprites,
-        )
+        return self.spawn('black_magic', pos, groups, player, bullet_group)
 
     def create_mage(
         self, pos: tuple, groups: list, player, bullet_group, obstacle_sprites
     ):
-        return Mage(
-            pos,
-            groups,
-            player,
-            enemy_name='mage',
-            hp=65,
-            speed=2.5,
-            bullet_group=bullet_group,
-            obstacle_sprites=obstacle_sprites,
-        )
\ No newline at end of file
+        return self.spawn('mage', pos, groups, player, bullet_group)
@@ -1,28 +1,65 @@
 import os
 
+import numpy as np
 import pygame
 
+from core.assetCache import asset_cache
+from core.entityStore import StoreGroup
+from core.objectPool import ObjectPool
+from core.simClock import sim_clock
+
+EFFECT_PATH = os.path.join('assets', 'dead.png')
+EFFECT_SIZE = (80, 80)
+# wygaszanie zaczyna się sekundę po śmierci i odejmuje FADE_STEP alfy na tick
+FADE_DELAY = 1000
+FADE_STEP = 5
+
+EFFECT_COMPONENTS = {
+    'fade_at': np.int64,
+    'alpha': np.int16,
+}
+
+
+class EffectGroup(StoreGroup):
+    """Rejestr efektów z magazynem komponentów wygaszania"""
+    def __init__(self, *sprites) -> None:
+        super().__init__(EFFECT_COMPONENTS, *sprites)
+
 
 class DeathEffect(pygame.sprite.Sprite):
+    """Ślad po przeciwniku; wygaszanie liczy core.systems.EffectSystem"""
     def __init__(self, pos: tuple, groups: list) -> None:
-        super().__init__(groups)
+        super().__init__()
 
-        path = os.path.join('assets', 'dead.png')
-        self.image = pygame.image.load(path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, (80, 80))
+        self.image = asset_cache.get_image(EFFECT_PATH, EFFECT_SIZE)
         self.rect = self.image.get_rect(center=pos)
 
-        self.spawn_time = pygame.time.get_ticks()
-        self.lifetime: int = 2000
-        self.alpha: int = 255
+        self.store = None
+        self.row = -1
+        self.pool = None
+        self.add(groups)
+
+    def spawn(self, pos: tuple, groups: list) -> None:
+        """Aktywuj efekt pobrany z puli w pozycji pos"""
+        self.image = asset_cache.get_image(EFFECT_PATH, EFFECT_SIZE)
+        self.rect.center = pos
+        self.add(groups)
+
+    def kill(self) -> None:
+        """Usuń ze wszystkich grup i oddaj efekt do puli"""
+        super().kill()
+        if self.pool is not None:
+            self.pool.release(self)
+
+    def components(self) -> dict:
+        return {'fade_at': sim_clock.ticks() + FADE_DELAY, 'alpha': 255}
 
-    def update(self) -> None:
-        current_time = pygame.time.get_ticks()
+    def set_alpha(self, alpha: int) -> None:
+        """Obraz z danym poziomem alfy, wspólny dla wszystkich efektów"""
+        self.image = asset_cache.get_image(
+            EFFECT_PATH, EFFECT_SIZE, (('alpha', alpha),)
+        )
 
-        if current_time - self.spawn_time > 1000:
-            self.alpha -= 5
 
-            if self.alpha <= 0:
-                self.kill()
-            else:
-                self.image.set_alpha(self.alpha)
\ No newline at end of file
+# wspólna pula efektów śmierci; obrazy wczytuje dopiero prewarm lub acquire
+death_effects = ObjectPool(lambda: DeathEffect((0, 0), []))
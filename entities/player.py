@@ -1,10 +1,14 @@
 import os
-from typing import Optional, Dict, List, Any
+from typing import Dict, List, Any
 
 import pygame
 
 import config
-from entities.projectile import Projectile
+from core.assetCache import asset_cache
+from core.inputSource import pygame_input
+from core.simClock import sim_clock
+from core.timerWheel import timer_wheel
+from core.soundManager import voices
 
 
 class Player(pygame.sprite.Sprite):
@@ -13,9 +17,9 @@ class Player(pygame.sprite.Sprite):
 
         self.sprite_groups = groups
         self.bullet_group = create_bullet_group
+        self.input_source = pygame_input
 
         self.vulnerable = True
-        self.hurt_time = 0
         self.invincibility_duration = 500
 
         self.health = 100
@@ -32,7 +36,7 @@ class Player(pygame.sprite.Sprite):
         self.animation_speed = self.walk_animation_speed
 
         self.is_attacking = False
-        self.attack_time = 0
+        self.attack_timer = None
 
         self.import_assets()
 
@@ -42,10 +46,8 @@ class Player(pygame.sprite.Sprite):
         self.speed = config.PLAYER_SPEED
 
         self.can_shoot = True
-        self.shoot_time = 0
         self.cooldown = config.SHOOT_COOLDOWN
         self.can_power_shoot: bool = True
-        self.power_shoot_time: int = 0
         self.power_shoot_cooldown: int = 800
 
         self.step_timer = 0
@@ -61,6 +63,7 @@ class Player(pygame.sprite.Sprite):
         self.xp_to_next_level = 100
 
         self.obstacle_sprites = obstacle_sprites
+        self.wall_grid = None
         self.hitbox = self.rect.inflate(-20, -26)
 
         self.skip_input: bool = True
@@ -78,26 +81,36 @@ class Player(pygame.sprite.Sprite):
             'left': [],
             'right': [],
         }
+        self.faded_animations: Dict[str, List] = {
+            name: [] for name in self.animations
+        }
 
         for animation_type in self.animations.keys():
             for i in range(4):
                 file_name = f'{animation_type}_{i}.png'
                 full_path = os.path.join(path, file_name)
 
-                img = pygame.image.load(full_path).convert_alpha()
-                img = pygame.transform.scale(
-                    img, (config.PLAYER_SIZE, config.PLAYER_SIZE)
+                img = asset_cache.get_image(
+                    full_path, (config.PLAYER_SIZE, config.PLAYER_SIZE)
                 )
                 self.animations[animation_type].append(img)
+                # półprzezroczysta kopia na czas nietykalności; wspólne obrazy
+                # z cache nie są modyfikowane, bo może je rysować inny wątek
+                self.faded_animations[animation_type].append(
+                    asset_cache.get_image(
+                        full_path,
+                        (config.PLAYER_SIZE, config.PLAYER_SIZE),
+                        (('alpha', 150),),
+                    )
+                )
 
         self.attack_spirites: Dict[str, pygame.Surface] = {}
         for direction in ['up', 'down', 'left', 'right']:
             file_name = f'attack_{direction}.png'
             full_path = os.path.join(path, file_name)
             try:
-                img = pygame.image.load(full_path).convert_alpha()
-                img = pygame.transform.scale(
-                    img, (config.PLAYER_SIZE, config.PLAYER_SIZE)
+                img = asset_cache.get_image(
+                    full_path, (config.PLAYER_SIZE, config.PLAYER_SIZE)
                 )
                 self.attack_spirites[direction] = img
             except FileNotFoundError:
@@ -108,27 +121,6 @@ class Player(pygame.sprite.Sprite):
                     surf.fill('white')
                     self.attack_spirites[direction] = surf
 
-        sfx_path = os.path.join('assets', 'sfx', 'walking_1.wav')
-        try:
-            self.step_sound: Optional[pygame.mixer.Sound] = pygame.mixer.Sound(
-                sfx_path
-            )
-            self.step_sound.set_volume(config.SFX_VOLUME)
-        except FileNotFoundError:
-            print("Nie znaleziono pliku dźwiękowego: walking_1.wav")
-            self.step_sound = None
-
-        self.attack_sound = pygame.mixer.Sound(
-            os.path.join('assets', 'sfx', 'attack.mp3')
-        )
-        self.attack_sound.set_volume(config.SFX_VOLUME)
-        self.attack_sound_channel = pygame.mixer.Channel(0)
-
-        self.level_up_sound = pygame.mixer.Sound(
-            os.path.join('assets', 'sfx', 'next_level.mp3')
-        )
-        self.level_up_sound.set_volume(config.SFX_VOLUME)
-
     def load_from_save(
         self, save_data: Dict[str, Any], default_pos: tuple
     ) -> None:
@@ -159,8 +151,8 @@ class Player(pygame.sprite.Sprite):
             self.skip_input = False
             return
 
-        keys = pygame.key.get_pressed()
-        mouse = pygame.mouse.get_pressed()
+        keys = self.input_source.keys()
+        mouse = self.input_source.mouse_buttons()
 
         if keys[pygame.K_w]:
             self.direction.y = -1
@@ -202,23 +194,32 @@ class Player(pygame.sprite.Sprite):
         if mouse[0] and self.can_shoot:
             self.create_bullet()
             self.can_shoot = False
-            self.shoot_time = pygame.time.get_ticks()
-
-            self.is_attacking = True
-            self.attack_time = pygame.time.get_ticks()
+            timer_wheel.schedule(self.cooldown, self.reload)
+            self.start_attack()
 
         if mouse[2] and self.can_power_shoot and self.energy >= 30:
             self.create_powerful_shot()
             self.energy -= 30
             self.can_power_shoot = False
-            self.power_shoot_time = pygame.time.get_ticks()
+            timer_wheel.schedule(self.power_shoot_cooldown, self.reload_power)
+            self.start_attack()
+
+    def start_attack(self) -> None:
+        """Włącza animację ataku na PLAYER_ATTACK_ANIMATION_DURATION ms"""
+        self.is_attacking = True
+        if self.attack_timer is not None:
+            self.attack_timer.cancel()
+        self.attack_timer = timer_wheel.schedule(
+            config.PLAYER_ATTACK_ANIMATION_DURATION, self.end_attack
+        )
 
-            self.is_attacking = True
-            self.attack_time = pygame.time.get_ticks()
+    def end_attack(self) -> None:
+        self.is_attacking = False
+        self.attack_timer = None
 
     def create_bullet(self) -> None:
         """Oblicza kierunek strzału i tworzy pocisk"""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.input_source.mouse_pos()
 
         player_screen_pos = pygame.math.Vector2(
             config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2
@@ -228,15 +229,13 @@ class Player(pygame.sprite.Sprite):
         if direction.magnitude() > 0:
             direction = direction.normalize()
 
-        Projectile(
-            self.rect.center, direction, [self.sprite_groups[0], self.bullet_group]
-        )
+        self.bullet_group.spawn(self.rect.center, direction, 'player')
 
-        self.attack_sound_channel.play(self.attack_sound)
+        voices.play('attack')
 
     def create_powerful_shot(self) -> None:
         """Tworzy wzmocniony pocisk"""
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self.input_source.mouse_pos()
         player_screen_pos = pygame.math.Vector2(
             config.SCREEN_WIDTH // 2, config.SCREEN_HEIGHT // 2
         )
@@ -246,37 +245,25 @@ class Player(pygame.sprite.Sprite):
         if direction.magnitude() > 0:
             direction = direction.normalize()
 
-        Projectile(
-            self.rect.center,
-            direction,
-            [self.sprite_groups[0], self.bullet_group],
-            type='player',
-            power=2,
-        )
+        self.bullet_group.spawn(self.rect.center, direction, 'player_power')
 
-        self.attack_sound_channel.play(self.attack_sound)
+        voices.play('attack')
 
-    def cooldown_handler(self) -> None:
-        """Odlicza czas do następnego strzału"""
-        current_time = pygame.time.get_ticks()
-        if not self.can_shoot:
-            if current_time - self.shoot_time >= self.cooldown:
-                self.can_shoot = True
+    def reload(self) -> None:
+        """Koniec odliczania do następnego strzału"""
+        self.can_shoot = True
 
-        if not self.can_power_shoot:
-            if (
-                current_time - self.power_shoot_time >= self.power_shoot_cooldown
-            ):
-                self.can_power_shoot = True
+    def reload_power(self) -> None:
+        """Koniec odliczania do następnego wzmocnionego strzału"""
+        self.can_power_shoot = True
 
     def play_step_sfx(self) -> None:
         """Odtwarza dźwięk kroku co określony czas, jeśli gracz się rusza"""
         if self.direction.magnitude() != 0:
-            current_time = pygame.time.get_ticks()
+            current_time = sim_clock.ticks()
 
             if current_time - self.step_timer > self.step_delay:
-                if self.step_sound:
-                    self.step_sound.play()
+                voices.play('step')
                 self.step_timer = current_time
 
     def gain_xp(self, amount: int):
@@ -300,20 +287,13 @@ class Player(pygame.sprite.Sprite):
         self.health = self.max_health
         self.energy = self.max_energy
 
-        self.level_up_sound.play()
+        voices.play('level_up')
 
 
     def animate(self) -> None:
         """Obluga animacji gracza"""
-        current_time = pygame.time.get_ticks()
         if self.is_attacking:
-            if (
-                current_time - self.attack_time
-                < config.PLAYER_ATTACK_ANIMATION_DURATION
-            ):
-                self.image = self.attack_spirites[self.status]
-            else:
-                self.is_attacking = False
+            self.image = self.attack_spirites[self.status]
 
         animation = self.animations[self.status]
         if self.direction.magnitude() != 0:
@@ -323,13 +303,10 @@ class Player(pygame.sprite.Sprite):
         else:
             self.frame_index = 0
 
+        if not self.vulnerable:
+            animation = self.faded_animations[self.status]
         self.image = animation[int(self.frame_index)]
 
-        if self.vulnerable:
-            self.image.set_alpha(255)
-        else:
-            self.image.set_alpha(150)
-
     def move(self) -> None:
         """Poruszanie fracza i kolizje ze scianami"""
         if self.direction.magnitude() != 0:
@@ -343,52 +320,51 @@ class Player(pygame.sprite.Sprite):
 
         self.rect.center = self.hitbox.center
 
-    def invincibility_timer(self) -> None:
-        """Zarzadzanie niesmietenelnoscia po otrzymaniu obrazen"""
-        if not self.vulnerable:
-            current_time = pygame.time.get_ticks()
-            if (
-                current_time - self.hurt_time >= self.invincibility_duration
-            ):
-                self.vulnerable = True
+    def end_invincibility(self) -> None:
+        """Koniec niesmiertelnosci po otrzymaniu obrazen"""
+        self.vulnerable = True
 
     def take_damage(self, amount: int) -> None:
         """Otrzymanie obrazen przez gracza"""
         if self.vulnerable:
             self.health -= amount
             self.vulnerable = False
-            self.hurt_time = pygame.time.get_ticks()
+            timer_wheel.schedule(self.invincibility_duration, self.end_invincibility)
 
             print(f"Otrzymano {amount} obrazen! HP: {self.health}")
             if self.health <= 0:
                 print("GAME OVER")
 
+    def wall_hitboxes(self) -> list:
+        """Hitboxy ścian w pobliżu gracza, z siatki mapy jeśli jest dostępna"""
+        if self.wall_grid:
+            return self.wall_grid.walls_near(self.hitbox)
+        return [sprite.hitbox for sprite in self.obstacle_sprites]
+
     def collision(self, direction: str) -> None:
         if direction == 'horizontal':
-            for sprite in self.obstacle_sprites:
-                if sprite.hitbox.colliderect(self.hitbox):
+            for wall in self.wall_hitboxes():
+                if wall.colliderect(self.hitbox):
 
                     if self.direction.x > 0:
-                        self.hitbox.right = sprite.hitbox.left
+                        self.hitbox.right = wall.left
 
                     if self.direction.x < 0:
-                        self.hitbox.left = sprite.hitbox.right
+                        self.hitbox.left = wall.right
 
         if direction == 'vertical':
-            for sprite in self.obstacle_sprites:
-                if sprite.hitbox.colliderect(self.hitbox):
+            for wall in self.wall_hitboxes():
+                if wall.colliderect(self.hitbox):
 
                     if self.direction.y > 0:
-                        self.hitbox.bottom = sprite.hitbox.top
+                        self.hitbox.bottom = wall.top
 
                     if self.direction.y < 0:
-                        self.hitbox.top = sprite.hitbox.bottom
+                        self.hitbox.top = wall.bottom
 
 
     def update(self) -> None:
         self.input()
         self.play_step_sfx()
         self.animate()
-        self.cooldown_handler()
-        self.move()
-        self.invincibility_timer()
\ No newline at end of file
+        self.move()
\ No newline at end of file
@@ -1,71 +1,413 @@
 import math
 import os
-from typing import Set
+from functools import partial
+from typing import Dict, List, Optional, Set, Tuple
 
+import numpy as np
 import pygame
 
 import config
+from core.assetCache import asset_cache
+from core.mapManager import WALL_HITBOX_INSET
+from core.timerWheel import timer_wheel
 
+PROJECTILE_SIZES = {
+    'player_projectile_0.png': (65, 65),
+    'player_projectile_1.png': (80, 80),
+    'enemy_projectile_0.png': (40, 40),
+    'enemy_projectile_1.png': (40, 40),
+}
 
-class Projectile(pygame.sprite.Sprite):
-    def __init__(
-        self,
-        pos: tuple,
-        direction: pygame.math.Vector2,
-        groups: list,
-        type: str = 'player',
-        power: int = 1,
-        enemy_projectile_type: int = 0,
-    ) -> None:
-        super().__init__(groups)
-
-        if type == 'player':
-            if power == 1:
-                file_name = 'player_projectile_0.png'
-                self.speed = config.BULLET_SPEED
-                self.lifetime = config.BULLET_LIFETIME
-                self.damage = 10
-                size = (65, 65)
-            else:
-                file_name = 'player_projectile_1.png'
-                self.speed = 10
-                self.lifetime = config.BULLET_LIFETIME
-                self.damage = 100
-                size = (80, 80)
-        else:
-            file_name = f'enemy_projectile_{enemy_projectile_type}.png'
-            self.speed = 6
-            self.lifetime = 5000
-            self.damage = 20
-            size = (40, 40)
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+
+# rodzaj -> (plik, prędkość, czas życia ms, obrażenia, moc, właściciel); moc 2 przebija
+PROJECTILE_TYPES: Dict[str, Tuple[str, float, int, int, int, int]] = {
+    'player': (
+        'player_projectile_0.png', config.BULLET_SPEED, config.BULLET_LIFETIME,
+        10, 1, OWNER_PLAYER,
+    ),
+    'player_power': (
+        'player_projectile_1.png', 10, config.BULLET_LIFETIME, 20, 2, OWNER_PLAYER,
+    ),
+    'enemy_0': ('enemy_projectile_0.png', 6, 5000, 20, 1, OWNER_ENEMY),
+    'enemy_1': ('enemy_projectile_1.png', 6, 5000, 20, 1, OWNER_ENEMY),
+}
+
+# pola kopiowane do migawki rysowania, w kolejności rozpakowania w draw
+DRAW_FIELDS = ('kind', 'frame', 'prev_x', 'prev_y', 'x', 'y', 'half_w', 'half_h')
+
+# hitbox pocisku to rect.inflate(-20, -20)
+HITBOX_INSET = 10
+
+FIELDS = {
+    'x': np.float64,
+    'y': np.float64,
+    # pozycja sprzed ostatniego ticku, do interpolacji przy rysowaniu
+    'prev_x': np.float64,
+    'prev_y': np.float64,
+    'vx': np.float64,
+    'vy': np.float64,
+    'damage': np.int32,
+    'power': np.int8,
+    'owner': np.int8,
+    'kind': np.int16,
+    'frame': np.int16,
+    'half_w': np.float64,
+    'half_h': np.float64,
+    'serial': np.int64,
+}
+
+
+class ProjectileEngine:
+    """Wszystkie pociski jako struktura tablic NumPy, aktualizowane i zderzane hurtowo.
+
+    Tablice są pulą: strzał zajmuje kolejny wiersz, zniszczenie go zwalnia,
+    a nowe miejsce alokowane jest tylko przy przekroczeniu pojemności.
+    """
+    def __init__(self, capacity: int = config.PROJECTILE_CAPACITY) -> None:
+        self.count = 0
+        self.capacity = capacity
+        self.peak = 0
+        for name, dtype in FIELDS.items():
+            setattr(self, name, np.zeros(capacity, dtype=dtype))
+
+        self.kinds = list(PROJECTILE_TYPES)
+        self.kind_index = {kind: i for i, kind in enumerate(self.kinds)}
+        self.atlases: List[Optional[List[pygame.Surface]]] = [None] * len(self.kinds)
+        self.half_sizes: List[List[Tuple[float, float]]] = [[] for _ in self.kinds]
+        self.masks: List[List[pygame.mask.Mask]] = [[] for _ in self.kinds]
+
+        # numery pocisków przebijających -> id trafionych już przeciwników
+        self.pierced: Dict[int, Set[int]] = {}
+        # numery pocisków rosną wraz z indeksem, co pozwala szukać ich bisekcją
+        self.next_serial = 0
+
+        # tick końca życia -> numery pocisków; jeden timer na cały tick
+        self.expiring: Dict[int, List[int]] = {}
+        self.expired: List[int] = []
 
+    def __len__(self) -> int:
+        return self.count
+
+    def atlas(self, index: int) -> List[pygame.Surface]:
+        """Klatki obrotów rodzaju pocisku, wczytywane przy pierwszym strzale"""
+        atlas = self.atlases[index]
+        if atlas is not None:
+            return atlas
+
+        kind = self.kinds[index]
+        file_name = PROJECTILE_TYPES[kind][0]
+        size = PROJECTILE_SIZES[file_name]
+        path = os.path.join('assets', 'projectile', file_name)
         try:
-            path = os.path.join('assets', 'projectile', file_name)
-            original_image = pygame.image.load(path).convert_alpha()
-            original_image = pygame.transform.scale(original_image, size)
+            atlas = asset_cache.get_rotation_atlas(
+                path, size, config.PROJECTILE_ROTATION_STEPS
+            )
         except FileNotFoundError:
             print(f"{path} not found")
-            original_image = pygame.Surface((10, 10))
-            color = 'yellow' if type == 'player' else 'red'
-            original_image.fill(color)
+            image = pygame.Surface((10, 10))
+            image.fill('yellow' if PROJECTILE_TYPES[kind][5] == OWNER_PLAYER else 'red')
+            atlas = [image]
+
+        self.atlases[index] = atlas
+        self.half_sizes[index] = [
+            (image.get_width() / 2, image.get_height() / 2) for image in atlas
+        ]
+        self.masks[index] = [asset_cache.get_mask(image) for image in atlas]
+        return atlas
+
+    def grow(self) -> None:
+        self.capacity *= 2
+        for name in FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(
+        self, pos: Tuple[float, float], direction: pygame.math.Vector2, kind: str
+    ) -> None:
+        """Dodaj pocisk lecący z pos w kierunku direction (wektor jednostkowy)"""
+        index = self.kind_index[kind]
+        _, speed, lifetime, damage, power, owner = PROJECTILE_TYPES[kind]
+        atlas = self.atlas(index)
+        steps = len(atlas)
+        angle = math.degrees(math.atan2(direction.y, direction.x))
+        frame = round(-angle * steps / 360) % steps
 
-        self.direction = direction
-        self.spawn_time = pygame.time.get_ticks()
-        self.type = type
-        self.power = power
-        self.hit_enemies: Set[int] = set()
+        if self.count == self.capacity:
+            self.grow()
+        i = self.count
+        self.x[i], self.y[i] = pos
+        self.prev_x[i], self.prev_y[i] = pos
+        self.vx[i] = direction.x * speed
+        self.vy[i] = direction.y * speed
+        self.damage[i] = damage
+        self.power[i] = power
+        self.owner[i] = owner
+        self.kind[i] = index
+        self.frame[i] = frame
+        self.half_w[i], self.half_h[i] = self.half_sizes[index][frame]
+        self.serial[i] = self.next_serial
+        self.schedule_expiry(self.next_serial, lifetime)
+        self.next_serial += 1
+        self.count += 1
+        self.peak = max(self.peak, self.count)
 
-        angle = math.degrees(math.atan2(self.direction.y, self.direction.x))
-        self.image = pygame.transform.rotate(original_image, -angle)
+    def schedule_expiry(self, serial: int, lifetime: int) -> None:
+        deadline = timer_wheel.tick + timer_wheel.ticks_for(lifetime)
+        batch = self.expiring.get(deadline)
+        if batch is None:
+            batch = self.expiring[deadline] = []
+            timer_wheel.schedule_at(deadline, partial(self.expire, deadline))
+        batch.append(serial)
 
-        self.rect = self.image.get_rect(center=pos)
-        self.hitbox = self.rect.inflate(-20, -20)
+    def expire(self, deadline: int) -> None:
+        """Oznacz pociski, którym w tym ticku minął czas życia"""
+        self.expired.extend(self.expiring.pop(deadline, ()))
+
+    def remove(self, mask: np.ndarray) -> None:
+        """Usuń pociski wskazane maską (długości count), zachowując kolejność reszty"""
+        if not mask.any():
+            return
+
+        n = self.count
+        if self.pierced:
+            for serial in self.serial[:n][mask].tolist():
+                self.pierced.pop(serial, None)
+
+        keep = ~mask
+        alive = int(keep.sum())
+        for name in FIELDS:
+            array = getattr(self, name)
+            array[:alive] = array[:n][keep]
+        self.count = alive
+
+    def stats(self) -> Dict[str, int]:
+        """Liczniki wierszy pocisków, jak w core.objectPool.ObjectPool"""
+        return {
+            'live': self.count,
+            'free': self.capacity - self.count,
+            'peak': self.peak,
+            'capacity': self.capacity,
+        }
+
+    def clear(self) -> None:
+        self.count = 0
+        self.pierced.clear()
+        self.expiring.clear()
+        self.expired.clear()
 
     def update(self) -> None:
-        self.rect.x += self.direction.x * self.speed
-        self.rect.y += self.direction.y * self.speed
+        """Przesuń wszystkie pociski i usuń te, którym minął czas życia"""
+        n = self.count
+        if n == 0:
+            self.expired.clear()
+            return
+
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+
+        if self.expired:
+            # pociski zniszczone wcześniej (trafienie, ściana) nie mają już numeru
+            serials = self.serial[:n]
+            expired = np.array(self.expired, dtype=np.int64)
+            self.expired.clear()
+            indices = np.minimum(np.searchsorted(serials, expired), n - 1)
+            mask = np.zeros(n, dtype=bool)
+            mask[indices[serials[indices] == expired]] = True
+            self.remove(mask)
+
+    def bounds(self, indices: np.ndarray, inset) -> tuple:
+        """Lewa, prawa, górna i dolna krawędź prostokątów pocisków pomniejszonych o inset"""
+        half_w = self.half_w[indices] - inset
+        half_h = self.half_h[indices] - inset
+        x = self.x[indices]
+        y = self.y[indices]
+        return x - half_w, x + half_w, y - half_h, y + half_h
+
+    def collide(
+        self,
+        sprites: list,
+        owner: int,
+        attr: str = 'hitbox',
+        use_hitbox: bool = True,
+    ) -> List[Tuple[pygame.sprite.Sprite, int]]:
+        """Trafienia pocisków właściciela w sprite'y jako lista (sprite, obrażenia).
+
+        Zwykłe pociski znikają po trafieniu, przebijające trafiają każdy cel raz.
+        W trybie PRECISE_COLLISION pary po teście prostokątów sprawdzane są maskami.
+        """
+        n = self.count
+        indices = np.flatnonzero(self.owner[:n] == owner)
+        if len(indices) == 0 or not sprites:
+            return []
+
+        boxes = np.array(
+            [tuple(getattr(sprite, attr)) for sprite in sprites], dtype=np.float64
+        )
+        box_left = boxes[:, 0]
+        box_top = boxes[:, 1]
+        box_right = box_left + boxes[:, 2]
+        box_bottom = box_top + boxes[:, 3]
+
+        left, right, top, bottom = self.bounds(indices, HITBOX_INSET if use_hitbox else 0)
+        overlap = (
+            (left[:, None] < box_right)
+            & (right[:, None] > box_left)
+            & (top[:, None] < box_bottom)
+            & (bottom[:, None] > box_top)
+        )
+        bullet_hits, sprite_hits = np.nonzero(overlap)
+        if len(bullet_hits) == 0:
+            return []
+
+        bullets = indices[bullet_hits]
+        if config.PRECISE_COLLISION:
+            keep = self.mask_overlap(bullets, sprite_hits, sprites)
+            bullets, sprite_hits = bullets[keep], sprite_hits[keep]
+
+        hits = []
+        spent = np.zeros(n, dtype=bool)
+        for b, s, power, damage, serial in zip(
+            bullets.tolist(),
+            sprite_hits.tolist(),
+            self.power[bullets].tolist(),
+            self.damage[bullets].tolist(),
+            self.serial[bullets].tolist(),
+        ):
+            sprite = sprites[s]
+            if power == 2:
+                already_hit = self.pierced.setdefault(serial, set())
+                if id(sprite) in already_hit:
+                    continue
+                already_hit.add(id(sprite))
+            else:
+                spent[b] = True
+            hits.append((sprite, damage))
+
+        self.remove(spent)
+        return hits
+
+    def mask_overlap(
+        self, bullets: np.ndarray, sprite_indices: np.ndarray, sprites: list
+    ) -> np.ndarray:
+        """Maska par (pocisk, sprite), w których nieprzezroczyste piksele naprawdę nachodzą"""
+        lefts = (self.x[bullets] - self.half_w[bullets]).astype(np.int64)
+        tops = (self.y[bullets] - self.half_h[bullets]).astype(np.int64)
+        masks = self.masks
+        overlaps = [
+            asset_cache.get_mask(sprite.image).overlap(
+                masks[kind][frame], (left - sprite.rect.x, top - sprite.rect.y)
+            ) is not None
+            for sprite, kind, frame, left, top in zip(
+                [sprites[s] for s in sprite_indices.tolist()],
+                self.kind[bullets].tolist(),
+                self.frame[bullets].tolist(),
+                lefts.tolist(),
+                tops.tolist(),
+            )
+        ]
+        return np.array(overlaps, dtype=bool)
+
+    def collide_walls(self, map_manager) -> None:
+        """Usuń pociski trafiające w ściany aktywnych chunk'ów.
+
+        Pociski gracza sprawdzają hitbox z hitboxem ściany, wrogów cały rect z całym kafelkiem.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        grid, first_col, first_row = map_manager.occupancy_grid()
+        if grid.size == 0:
+            return
+        rows, cols = grid.shape
+
+        indices = np.arange(n)
+        player_owned = self.owner[:n] == OWNER_PLAYER
+        left, right, top, bottom = self.bounds(
+            indices, np.where(player_owned, HITBOX_INSET, 0)
+        )
+        wall_inset = np.where(player_owned, WALL_HITBOX_INSET, 0)
+
+        tile = config.TILE_SIZE
+        col0 = np.floor(left / tile).astype(np.int64)
+        row0 = np.floor(top / tile).astype(np.int64)
+        hit = np.zeros(n, dtype=bool)
+        # prostokąt pocisku (do ~113 px po obrocie) obejmuje najwyżej 3x3 kafelki
+        for dc in range(3):
+            col = col0 + dc
+            grid_col = col - first_col
+            for dr in range(3):
+                row = row0 + dr
+                grid_row = row - first_row
+                inside = (
+                    (grid_col >= 0) & (grid_col < cols)
+                    & (grid_row >= 0) & (grid_row < rows)
+                )
+                wall = np.zeros(n, dtype=bool)
+                wall[inside] = grid[grid_row[inside], grid_col[inside]]
+
+                wall_left = col * tile + wall_inset
+                wall_top = row * tile + wall_inset
+                hit |= (
+                    wall
+                    & (left < wall_left + tile - 2 * wall_inset)
+                    & (right > wall_left)
+                    & (top < wall_top + tile - 2 * wall_inset)
+                    & (bottom > wall_top)
+                )
+
+        self.remove(hit)
+
+    def snapshot(self) -> tuple:
+        """Kopie pól potrzebnych do rysowania, niezależne od dalszych ticków"""
+        n = self.count
+        return tuple(getattr(self, name)[:n].copy() for name in DRAW_FIELDS)
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        offset: pygame.math.Vector2,
+        alpha: float = 1.0,
+        snapshot: Optional[tuple] = None,
+    ) -> None:
+        """Narysuj widoczne pociski jednym wywołaniem blits, interpolując między tickami.
+
+        snapshot (z metody snapshot) pozwala rysować, gdy symulacja biegnie dalej.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot()
+        kinds, frames, prev_x, prev_y, x, y, half_w, half_h = snapshot
+        if len(kinds) == 0:
+            return
 
-        self.hitbox.center = self.rect.center
+        width, height = surface.get_size()
+        x = prev_x + (x - prev_x) * alpha
+        y = prev_y + (y - prev_y) * alpha
+        left = x - half_w - offset.x
+        top = y - half_h - offset.y
+        visible = np.flatnonzero(
+            (left < width)
+            & (top < height)
+            & (left + 2 * half_w > 0)
+            & (top + 2 * half_h > 0)
+        )
 
-        if pygame.time.get_ticks() - self.spawn_time > 1000:
-            self.kill()
\ No newline at end of file
+        atlases = self.atlases
+        surface.blits(
+            [
+                (atlases[kind][frame], (x, y))
+                for kind, frame, x, y in zip(
+                    kinds[visible].tolist(),
+                    frames[visible].tolist(),
+                    left[visible].tolist(),
+                    top[visible].tolist(),
+                )
+            ],
+            doreturn=False,
+        )
@@ -3,6 +3,7 @@ import os
 import pygame
 
 import config
+from core.assetCache import asset_cache
 
 
 class Tile(pygame.sprite.Sprite):
@@ -18,18 +19,16 @@ class Tile(pygame.sprite.Sprite):
             if sprite_type == 'wall':
                 try:
                     path = os.path.join('assets', 'wall.png')
-                    original_image = pygame.image.load(path).convert_alpha()
-                    original_image = pygame.transform.scale(
-                        original_image, (config.TILE_SIZE, config.TILE_SIZE)
-                    )
-
-                    self.image = original_image
+                    size = (config.TILE_SIZE, config.TILE_SIZE)
 
                     is_vertical = 'N' in connections or 'S' in connections
                     is_horizontal = 'W' in connections or 'E' in connections
 
+                    transform = ()
                     if is_vertical and not is_horizontal:
-                        self.image = pygame.transform.rotate(original_image, 90)
+                        transform = (('rotate', 90),)
+
+                    self.image = asset_cache.get_image(path, size, transform)
 
                 except Exception as e:
                     print(e)
@@ -0,0 +1,105 @@
+"""Symulacja gry bez okna, dźwięku i prawdziwego wejścia, tak szybko, jak pozwala procesor.
+
+Uruchom: python headless.py [liczba_ticków] [--seed N] [--verbose]
+"""
+import argparse
+import contextlib
+import math
+import os
+import random
+import tempfile
+import time
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+import pygame
+
+import config
+from core.game import Game
+from core.inputSource import InputState, ScriptedInput
+from core.saveManager import SaveManager
+
+MOVE_KEYS = [pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d]
+
+
+def wander_script(tick: int) -> InputState:
+    """Gracz zmienia kierunek co dwie sekundy, strzela bez przerwy i obraca celownik"""
+    rng = random.Random(tick // (2 * config.SIM_TICK_RATE))
+    keys = [rng.choice(MOVE_KEYS)]
+    if rng.random() < 0.3:
+        keys.append(pygame.K_LSHIFT)
+
+    angle = tick * 0.05
+    aim = (
+        int(config.SCREEN_WIDTH // 2 + 200 * math.cos(angle)),
+        int(config.SCREEN_HEIGHT // 2 + 200 * math.sin(angle)),
+    )
+    power_shot = tick % config.SIM_TICK_RATE == 0
+    return keys, (True, False, power_shot), aim
+
+
+def wait_for(game: Game, state: str) -> None:
+    while game.game_state != state:
+        game.update_loading()
+        time.sleep(0.001)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('ticks', type=int, nargs='?', default=3600)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--verbose', action='store_true')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    # symulacja nie może nadpisać ani skasować zapisu gracza
+    SaveManager.SAVE_FILE = os.path.join(
+        tempfile.gettempdir(), 'rotmg_headless_save.json'
+    )
+
+    game = Game(headless=True)
+    game.input_source = ScriptedInput(wander_script)
+    wait_for(game, 'menu')
+    game.start_game(reset=True)
+    wait_for(game, 'game')
+
+    deaths = 0
+    kills = 0
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        if not args.verbose:
+            # komunikaty o obrażeniach spowalniałyby symulację
+            devnull = stack.enter_context(open(os.devnull, 'w'))
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+
+        for _ in range(args.ticks):
+            game.input_source.advance()
+            game.tick()
+            if game.game_state == 'game_over':
+                deaths += 1
+                kills += sum(game.kill_stats.values())
+                game.reset_game()
+                game.game_state = 'game'
+    elapsed = time.perf_counter() - start
+    kills += sum(game.kill_stats.values())
+
+    simulated = args.ticks / config.SIM_TICK_RATE
+    print(f"{args.ticks} ticks ({simulated:.1f} s of game time) in {elapsed:.2f} s")
+    print(
+        f"{args.ticks / elapsed:.0f} ticks/s, "
+        f"{simulated / elapsed:.1f}x real time"
+    )
+    print(
+        f"enemies alive: {len(game.enemy_group)}, "
+        f"projectiles: {len(game.projectiles)}, "
+        f"kills: {kills}, deaths: {deaths}"
+    )
+    for name, stats in game.pool_stats().items():
+        counters = ', '.join(f"{key} {value}" for key, value in stats.items())
+        print(f"pool {name}: {counters}")
+    SaveManager.delete_save()
+
+
+if __name__ == '__main__':
+    main()